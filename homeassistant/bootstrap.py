@@ -98,6 +98,7 @@ from .setup import (
     _setup_started,
     async_get_setup_timings,
     async_notify_setup_error,
+    async_record_setup_phase,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -445,6 +446,8 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
+    # Load the manifest cache before any integration is resolved
+    await loader.async_load_manifest_cache(hass)
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
@@ -485,6 +488,7 @@ async def async_from_config_dict(
         return None
 
     await _async_set_up_integrations(hass, config)
+    loader.async_save_manifest_cache(hass)
 
     stop = monotonic()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
@@ -954,9 +958,10 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
-    domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
-        hass, config
-    )
+    with async_record_setup_phase(hass, "bootstrap", "resolve domains"):
+        domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
+            hass, config
+        )
 
     # Initialize recorder
     if "recorder" in domains_to_setup:
@@ -1002,7 +1007,8 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            with async_record_setup_phase(hass, "bootstrap", name):
+                await async_setup_multi_components(hass, domain_group, config)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -1014,7 +1020,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                with async_record_setup_phase(hass, "bootstrap", "stage 1"):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -1030,7 +1037,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                with async_record_setup_phase(hass, "bootstrap", "stage 2"):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1041,7 +1049,8 @@ async def _async_set_up_integrations(
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+            with async_record_setup_phase(hass, "bootstrap", "wrap up"):
+                await hass.async_block_till_done()
     except TimeoutError:
         _LOGGER.warning(
             "Setup timed out for bootstrap waiting on %s - moving forward",
@@ -3,17 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
-from typing import Any, cast
+from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
-from homeassistant.components.websocket_api import messages
+from homeassistant.components.recorder.models import CompressedStateColumns
+from homeassistant.components.websocket_api import chunked, messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -78,17 +79,15 @@ def _ws_get_significant_states(
     return json_bytes(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
+            history.get_significant_states_columns(
                 hass,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
-                True,
             ),
         )
     )
@@ -104,6 +103,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunk_hours"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -129,8 +129,16 @@ async def ws_get_history_during_period(
     else:
         end_time = None
 
+    chunk_hours: int | None = msg.get("chunk_hours")
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        if chunk_hours:
+            chunked.async_send_empty_chunk(
+                connection,
+                msg["id"],
+                _generate_stream_message({}, start_time, end_time or dt_util.utcnow()),
+            )
+        else:
+            connection.send_result(msg["id"], {})
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -150,12 +158,35 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        if chunk_hours:
+            chunked.async_send_empty_chunk(
+                connection,
+                msg["id"],
+                _generate_stream_message({}, start_time, end_time or dt_util.utcnow()),
+            )
+        else:
+            connection.send_result(msg["id"], {})
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if chunk_hours:
+        await _async_send_history_chunks(
+            hass,
+            connection,
+            msg["id"],
+            start_time,
+            end_time or dt_util.utcnow(),
+            timedelta(hours=chunk_hours),
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -172,8 +203,76 @@ async def ws_get_history_during_period(
     )
 
 
+def _ws_get_significant_states_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    cursor: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> bytes:
+    """Fetch a chunk of history significant_states and convert it to json."""
+    states = history.get_significant_states_columns(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+    return chunked.chunk_message(
+        msg_id, _generate_stream_message(states, start_time, end_time), cursor
+    )
+
+
+async def _async_send_history_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    chunk_duration: timedelta,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Fetch the history one time slice at a time and send each as a chunk."""
+    instance = get_instance(hass)
+
+    async def _async_fetch_chunk(
+        chunk_start_time: dt, chunk_end_time: dt, cursor: dt | None
+    ) -> bytes:
+        """Fetch a chunk in the recorder executor."""
+        return await instance.async_add_executor_job(
+            _ws_get_significant_states_chunk,
+            hass,
+            msg_id,
+            chunk_start_time,
+            chunk_end_time,
+            cursor,
+            entity_ids,
+            # The state at the start time is only needed for the first chunk
+            include_start_time_state and chunk_start_time == start_time,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+
+    await chunked.async_send_chunks(
+        connection, msg_id, start_time, end_time, chunk_duration, _async_fetch_chunk
+    )
+
+
 def _generate_stream_message(
-    states: dict[str, list[dict[str, Any]]],
+    states: Mapping[str, list[dict[str, Any]] | CompressedStateColumns],
     start_day: dt,
     end_day: dt,
 ) -> dict[str, Any]:
@@ -201,7 +300,7 @@ def _generate_websocket_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    states: dict[str, list[dict[str, Any]]],
+    states: Mapping[str, list[dict[str, Any]] | CompressedStateColumns],
 ) -> bytes:
     """Generate a websocket response."""
     return json_bytes(
@@ -224,29 +323,22 @@ def _generate_historical_response(
     send_empty: bool,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
+    states = history.get_significant_states_columns(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
     )
     last_time_ts = 0.0
-    for state_list in states.values():
+    for columns in states.values():
         if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
-            last_time_ts = cast(float, state_last_time)
+            state_last_time := columns.last_updated_ts
+        ) is not None and state_last_time > last_time_ts:
+            last_time_ts = state_last_time
 
     if last_time_ts == 0:
         # If we did not send any states ever, we need to send an empty response
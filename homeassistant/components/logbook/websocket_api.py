@@ -13,7 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance
-from homeassistant.components.websocket_api import messages
+from homeassistant.components.websocket_api import chunked, messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
@@ -452,6 +452,50 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_formatted_get_events_chunk(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    cursor: dt | None,
+    event_processor: EventProcessor,
+) -> bytes:
+    """Fetch a chunk of events and convert them to json in the executor."""
+    events = event_processor.get_events(start_time, end_time)
+    return chunked.chunk_message(
+        msg_id, _generate_stream_message(events, start_time, end_time), cursor
+    )
+
+
+async def _async_send_events_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    chunk_duration: timedelta,
+    event_processor: EventProcessor,
+) -> None:
+    """Fetch the events one time slice at a time and send each as a chunk."""
+    instance = get_instance(hass)
+
+    async def _async_fetch_chunk(
+        chunk_start_time: dt, chunk_end_time: dt, cursor: dt | None
+    ) -> bytes:
+        """Fetch a chunk in the recorder executor."""
+        return await instance.async_add_executor_job(
+            _ws_formatted_get_events_chunk,
+            msg_id,
+            chunk_start_time,
+            chunk_end_time,
+            cursor,
+            event_processor,
+        )
+
+    await chunked.async_send_chunks(
+        connection, msg_id, start_time, end_time, chunk_duration, _async_fetch_chunk
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -460,6 +504,7 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("chunk_hours"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -485,8 +530,16 @@ async def ws_get_events(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
+    chunk_hours: int | None = msg.get("chunk_hours")
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        if chunk_hours:
+            chunked.async_send_empty_chunk(
+                connection,
+                msg["id"],
+                _generate_stream_message([], start_time, end_time),
+            )
+        else:
+            connection.send_result(msg["id"], [])
         return
 
     device_ids = msg.get("device_ids")
@@ -496,7 +549,14 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            if chunk_hours:
+                chunked.async_send_empty_chunk(
+                    connection,
+                    msg["id"],
+                    _generate_stream_message([], start_time, end_time),
+                )
+            else:
+                connection.send_result(msg["id"], [])
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -511,6 +571,18 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if chunk_hours:
+        await _async_send_events_chunks(
+            hass,
+            connection,
+            msg["id"],
+            start_time,
+            end_time,
+            timedelta(hours=chunk_hours),
+            event_processor,
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_formatted_get_events,
@@ -24,7 +24,9 @@ from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.setup import async_get_setup_trace_events
 
 from .const import DOMAIN
 
@@ -40,6 +42,7 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_DUMP_SETUP_TIMELINE = "dump_setup_timeline"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +66,7 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_DUMP_SETUP_TIMELINE,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -94,6 +98,9 @@ async def async_setup_entry(  # noqa: C901
         async with lock:
             await _async_generate_memory_profile(hass, call)
 
+    async def _async_run_dump_setup_timeline(call: ServiceCall) -> None:
+        await _async_dump_setup_timeline(hass, call)
+
     async def _async_start_log_objects(call: ServiceCall) -> None:
         if LOG_INTERVAL_SUB in domain_data:
             raise HomeAssistantError("Object logging already started")
@@ -382,6 +389,13 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_SETUP_TIMELINE,
+        _async_run_dump_setup_timeline,
+    )
+
     return True
 
 
@@ -463,6 +477,33 @@ async def _async_generate_memory_profile(hass: HomeAssistant, call: ServiceCall)
     )
 
 
+async def _async_dump_setup_timeline(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Write the startup timeline as a Chrome trace file."""
+    start_time = int(time.time() * 1000000)
+    timeline_path = hass.config.path(f"setup_timeline.{start_time}.json")
+    trace = {
+        "traceEvents": async_get_setup_trace_events(hass),
+        "displayTimeUnit": "ms",
+    }
+    await hass.async_add_executor_job(
+        _write_setup_timeline, json_bytes(trace), timeline_path
+    )
+    persistent_notification.async_create(
+        hass,
+        (
+            f"Wrote the startup timeline to {timeline_path}. Open it with"
+            " chrome://tracing or https://ui.perfetto.dev to review it."
+        ),
+        title="Startup timeline dumped",
+        notification_id=f"setup_timeline_{start_time}",
+    )
+
+
+def _write_setup_timeline(data: bytes, timeline_path: str) -> None:
+    with open(timeline_path, "wb") as timeline_file:
+        timeline_file.write(data)
+
+
 def _write_profile(profiler, cprofile_path, callgrind_path):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
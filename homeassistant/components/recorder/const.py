@@ -64,6 +64,7 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+STATISTICS_DAILY_SCHEMA_VERSION = 44
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
@@ -84,3 +85,10 @@ class SupportedDialect(StrEnum):
     SQLITE = "sqlite"
     MYSQL = "mysql"
     POSTGRESQL = "postgresql"
+
+
+class PartitionInterval(StrEnum):
+    """Intervals the states and events tables can be partitioned by."""
+
+    DAILY = "daily"
+    WEEKLY = "weekly"
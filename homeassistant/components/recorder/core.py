@@ -49,7 +49,7 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
-from . import migration, statistics
+from . import migration, partitions, statistics
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -66,6 +66,7 @@ from .const import (
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     STATISTICS_ROWS_SCHEMA_VERSION,
+    PartitionInterval,
     SupportedDialect,
 )
 from .db_schema import (
@@ -95,10 +96,12 @@ from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import get_migration_changes
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
+from .table_managers.recent_states import RecentStatesManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
-from .table_managers.states import StatesManager
+from .table_managers.states import PendingStatesRow, StatesManager
 from .table_managers.states_meta import StatesMetaManager
+from .table_managers.statistics_daily import StatisticsDailyManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
     AdjustLRUSizeTask,
@@ -106,7 +109,9 @@ from .tasks import (
     ChangeStatisticsUnitTask,
     ClearStatisticsTask,
     CommitTask,
+    CompileDailyStatisticsTask,
     CompileMissingStatisticsTask,
+    CreatePartitionsTask,
     DatabaseLockTask,
     EntityIDPostMigrationTask,
     EventIdMigrationTask,
@@ -180,6 +185,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        partition_interval: PartitionInterval | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -190,6 +196,7 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.partition_interval = partition_interval
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
@@ -219,14 +226,20 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Write states with executemany inserts instead of flushing
+        # States objects when the dialect can return the inserted
+        # state_ids in the order the rows were passed.
+        self._bulk_insert_states = False
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
+        self.recent_states_manager = RecentStatesManager(self)
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.statistics_daily_manager = StatisticsDailyManager()
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -550,23 +563,32 @@ class Recorder(threading.Thread):
             self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
         else:
             self.queue_task(PerodicCleanupTask())
+        if self.partition_interval:
+            self.queue_task(CreatePartitionsTask())
 
     @callback
     def _async_five_minute_tasks(self, now: datetime) -> None:
         """Run tasks every five minutes."""
         self.queue_task(ADJUST_LRU_SIZE_TASK)
+        if not self.statistics_daily_manager.active:
+            # Rebuild the daily statistics if the time zone was changed
+            self._queue_compile_daily_statistics()
         self.async_periodic_statistics()
 
     def _adjust_lru_size(self) -> None:
         """Trigger the LRU adjustment.
 
-        If the number of entities has increased, increase the size of the LRU
-        cache to avoid thrashing.
+        The LRU caches of the table managers grow or shrink based on the
+        lookups since the last adjustment. The caches keyed by entity never
+        get smaller than twice the number of entities to avoid thrashing.
         """
-        if new_size := self.hass.states.async_entity_ids_count() * 2:
-            self.state_attributes_manager.adjust_lru_size(new_size)
-            self.states_meta_manager.adjust_lru_size(new_size)
-            self.statistics_meta_manager.adjust_lru_size(new_size)
+        entity_size = self.hass.states.async_entity_ids_count() * 2
+        self.state_attributes_manager.adapt_lru_size(entity_size)
+        self.states_meta_manager.adapt_lru_size(entity_size)
+        self.event_data_manager.adapt_lru_size()
+        self.event_type_manager.adapt_lru_size()
+        if entity_size:
+            self.statistics_meta_manager.adjust_lru_size(entity_size)
 
     @callback
     def async_periodic_statistics(self) -> None:
@@ -731,6 +753,7 @@ class Recorder(threading.Thread):
             # Give up if we could not connect
             return
 
+        self._check_partition_support()
         schema_status = migration.validate_db_schema(self.hass, self, self.get_session)
         if schema_status is None:
             # Give up if we could not validate the schema
@@ -786,9 +809,58 @@ class Recorder(threading.Thread):
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
+        self._create_partitions()
+        self._setup_bulk_insert_states()
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
         self._run_event_loop()
 
+    def _check_partition_support(self) -> None:
+        """Ignore the partition interval if the database does not support it.
+
+        Partitioning is only supported with PostgreSQL since MySQL and
+        MariaDB can neither range partition on the float timestamp
+        columns nor have foreign keys on partitioned tables. The tables
+        are converted by the schema migration.
+        """
+        if self.partition_interval and self.dialect_name != SupportedDialect.POSTGRESQL:
+            _LOGGER.warning(
+                "Partitioned tables are only supported with PostgreSQL,"
+                " ignoring the partition interval"
+            )
+            self.partition_interval = None
+
+    def _create_partitions(self) -> None:
+        """Create the partitions of the upcoming intervals.
+
+        If the partitions cannot be created, the rows are purged in
+        batches instead of dropping partitions.
+        """
+        if not (partition_interval := self.partition_interval):
+            return
+        try:
+            with session_scope(session=self.get_session()) as session:
+                partitions.create_partitions(session, partition_interval, time.time())
+        except SQLAlchemyError:
+            _LOGGER.exception(
+                "Error creating partitions, purging states and events in batches"
+            )
+            self.partition_interval = None
+
+    def _setup_bulk_insert_states(self) -> None:
+        """Enable bulk inserts of states if the database supports them.
+
+        Bulk inserts need the state_ids of the inserted rows returned in the
+        order the rows were passed to link the old_state_id of the next
+        state, and are only used once the schema is fully migrated since
+        the rows are built for the current schema.
+        """
+        assert self.engine is not None
+        self._bulk_insert_states = (
+            self.schema_version == SCHEMA_VERSION
+            and self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
+        _LOGGER.debug("Bulk insert of states enabled: %s", self._bulk_insert_states)
+
     def _activate_and_set_db_ready(self) -> None:
         """Activate the table managers or schedule migrations and mark the db as ready."""
         with session_scope(session=self.get_session()) as session:
@@ -1100,7 +1172,11 @@ class Recorder(threading.Thread):
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
+        dbstate: States | PendingStatesRow
+        if self._bulk_insert_states:
+            dbstate = PendingStatesRow(event)
+        else:
+            dbstate = States.from_event(event)
         old_state = event.data["old_state"]
 
         assert self.event_session is not None
@@ -1108,7 +1184,8 @@ class Recorder(threading.Thread):
 
         states_manager = self.states_manager
         if pending_state := states_manager.pop_pending(entity_id):
-            dbstate.old_state = pending_state
+            # The pending state is always the same type as dbstate
+            dbstate.old_state = pending_state  # type: ignore[assignment]
             if old_state:
                 pending_state.last_reported_ts = old_state.last_reported_timestamp
         elif old_state_id := states_manager.pop_committed(entity_id):
@@ -1119,8 +1196,6 @@ class Recorder(threading.Thread):
                 )
         if entity_removed:
             dbstate.state = None
-        else:
-            states_manager.add_pending(entity_id, dbstate)
 
         if states_meta_manager.active:
             dbstate.entity_id = None
@@ -1130,6 +1205,8 @@ class Recorder(threading.Thread):
         ):
             return
 
+        self.recent_states_manager.add(entity_id, event.data["new_state"])
+
         # Map the entity_id to the StatesMeta table
         if pending_states_meta := states_meta_manager.get_pending(entity_id):
             dbstate.states_meta_rel = pending_states_meta
@@ -1172,7 +1249,15 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        # Only states that are written can be the old state of the next one
+        if not entity_removed:
+            states_manager.add_pending(entity_id, dbstate)
+
+        if type(dbstate) is PendingStatesRow:
+            self._event_session_has_pending_writes = True
+            states_manager.add_pending_row(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1212,6 +1297,13 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        states_manager = self.states_manager
+        if states_manager.has_pending_rows():
+            # Flush any new StatesMeta and StateAttributes first
+            # so the rows can reference their ids
+            session.flush()
+            states_manager.insert_pending_rows(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1255,12 +1347,15 @@ class Recorder(threading.Thread):
             self._close_connection()
         move_away_broken_database(dburl_to_path(self.db_url))
         self.recorder_runs_manager.reset()
+        self.statistics_daily_manager.reset()
+        statistics.get_statistics_during_period_cache(self.hass).invalidate()
         self._setup_recorder()
         self._setup_run()
 
     def _close_event_session(self) -> None:
         """Close the event session."""
         self.states_manager.reset()
+        self.recent_states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
@@ -1472,8 +1567,20 @@ class Recorder(threading.Thread):
 
         self._open_event_session()
 
+    def _queue_compile_daily_statistics(self) -> None:
+        """Queue compiling the daily statistics unless a task is already pending.
+
+        A rebuild may take many tasks which would otherwise be queued again
+        every five minutes while the previous ones are still running.
+        """
+        if self.statistics_daily_manager.compile_pending:
+            return
+        self.statistics_daily_manager.compile_pending = True
+        self.queue_task(CompileDailyStatisticsTask())
+
     def _schedule_compile_missing_statistics(self) -> None:
         """Add tasks for missing statistics runs."""
+        self._queue_compile_daily_statistics()
         self.queue_task(CompileMissingStatisticsTask())
 
     def _end_session(self) -> None:
@@ -31,6 +31,7 @@ from ..const import LAST_REPORTED_SCHEMA_VERSION
 from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, States
 from ..filters import Filters
 from ..models import (
+    CompressedStateColumns,
     LazyState,
     datetime_to_timestamp_or_none,
     extract_metadata_ids,
@@ -227,6 +228,91 @@ def get_significant_states_with_session(
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
+    if not (
+        significant_states := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, entity_id_to_metadata_id, start_time_ts = significant_states
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        cast(list[str], entity_ids),
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, CompressedStateColumns]:
+    """Return compressed states changes during UTC period start_time - end_time.
+
+    Works like get_significant_states with the compressed state format,
+    except the minimal states are collected in columns straight from the
+    database cursor, and each entity serializes to the same JSON.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            significant_states := _significant_states_rows(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                stream_rows=True,
+            )
+        ):
+            return {}
+        rows, entity_id_to_metadata_id, start_time_ts = significant_states
+        return _sorted_states_to_columns(
+            rows,
+            start_time_ts,
+            cast(list[str], entity_ids),
+            entity_id_to_metadata_id,
+            minimal_response,
+            no_attributes,
+        )
+
+
+def _significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    stream_rows: bool = False,
+) -> tuple[Iterable[Row], dict[str, int | None], float | None] | None:
+    """Query the significant states rows sorted by metadata_id and last_updated.
+
+    Returns the rows, the metadata ids of the entities and the start time
+    timestamp if the start time states are included, or None if none of
+    the entities are recorded. With stream_rows, the rows of a window longer
+    than a day are fetched from the cursor in batches as they are consumed.
+    """
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
@@ -237,7 +323,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +361,16 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        execute_stmt_lambda_element(
+            session,
+            stmt,
+            start_time if stream_rows else None,
+            end_time,
+            orm_rows=False,
+        ),
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
@@ -814,3 +902,83 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    no_attributes: bool,
+) -> dict[str, CompressedStateColumns]:
+    """Convert SQL results into compressed state columns.
+
+    Works like _sorted_states_to_dict with the compressed state format,
+    but the states after the first one of a minimal response are appended
+    to the state and last_updated columns instead of creating a dict each.
+
+    States must be sorted by entity_id and last_updated
+    """
+    field_map = _FIELD_MAP
+    # Set all entity IDs to empty columns in result set to maintain the order
+    result: dict[str, CompressedStateColumns] = {
+        entity_id: CompressedStateColumns() for entity_id in entity_ids
+    }
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+    # Share one string object per distinct state across all rows
+    interned_states: dict[str | None, str | None] = {}
+
+    for metadata_id, group in groupby(states, itemgetter(field_map["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        attr_cache: dict[str, dict[str, Any]] = {}
+        columns = result[entity_id]
+        if (
+            not minimal_response
+            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+        ):
+            columns.compressed_states.extend(
+                row_to_compressed_state(
+                    db_state,
+                    attr_cache,
+                    start_time_ts,
+                    entity_id,
+                    db_state[state_idx],
+                    db_state[last_updated_ts_idx],
+                    False,
+                )
+                for db_state in group
+            )
+            continue
+
+        if (first_state := next(group, None)) is None:
+            continue
+        prev_state: str | None = first_state[state_idx]
+        columns.compressed_states.append(
+            row_to_compressed_state(
+                first_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                prev_state,  # type: ignore[arg-type]
+                first_state[last_updated_ts_idx],
+                no_attributes,
+            )
+        )
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        states_column = columns.states
+        last_updated_column = columns.last_updated
+        for row in group:
+            if (state := row[state_idx]) == prev_state:
+                continue
+            prev_state = state
+            states_column.append(interned_states.setdefault(state, state))
+            last_updated_column.append(row[last_updated_ts_idx])
+
+    # Filter out the empty columns if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
@@ -24,7 +24,7 @@ from sqlalchemy.exc import (
     SQLAlchemyError,
 )
 from sqlalchemy.orm.session import Session
-from sqlalchemy.schema import AddConstraint, DropConstraint
+from sqlalchemy.schema import AddConstraint, CreateIndex, DropConstraint
 from sqlalchemy.sql.expression import true
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
@@ -52,6 +52,7 @@ from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    PartitionInterval,
     SupportedDialect,
 )
 from .db_schema import (
@@ -72,12 +73,21 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
 from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
+from .partitions import (
+    PARTITION_INTERVAL_SECONDS,
+    PARTITIONED_TABLES,
+    default_partition_name,
+    is_partitioned,
+    legacy_partition_name,
+    partition_start,
+)
 from .queries import (
     batch_cleanup_entity_ids,
     delete_duplicate_short_term_statistics_row,
@@ -119,8 +129,11 @@ if TYPE_CHECKING:
     from . import Recorder
 
 LIVE_MIGRATION_MIN_SCHEMA_VERSION = 0
+
 _EMPTY_ENTITY_ID = "missing.entity_id"
 _EMPTY_EVENT_TYPE = "missing_event_type"
+# Schema errors of the tables that still have to be partitioned
+_PARTITION_SCHEMA_ERRORS = {f"{table}.partitioned" for table in PARTITIONED_TABLES}
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -222,6 +235,9 @@ def validate_db_schema(
         # columns may otherwise not exist etc.
         schema_errors = _find_schema_errors(hass, instance, session_maker)
 
+    # The tables can be converted after upgrading from any schema version
+    schema_errors |= _find_partition_schema_errors(instance, session_maker)
+
     valid = is_current and not schema_errors
 
     return SchemaValidationStatus(current_version, schema_errors, valid)
@@ -238,9 +254,29 @@ def _find_schema_errors(
     return schema_errors
 
 
+def _find_partition_schema_errors(
+    instance: Recorder, session_maker: Callable[[], Session]
+) -> set[str]:
+    """Find the tables that still have to be converted to partitioned tables."""
+    if not instance.partition_interval:
+        return set()
+    with session_scope(session=session_maker(), read_only=True) as session:
+        return {
+            f"{table}.partitioned"
+            for table in PARTITIONED_TABLES
+            if not is_partitioned(session, table)
+        }
+
+
 def live_migration(schema_status: SchemaValidationStatus) -> bool:
-    """Check if live migration is possible."""
-    return schema_status.current_version >= LIVE_MIGRATION_MIN_SCHEMA_VERSION
+    """Check if live migration is possible.
+
+    Converting the tables to partitioned tables locks them while the
+    existing rows are checked, so it is never done live.
+    """
+    return schema_status.current_version >= LIVE_MIGRATION_MIN_SCHEMA_VERSION and not (
+        schema_status.schema_errors & _PARTITION_SCHEMA_ERRORS
+    )
 
 
 def migrate_schema(
@@ -287,6 +323,13 @@ def migrate_schema(
         statistics_correct_db_schema(instance, schema_errors)
         states_correct_db_schema(instance, schema_errors)
         events_correct_db_schema(instance, schema_errors)
+        if (
+            schema_errors & _PARTITION_SCHEMA_ERRORS
+            and instance.partition_interval
+            and not migrate_to_partitioned_tables(instance, instance.partition_interval)
+        ):
+            # Keep recording to the unpartitioned tables
+            instance.partition_interval = None
 
     if current_version != SCHEMA_VERSION:
         instance.queue_task(PostSchemaMigrationTask(current_version, SCHEMA_VERSION))
@@ -1089,6 +1132,10 @@ def _apply_update(  # noqa: C901
             "states",
             [f"last_reported_ts {_column_types.timestamp_type}"],
         )
+    elif new_version == 44:
+        # The daily statistics are compiled from the hourly statistics
+        # by the recorder once the table exists
+        cast(Table, StatisticsDaily.__table__).create(engine, checkfirst=True)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -1751,6 +1798,124 @@ def cleanup_legacy_states_event_ids(instance: Recorder) -> bool:
     return True
 
 
+def migrate_to_partitioned_tables(
+    instance: Recorder, interval: PartitionInterval
+) -> bool:
+    """Convert the states and events tables to range partitioned tables.
+
+    The existing table becomes the first partition and holds all rows up
+    to the end of the current interval so no rows have to be copied. The
+    partition is dropped by the purge once all its rows are expired.
+
+    This runs as a non-live schema migration. Each table is converted in
+    its own transaction, so a conversion interrupted by a restart
+    continues with the remaining tables on the next start.
+
+    Returns False if the tables could not be converted.
+    """
+    session_maker = instance.get_session
+    assert instance.engine is not None, "engine should never be None"
+    with session_scope(session=session_maker(), read_only=True) as session:
+        tables = [
+            table for table in PARTITIONED_TABLES if not is_partitioned(session, table)
+        ]
+    if not tables:
+        return True
+
+    _LOGGER.warning(
+        "Converting the %s tables to partitioned tables; "
+        "this may take a while, please be patient",
+        ", ".join(tables),
+    )
+    # A foreign key must reference the whole primary key of a partitioned
+    # table, which includes the timestamp, so the self reference of
+    # old_state_id cannot be kept. The legacy event_id reference would
+    # follow the events table when it becomes a partition.
+    _drop_foreign_key_constraints(
+        session_maker, instance.engine, TABLE_STATES, ["old_state_id"]
+    )
+    _drop_foreign_key_constraints(
+        session_maker, instance.engine, TABLE_STATES, ["event_id"]
+    )
+    for table in tables:
+        try:
+            with session_scope(session=session_maker()) as session:
+                _partition_table(session, table, interval)
+        except SQLAlchemyError:
+            _LOGGER.exception("Could not convert the %s table to partitions", table)
+            return False
+    return True
+
+
+def _partition_table(session: Session, table: str, interval: PartitionInterval) -> None:
+    """Convert a table to a range partitioned table in a single transaction."""
+    connection = session.connection()
+    model = Base.metadata.tables[table]
+    column = PARTITIONED_TABLES[table]
+    primary_key = model.primary_key.columns.values()[0].name
+    legacy = legacy_partition_name(table)
+    sequence = f"{table}_{primary_key}_partition_seq"
+    max_id, max_timestamp = connection.execute(
+        text(f"SELECT MAX({primary_key}), MAX({column}) FROM {table}")  # noqa: S608
+    ).one()
+    # The legacy partition holds all existing rows
+    boundary = (
+        partition_start(interval, max(time(), max_timestamp or 0))
+        + PARTITION_INTERVAL_SECONDS[interval]
+    )
+    index_names = (
+        connection.execute(
+            text(
+                "SELECT indexname FROM pg_indexes"
+                " WHERE schemaname = current_schema() AND tablename = :table"
+            ),
+            {"table": table},
+        )
+        .scalars()
+        .all()
+    )
+    for statement in (
+        f"ALTER TABLE {table} RENAME TO {legacy}",
+        # Free the index names for the indexes of the partitioned table
+        *(f"ALTER INDEX {name} RENAME TO {name}_legacy" for name in index_names),
+        # Rows without a timestamp would never be purged and cannot be
+        # in a range partition
+        f"UPDATE {legacy} SET {column} = 0 WHERE {column} IS NULL",  # noqa: S608
+        f"ALTER TABLE {legacy} ALTER COLUMN {column} SET NOT NULL",
+        # Identity columns are not supported on partitioned tables
+        # before PostgreSQL 17 so the ids come from a sequence
+        f"ALTER TABLE {legacy} ALTER COLUMN {primary_key} DROP IDENTITY IF EXISTS",
+        f"ALTER TABLE {legacy} ALTER COLUMN {primary_key} DROP DEFAULT",
+        f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS)"
+        f" PARTITION BY RANGE ({column})",
+        f"ALTER TABLE {table} ADD PRIMARY KEY ({primary_key}, {column})",
+        f"CREATE SEQUENCE {sequence} OWNED BY {table}.{primary_key}",
+        f"SELECT setval('{sequence}', {(max_id or 0) + 1}, false)",
+        f"ALTER TABLE {table} ALTER COLUMN {primary_key}"
+        f" SET DEFAULT nextval('{sequence}')",
+    ):
+        connection.execute(text(statement))
+    # Create the indexes and foreign keys before attaching the legacy
+    # partition so its existing ones are attached instead of rebuilt
+    for index in model.indexes:
+        connection.execute(CreateIndex(index))  # type: ignore[no-untyped-call]
+    for foreign_key in model.foreign_key_constraints:
+        if foreign_key.referred_table is not model:
+            connection.execute(AddConstraint(foreign_key))  # type: ignore[no-untyped-call]
+    connection.execute(
+        text(
+            f"ALTER TABLE {table} ATTACH PARTITION {legacy}"
+            f" FOR VALUES FROM (MINVALUE) TO ({boundary:.0f})"
+        )
+    )
+    connection.execute(
+        text(
+            f"CREATE TABLE {default_partition_name(table)}"
+            f" PARTITION OF {table} DEFAULT"
+        )
+    )
+
+
 def _initialize_database(session: Session) -> bool:
     """Initialize a new database.
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from functools import cached_property
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.engine.row import Row
 
@@ -16,6 +16,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_STATE,
 )
 from homeassistant.core import Context, State
+from homeassistant.helpers.json import json_bytes, json_fragment
 import homeassistant.util.dt as dt_util
 
 from .state_attributes import decode_attributes_from_source
@@ -141,3 +142,74 @@ def row_to_compressed_state(
     ):
         comp_state[COMPRESSED_STATE_LAST_CHANGED] = row_last_changed_ts
     return comp_state
+
+
+_MINIMAL_STATE_PREFIX = f'{{"{COMPRESSED_STATE_STATE}":'.encode()
+_MINIMAL_STATE_LAST_UPDATED = f',"{COMPRESSED_STATE_LAST_UPDATED}":'.encode()
+
+
+class CompressedStateColumns:
+    """Compressed states of an entity with the minimal states kept in columns.
+
+    The leading states are full compressed state dicts. The minimal states
+    that follow only have a state and a last_updated timestamp, and are
+    kept in two parallel lists with the state strings interned, so a long
+    history does not need a dict per state and is serialized straight to
+    the compressed state JSON format.
+    """
+
+    __slots__ = ("compressed_states", "states", "last_updated")
+
+    def __init__(self, compressed_states: list[dict[str, Any]] | None = None) -> None:
+        """Initialize the columns."""
+        self.compressed_states = compressed_states or []
+        self.states: list[str | None] = []
+        self.last_updated: list[float] = []
+
+    def __len__(self) -> int:
+        """Return the number of states."""
+        return len(self.compressed_states) + len(self.states)
+
+    @property
+    def last_updated_ts(self) -> float | None:
+        """Return the last_updated timestamp of the newest state."""
+        if self.last_updated:
+            return self.last_updated[-1]
+        if self.compressed_states:
+            return cast(
+                float, self.compressed_states[-1][COMPRESSED_STATE_LAST_UPDATED]
+            )
+        return None
+
+    def as_compressed_states(self) -> list[dict[str, Any]]:
+        """Return the states as a list of compressed state dicts."""
+        return [
+            *self.compressed_states,
+            *(
+                {COMPRESSED_STATE_STATE: state, COMPRESSED_STATE_LAST_UPDATED: ts}
+                for state, ts in zip(self.states, self.last_updated, strict=True)
+            ),
+        ]
+
+    @property
+    def json_fragment(self) -> json_fragment:
+        """Return the states serialized as a JSON list of compressed states."""
+        parts: list[bytes] = []
+        if self.compressed_states:
+            parts.append(json_bytes(self.compressed_states)[1:-1])
+        if states := self.states:
+            # Interleave the encoded state prefixes, timestamps and closing
+            # braces so the rows are joined in one go. Floats never contain
+            # a comma, so the timestamps are encoded in one call and split.
+            prefixes = {
+                state: _MINIMAL_STATE_PREFIX
+                + json_bytes(state)
+                + _MINIMAL_STATE_LAST_UPDATED
+                for state in set(states)
+            }
+            pieces = [b"},"] * (3 * len(states))
+            pieces[0::3] = map(prefixes.__getitem__, states)
+            pieces[1::3] = json_bytes(self.last_updated)[1:-1].split(b",")
+            pieces[-1] = b"}"
+            parts.append(b"".join(pieces))
+        return json_fragment(b"[" + b",".join(parts) + b"]")
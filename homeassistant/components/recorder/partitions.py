@@ -0,0 +1,230 @@
+"""Time partitioned states and events tables for PostgreSQL.
+
+When a partition interval is configured the states and events tables
+are range partitioned on their timestamp columns so the purge can drop
+whole partitions instead of deleting the rows in batches.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import re
+from typing import Final
+
+from sqlalchemy import text
+from sqlalchemy.orm.session import Session
+
+import homeassistant.util.dt as dt_util
+
+from .const import PartitionInterval
+from .db_schema import TABLE_EVENTS, TABLE_STATES
+
+_LOGGER = logging.getLogger(__name__)
+
+# The column each table is partitioned on
+PARTITIONED_TABLES: Final = {
+    TABLE_STATES: "last_updated_ts",
+    TABLE_EVENTS: "time_fired_ts",
+}
+# The column of the shared rows each table references that
+# may be unused once the partition is dropped
+_PARTITION_SHARED_ID_COLUMNS: Final = {
+    TABLE_STATES: "attributes_id",
+    TABLE_EVENTS: "data_id",
+}
+
+PARTITION_INTERVAL_SECONDS: Final = {
+    PartitionInterval.DAILY: 86400,
+    PartitionInterval.WEEKLY: 7 * 86400,
+}
+# Weekly partitions start on Monday, 1970-01-05 is the first
+# Monday after the epoch
+_WEEKLY_PARTITION_OFFSET = 4 * 86400
+
+# Number of partitions created ahead of the current one so
+# rows keep landing in a partition if the nightly maintenance
+# does not run for a while
+PARTITIONS_AHEAD = 3
+
+_UPPER_BOUND_RE = re.compile(r"TO \('?([^')]+)'?\)")
+
+
+@dataclass(slots=True, frozen=True)
+class Partition:
+    """A partition of a partitioned table."""
+
+    name: str
+    # None for the default partition
+    upper_bound: float | None
+
+
+def partition_start(interval: PartitionInterval, timestamp: float) -> float:
+    """Return the start of the partition interval the timestamp is in."""
+    offset = _WEEKLY_PARTITION_OFFSET if interval is PartitionInterval.WEEKLY else 0
+    return timestamp - (timestamp - offset) % PARTITION_INTERVAL_SECONDS[interval]
+
+
+def partition_name(table: str, start: float) -> str:
+    """Return the name of the partition of a table starting at start."""
+    return f"{table}_p{dt_util.utc_from_timestamp(start):%Y%m%d}"
+
+
+def legacy_partition_name(table: str) -> str:
+    """Return the name of the partition that holds the unpartitioned rows."""
+    return f"{table}_legacy"
+
+
+def default_partition_name(table: str) -> str:
+    """Return the name of the partition for rows outside all other partitions."""
+    return f"{table}_default"
+
+
+def is_partitioned(session: Session, table: str) -> bool:
+    """Return if a table is a partitioned table."""
+    return bool(
+        session.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table"
+                " WHERE partrelid = to_regclass(:table))"
+            ),
+            {"table": table},
+        ).scalar()
+    )
+
+
+def _parse_upper_bound(bound: str) -> float | None:
+    """Return the upper bound of a partition bound expression.
+
+    PostgreSQL renders the bound of range partitions as
+    FOR VALUES FROM ('1') TO ('2') and the one of the default
+    partition as DEFAULT.
+    """
+    if not (match := _UPPER_BOUND_RE.search(bound)):
+        return None
+    try:
+        return float(match.group(1))
+    except ValueError:
+        # MAXVALUE
+        return None
+
+
+def get_partitions(session: Session, table: str) -> list[Partition]:
+    """Return the partitions of a table."""
+    return [
+        Partition(name, _parse_upper_bound(bound))
+        for name, bound in session.execute(
+            text(
+                "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)"
+                " FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid"
+                " WHERE i.inhparent = to_regclass(:table)"
+            ),
+            {"table": table},
+        ).all()
+    ]
+
+
+def create_partitions(
+    session: Session, interval: PartitionInterval, timestamp: float
+) -> None:
+    """Create the partitions up to PARTITIONS_AHEAD intervals after timestamp.
+
+    Partitions are only created after the last existing one. Rows that
+    do not fit in any partition, for example after the clock jumped or
+    when the nightly maintenance did not run for a while, end up in the
+    default partition and are moved to the partition created for them.
+    """
+    current_start = partition_start(interval, timestamp)
+    end = current_start + PARTITION_INTERVAL_SECONDS[interval] * (PARTITIONS_AHEAD + 1)
+    for table, column in PARTITIONED_TABLES.items():
+        existing = get_partitions(session, table)
+        default = default_partition_name(table)
+        has_default = any(partition.name == default for partition in existing)
+        start = max(
+            (
+                partition.upper_bound
+                for partition in existing
+                if partition.upper_bound is not None
+            ),
+            default=current_start,
+        )
+        start = max(start, current_start)
+        while start < end:
+            # Align to the interval in case it was changed
+            stop = (
+                partition_start(interval, start) + PARTITION_INTERVAL_SECONDS[interval]
+            )
+            name = partition_name(table, start)
+            bounds = f"{column} >= {start:.0f} AND {column} < {stop:.0f}"
+            create = (
+                f"CREATE TABLE {name} PARTITION OF {table}"
+                f" FOR VALUES FROM ({start:.0f}) TO ({stop:.0f})"
+            )
+            if has_default and session.execute(
+                text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {bounds})")  # noqa: S608
+            ).scalar():
+                # PostgreSQL refuses to create a partition for rows that
+                # are in the default partition
+                _LOGGER.warning("Moving the rows of partition %s from %s", name, default)
+                for statement in (
+                    f"ALTER TABLE {table} DETACH PARTITION {default}",
+                    create,
+                    f"INSERT INTO {name} SELECT * FROM {default} WHERE {bounds}",  # noqa: S608
+                    f"DELETE FROM {default} WHERE {bounds}",  # noqa: S608
+                    f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT",
+                ):
+                    session.execute(text(statement))
+            else:
+                _LOGGER.debug("Creating partition %s of %s", name, table)
+                session.execute(text(create))
+            start = stop
+
+
+def drop_expired_partitions(
+    session: Session, purge_before: float, committed_state_ids: set[int]
+) -> tuple[dict[str, set[int]], set[int]]:
+    """Drop the partitions that only hold rows older than purge_before.
+
+    Returns the attributes_ids and data_ids referenced by the dropped
+    states and events keyed by table, the caller must purge the ones
+    that are no longer used. Also returns which of committed_state_ids
+    were dropped, the caller must evict them from the states manager.
+    """
+    shared_ids: dict[str, set[int]] = {}
+    dropped_state_ids: set[int] = set()
+    for table, shared_id_column in _PARTITION_SHARED_ID_COLUMNS.items():
+        table_shared_ids = shared_ids[table] = set()
+        for partition in get_partitions(session, table):
+            if partition.upper_bound is None or partition.upper_bound > purge_before:
+                continue
+            name = partition.name
+            table_shared_ids.update(
+                session.execute(
+                    text(
+                        f"SELECT DISTINCT {shared_id_column} FROM {name}"  # noqa: S608
+                        f" WHERE {shared_id_column} IS NOT NULL"
+                    )
+                ).scalars()
+            )
+            if table == TABLE_STATES:
+                if committed_state_ids:
+                    dropped_state_ids.update(
+                        session.execute(
+                            text(
+                                f"SELECT state_id FROM {name}"  # noqa: S608
+                                " WHERE state_id = ANY(:state_ids)"
+                            ),
+                            {"state_ids": list(committed_state_ids)},
+                        ).scalars()
+                    )
+                # There is no foreign key on old_state_id since it
+                # cannot reference a partitioned table
+                session.execute(
+                    text(
+                        f"UPDATE {TABLE_STATES} SET old_state_id = NULL"  # noqa: S608
+                        f" WHERE old_state_id IN (SELECT state_id FROM {name})"
+                    )
+                )
+            _LOGGER.debug("Dropping partition %s of %s", name, table)
+            session.execute(text(f"DROP TABLE {name}"))
+    return shared_ids, dropped_state_ids
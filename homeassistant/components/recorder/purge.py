@@ -13,13 +13,12 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
-from .db_schema import Events, States, StatesMeta
+from .db_schema import TABLE_EVENTS, TABLE_STATES, Events, States, StatesMeta
 from .models import DatabaseEngine
+from .partitions import drop_expired_partitions
 from .queries import (
     attributes_ids_exist_in_states,
-    attributes_ids_exist_in_states_with_fast_in_distinct,
     data_ids_exist_in_events,
-    data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
     delete_event_rows,
     delete_event_types_rows,
@@ -40,6 +39,8 @@ from .queries import (
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
+    find_unused_attributes_ids,
+    find_unused_data_ids,
 )
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
@@ -86,6 +87,8 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
+            if instance.partition_interval:
+                _purge_expired_partitions(instance, session, purge_before)
             has_more_to_purge |= _purge_states_and_attributes_ids(
                 instance, session, states_batch_size, purge_before
             )
@@ -173,6 +176,25 @@ def _purge_legacy_format(
     )
 
 
+def _purge_expired_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> None:
+    """Drop the states and events partitions that are fully expired.
+
+    The rows of the partition that is only partially expired are
+    purged in batches afterwards.
+    """
+    states_manager = instance.states_manager
+    shared_ids, dropped_state_ids = drop_expired_partitions(
+        session, purge_before.timestamp(), states_manager.committed_state_ids()
+    )
+    # Evict the dropped states from the old states cache like
+    # _purge_state_ids does for deleted rows
+    states_manager.evict_purged_state_ids(dropped_state_ids)
+    _purge_unused_attributes_ids(instance, session, shared_ids[TABLE_STATES])
+    _purge_unused_data_ids(instance, session, shared_ids[TABLE_EVENTS])
+
+
 def _purge_states_and_attributes_ids(
     instance: Recorder,
     session: Session,
@@ -293,36 +315,31 @@ def _select_unused_attributes_ids(
     if not attributes_ids:
         return set()
 
-    seen_ids: set[int] = set()
     if not database_engine.optimizer.slow_range_in_select:
         #
-        # SQLite has a superior query optimizer for the distinct query below as it uses
-        # the covering index without having to examine the rows directly for both of the
-        # queries below.
-        #
-        # We use the distinct query for SQLite since the query in the other branch can
-        # generate more than 500 unions which SQLite does not support.
+        # Each attributes_id is checked with a single probe of the
+        # ix_states_attributes_id index that stops at the first state using
+        # it, so finding the unused ones scales with the number of candidates
+        # collected from the purged states and not with the size of the table.
         #
-        # How MariaDB's query optimizer handles this query:
-        # > explain select distinct attributes_id from states where attributes_id in
-        #   (136723);
-        # ...Using index
+        # We used to select the distinct attributes_id of the states using the
+        # candidates instead, which has to walk all their index entries. Since
+        # attributes are shared by many states when they rarely change, that
+        # took most of the purge time on large databases.
         #
+        to_remove: set[int] = set()
         for attributes_ids_chunk in chunked_or_all(
             attributes_ids, instance.max_bind_vars
         ):
-            seen_ids.update(
-                state[0]
-                for state in session.execute(
-                    attributes_ids_exist_in_states_with_fast_in_distinct(
-                        attributes_ids_chunk
-                    )
-                ).all()
+            to_remove.update(
+                session.execute(
+                    find_unused_attributes_ids(attributes_ids_chunk)
+                ).scalars()
             )
     else:
         #
-        # This branch is for DBMS that cannot optimize the distinct query well and has
-        # to examine all the rows that match.
+        # This branch is for DBMS that cannot optimize a range in a select well
+        # and would have to examine all the rows that match.
         #
         # This branch uses a union of simple queries, as each query is optimized away
         # as the answer to the query can be found in the index.
@@ -344,6 +361,7 @@ def _select_unused_attributes_ids(
         # We now break the query into groups of 100 and use a lambda_stmt to ensure
         # that the query is only cached once.
         #
+        seen_ids: set[int] = set()
         groups = [iter(attributes_ids)] * 100
         for attr_ids in zip_longest(*groups, fillvalue=None):
             seen_ids |= {
@@ -353,7 +371,7 @@ def _select_unused_attributes_ids(
                 ).all()
                 if attrs_id[0] is not None
             }
-    to_remove = attributes_ids - seen_ids
+        to_remove = attributes_ids - seen_ids
     _LOGGER.debug(
         "Selected %s shared attributes to remove",
         len(to_remove),
@@ -385,18 +403,16 @@ def _select_unused_event_data_ids(
     if not data_ids:
         return set()
 
-    seen_ids: set[int] = set()
     # See _select_unused_attributes_ids for why this function
     # branches for non-sqlite databases.
     if not database_engine.optimizer.slow_range_in_select:
+        to_remove: set[int] = set()
         for data_ids_chunk in chunked_or_all(data_ids, instance.max_bind_vars):
-            seen_ids.update(
-                state[0]
-                for state in session.execute(
-                    data_ids_exist_in_events_with_fast_in_distinct(data_ids_chunk)
-                ).all()
+            to_remove.update(
+                session.execute(find_unused_data_ids(data_ids_chunk)).scalars()
             )
     else:
+        seen_ids: set[int] = set()
         groups = [iter(data_ids)] * 100
         for data_ids_group in zip_longest(*groups, fillvalue=None):
             seen_ids |= {
@@ -406,7 +422,7 @@ def _select_unused_event_data_ids(
                 ).all()
                 if data_id[0] is not None
             }
-    to_remove = data_ids - seen_ids
+        to_remove = data_ids - seen_ids
     _LOGGER.debug("Selected %s shared event data to remove", len(to_remove))
     return to_remove
 
@@ -81,13 +81,16 @@ def _state_attrs_exist(attr: int | None) -> Select:
     return select(func.min(States.attributes_id)).where(States.attributes_id == attr)
 
 
-def attributes_ids_exist_in_states_with_fast_in_distinct(
+def find_unused_attributes_ids(
     attributes_ids: Iterable[int],
 ) -> StatementLambdaElement:
-    """Find attributes ids that exist in the states table."""
+    """Find attributes ids that are not used by any states."""
     return lambda_stmt(
-        lambda: select(distinct(States.attributes_id)).filter(
-            States.attributes_id.in_(attributes_ids)
+        lambda: select(StateAttributes.attributes_id).where(
+            StateAttributes.attributes_id.in_(attributes_ids),
+            ~select(States.state_id)
+            .where(States.attributes_id == StateAttributes.attributes_id)
+            .exists(),
         )
     )
 
@@ -304,12 +307,17 @@ def attributes_ids_exist_in_states(
     )
 
 
-def data_ids_exist_in_events_with_fast_in_distinct(
+def find_unused_data_ids(
     data_ids: Iterable[int],
 ) -> StatementLambdaElement:
-    """Find data ids that exist in the events table."""
+    """Find event data ids that are not used by any events."""
     return lambda_stmt(
-        lambda: select(distinct(Events.data_id)).filter(Events.data_id.in_(data_ids))
+        lambda: select(EventData.data_id).where(
+            EventData.data_id.in_(data_ids),
+            ~select(Events.event_id)
+            .where(Events.data_id == EventData.data_id)
+            .exists(),
+        )
     )
 
 
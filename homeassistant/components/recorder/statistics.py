@@ -2,20 +2,35 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
 import dataclasses
-from datetime import datetime, timedelta
+from datetime import datetime, time as dt_time, timedelta, tzinfo
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
-from operator import itemgetter
+from operator import attrgetter, itemgetter, mul
 import re
+import threading
+import time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    Select,
+    and_,
+    bindparam,
+    delete,
+    event,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
@@ -53,12 +68,14 @@ from .const import (
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
+    STATISTICS_DAILY_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -149,6 +166,25 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_DURING_PERIOD_CACHE = "recorder_statistics_during_period_cache"
+
+# The number of statistics_during_period results cached and
+# the size of the serialized results they may use together
+STATISTICS_DURING_PERIOD_CACHE_SIZE = 256
+STATISTICS_DURING_PERIOD_CACHE_BYTES = 16 * 1024 * 1024
+
+# The start and end of the statistics returned for days, weeks and months
+# are aligned to the period, the range of a cached result is widened by
+# this to cover the aligned start and end time
+_PERIOD_ALIGN_SECONDS: dict[str, float] = {
+    "hour": 0,
+    "day": 2 * 86400,
+    "week": 8 * 86400,
+    "month": 32 * 86400,
+}
+
+# The number of days compiled at once when the daily statistics are rebuilt
+COMPILE_DAILY_STATISTICS_MAX_DAYS = 30
 
 
 def mean(values: list[float]) -> float | None:
@@ -192,6 +228,150 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True, frozen=True)
+class StatisticsDuringPeriodKey:
+    """Key of a cached statistics_during_period result."""
+
+    statistic_ids: frozenset[str]
+    period: Literal["5minute", "day", "hour", "week", "month"]
+    start_ts: float
+    end_ts: float | None
+    units: frozenset[tuple[str, str]]
+    types: frozenset[str]
+    # The results depend on the time zone the periods are aligned in
+    # and on the units of the states the statistics are converted to
+    time_zone: tzinfo
+    state_units: tuple[str | None, ...]
+
+    def overlaps(
+        self, statistic_ids: Collection[str] | None, start_ts: float, end_ts: float
+    ) -> bool:
+        """Return if the result depends on the statistics in start_ts - end_ts."""
+        if statistic_ids is not None and self.statistic_ids.isdisjoint(statistic_ids):
+            return False
+        margin = _PERIOD_ALIGN_SECONDS[self.period]
+        # The change is calculated from the sum before the start time
+        if "change" not in self.types and end_ts <= self.start_ts - margin:
+            return False
+        return self.end_ts is None or start_ts < self.end_ts + margin
+
+
+class StatisticsDuringPeriodCache:
+    """Cache for serialized statistics_during_period results.
+
+    Results are looked up and stored from the executor, and invalidated
+    from the recorder thread after the statistics they depend on were
+    committed. A result that was queried while the cache was invalidated
+    is not stored since it may have been read before the commit.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._results: OrderedDict[StatisticsDuringPeriodKey, bytes] = OrderedDict()
+        self._bytes = 0
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def key(
+        self,
+        hass: HomeAssistant,
+        start_time: datetime,
+        end_time: datetime | None,
+        statistic_ids: set[str] | None,
+        period: Literal["5minute", "day", "hour", "week", "month"],
+        units: dict[str, str] | None,
+        types: set[
+            Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]
+        ],
+    ) -> StatisticsDuringPeriodKey | None:
+        """Return the key of a result, or None if it can't be cached.
+
+        Results of all statistics are not cached, neither are 5-minute
+        statistics since they are purged.
+        """
+        if not statistic_ids or period not in _PERIOD_ALIGN_SECONDS:
+            return None
+        sorted_statistic_ids = sorted(statistic_ids)
+        get_state = hass.states.get
+        return StatisticsDuringPeriodKey(
+            frozenset(sorted_statistic_ids),
+            period,
+            start_time.timestamp(),
+            end_time.timestamp() if end_time is not None else None,
+            frozenset(units.items()) if units else frozenset(),
+            frozenset(types),
+            dt_util.get_default_time_zone(),
+            tuple(
+                state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                if (state := get_state(statistic_id))
+                else None
+                for statistic_id in sorted_statistic_ids
+            ),
+        )
+
+    def get(self, key: StatisticsDuringPeriodKey) -> bytes | None:
+        """Return a cached result."""
+        with self._lock:
+            if (result := self._results.get(key)) is None:
+                self.misses += 1
+                return None
+            self._results.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def set(
+        self, key: StatisticsDuringPeriodKey, generation: int, result: bytes
+    ) -> None:
+        """Cache a result queried when the cache was at generation."""
+        if len(result) > STATISTICS_DURING_PERIOD_CACHE_BYTES // 4:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            if (old_result := self._results.pop(key, None)) is not None:
+                self._bytes -= len(old_result)
+            self._results[key] = result
+            self._bytes += len(result)
+            while (
+                len(self._results) > STATISTICS_DURING_PERIOD_CACHE_SIZE
+                or self._bytes > STATISTICS_DURING_PERIOD_CACHE_BYTES
+            ):
+                self._bytes -= len(self._results.popitem(last=False)[1])
+
+    def invalidate(
+        self,
+        statistic_ids: Collection[str] | None = None,
+        start_ts: float = float("-inf"),
+        end_ts: float = float("inf"),
+    ) -> None:
+        """Drop the results that depend on the statistics in start_ts - end_ts.
+
+        All statistics are matched if statistic_ids is None.
+        """
+        with self._lock:
+            self.generation += 1
+            for key in [
+                key
+                for key in self._results
+                if key.overlaps(statistic_ids, start_ts, end_ts)
+            ]:
+                self._bytes -= len(self._results.pop(key))
+                self.invalidations += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return the size and the counters of the cache."""
+        return {
+            "size": len(self._results),
+            "max_size": STATISTICS_DURING_PERIOD_CACHE_SIZE,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -239,13 +419,12 @@ def get_display_unit(
     return state_unit
 
 
-def _get_statistic_to_display_unit_converter(
+def _get_statistic_display_unit_converter(
     statistic_unit: str | None,
     state_unit: str | None,
     requested_units: dict[str, str] | None,
-    allow_none: bool = True,
-) -> Callable[[float | None], float | None] | Callable[[float], float] | None:
-    """Prepare a converter from the statistics unit to display unit."""
+) -> tuple[type[BaseUnitConverter], str | None] | None:
+    """Return the converter and display unit if statistics need to be converted."""
     if (converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(statistic_unit)) is None:
         return None
 
@@ -263,11 +442,25 @@ def _get_statistic_to_display_unit_converter(
     if display_unit == statistic_unit:
         return None
 
-    if allow_none:
-        return converter.converter_factory_allow_none(
-            from_unit=statistic_unit, to_unit=display_unit
+    return converter, display_unit
+
+
+def _get_statistic_to_display_unit_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[float | None], float | None] | None:
+    """Prepare a converter from the statistics unit to display unit."""
+    if (
+        converter_unit := _get_statistic_display_unit_converter(
+            statistic_unit, state_unit, requested_units
         )
-    return converter.converter_factory(from_unit=statistic_unit, to_unit=display_unit)
+    ) is None:
+        return None
+    converter, display_unit = converter_unit
+    return converter.converter_factory_allow_none(
+        from_unit=statistic_unit, to_unit=display_unit
+    )
 
 
 def _get_display_to_statistic_unit_converter(
@@ -445,6 +638,181 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
     )
 
 
+def _local_days(start_ts: float, end_ts: float) -> Iterator[tuple[float, float]]:
+    """Return the start and end of the local days overlapping start_ts - end_ts."""
+    day = dt_util.as_local(dt_util.utc_from_timestamp(start_ts)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    day_start_ts = day.timestamp()
+    while day_start_ts < end_ts:
+        day += timedelta(days=1)
+        day_end_ts = day.timestamp()
+        yield day_start_ts, day_end_ts
+        day_start_ts = day_end_ts
+
+
+def _compile_daily_statistics(
+    session: Session,
+    day_start_ts: float,
+    day_end_ts: float,
+    metadata_ids: list[int] | None,
+) -> None:
+    """Compile daily statistics.
+
+    This will summarize the hourly statistics for one day:
+    - average, min max is computed by a database query
+    - sum is taken from the last hourly entry during the day
+    """
+    delete_stmt = delete(StatisticsDaily).where(
+        StatisticsDaily.start_ts == day_start_ts
+    )
+    summary_stmt = select(
+        Statistics.metadata_id,
+        func.avg(Statistics.mean).label("mean"),
+        func.min(Statistics.min).label("min"),
+        func.max(Statistics.max).label("max"),
+        func.count(Statistics.mean).label("mean_weight"),
+        func.max(Statistics.start_ts).label("last_start_ts"),
+    ).where(Statistics.start_ts >= day_start_ts, Statistics.start_ts < day_end_ts)
+    if metadata_ids is not None:
+        delete_stmt = delete_stmt.where(StatisticsDaily.metadata_id.in_(metadata_ids))
+        summary_stmt = summary_stmt.where(Statistics.metadata_id.in_(metadata_ids))
+    summary = summary_stmt.group_by(Statistics.metadata_id).subquery()
+    last = aliased(Statistics)
+    session.execute(delete_stmt)
+    session.execute(
+        insert(StatisticsDaily).from_select(
+            [
+                StatisticsDaily.created_ts,
+                StatisticsDaily.metadata_id,
+                StatisticsDaily.start_ts,
+                StatisticsDaily.mean,
+                StatisticsDaily.min,
+                StatisticsDaily.max,
+                StatisticsDaily.mean_weight,
+                StatisticsDaily.last_reset_ts,
+                StatisticsDaily.state,
+                StatisticsDaily.sum,
+            ],
+            select(
+                literal(time.time()),
+                summary.c.metadata_id,
+                literal(day_start_ts),
+                summary.c.mean,
+                summary.c.min,
+                summary.c.max,
+                summary.c.mean_weight,
+                last.last_reset_ts,
+                last.state,
+                last.sum,
+            ).join(
+                last,
+                and_(
+                    last.metadata_id == summary.c.metadata_id,
+                    last.start_ts == summary.c.last_start_ts,
+                ),
+            ),
+        )
+    )
+
+
+def _update_daily_statistics(
+    instance: Recorder,
+    session: Session,
+    start_ts: float,
+    end_ts: float,
+    metadata_ids: list[int] | None = None,
+) -> None:
+    """Update the daily statistics after hourly statistics were changed.
+
+    The days overlapping start_ts - end_ts are compiled again, or marked as
+    outdated if the daily statistics are not kept up to date.
+    """
+    statistics_daily_manager = instance.statistics_daily_manager
+    if not statistics_daily_manager.active:
+        statistics_daily_manager.mark_dirty(start_ts)
+        return
+    session.flush()  # the daily statistics are compiled from the pending rows
+    for day_start_ts, day_end_ts in _local_days(start_ts, end_ts):
+        _compile_daily_statistics(session, day_start_ts, day_end_ts, metadata_ids)
+
+
+def _daily_statistics_time_zone_valid(session: Session, time_zone: tzinfo) -> bool:
+    """Return if all daily statistics start at midnight in the time zone."""
+    return all(
+        start_ts is not None
+        and datetime.fromtimestamp(start_ts, time_zone).time() == dt_time.min
+        for start_ts in session.execute(
+            select(StatisticsDaily.start_ts).distinct()
+        ).scalars()
+    )
+
+
+@retryable_database_job("compile daily statistics")
+def compile_daily_statistics(instance: Recorder) -> bool:
+    """Bring the daily statistics up to date for the configured time zone.
+
+    The daily statistics are rebuilt from the hourly statistics if they
+    were compiled for another time zone, otherwise only the days changed
+    while they were not kept up to date are compiled again. At most
+    COMPILE_DAILY_STATISTICS_MAX_DAYS days are compiled at once to not
+    block the recorder for too long, returns False if more days are left.
+    """
+    statistics_daily_manager = instance.statistics_daily_manager
+    if (
+        statistics_daily_manager.active
+        or instance.schema_version < STATISTICS_DAILY_SCHEMA_VERSION
+    ):
+        return True
+    time_zone = dt_util.get_default_time_zone()
+    finished = True
+
+    with session_scope(session=instance.get_session()) as session:
+        start_ts = statistics_daily_manager.dirty_start_ts
+        if (
+            statistics_daily_manager.time_zone is None
+            and (
+                last_daily_start_ts := session.execute(
+                    select(func.max(StatisticsDaily.start_ts))
+                ).scalar()
+            )
+            is not None
+            and _daily_statistics_time_zone_valid(session, time_zone)
+        ):
+            # The newest day may be incomplete if the recorder was stopped
+            # or a rebuild was interrupted, compile it again
+            if start_ts is None or last_daily_start_ts < start_ts:
+                start_ts = last_daily_start_ts
+        else:
+            _LOGGER.debug("Rebuilding daily statistics for time zone %s", time_zone)
+            session.execute(delete(StatisticsDaily))
+            start_ts = None
+
+        first_start_ts, last_start_ts = session.execute(
+            select(func.min(Statistics.start_ts), func.max(Statistics.start_ts))
+        ).one()
+        if first_start_ts is not None:
+            compile_start_ts: float = (
+                first_start_ts if start_ts is None else max(start_ts, first_start_ts)
+            )
+            for days, (day_start_ts, day_end_ts) in enumerate(
+                _local_days(
+                    compile_start_ts,
+                    last_start_ts + Statistics.duration.total_seconds(),
+                )
+            ):
+                if days == COMPILE_DAILY_STATISTICS_MAX_DAYS:
+                    finished = False
+                    break
+                _compile_daily_statistics(session, day_start_ts, day_end_ts, None)
+
+    statistics_daily_manager.dirty_start_ts = None
+    # The remaining days are found from the newest compiled day when
+    # the daily statistics are verified again
+    statistics_daily_manager.time_zone = time_zone if finished else None
+    return finished
+
+
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
     """Compile missing statistics."""
@@ -590,6 +958,12 @@ def _compile_statistics(
     if start.minute == 55:
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
+        hour_start_ts = start.replace(minute=0).timestamp()
+        hour_end_ts = hour_start_ts + Statistics.duration.total_seconds()
+        _update_daily_statistics(instance, session, hour_start_ts, hour_end_ts)
+        _invalidate_statistics_during_period_cache_on_commit(
+            instance, session, None, hour_start_ts, hour_end_ts
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -598,6 +972,11 @@ def _compile_statistics(
         if start.minute == 55:
             instance.hass.bus.fire(EVENT_RECORDER_HOURLY_STATISTICS_GENERATED)
 
+    if modified_statistic_ids:
+        _invalidate_statistics_during_period_cache_on_commit(
+            instance, session, modified_statistic_ids
+        )
+
     if updated_metadata_ids:
         # These are always the newest statistics, so we can update
         # the run cache without having to check the start_ts.
@@ -643,6 +1022,33 @@ def _adjust_sum_statistics(
         )
 
 
+def _adjust_daily_sum_statistics(
+    instance: Recorder,
+    session: Session,
+    metadata_id: int,
+    start_time: datetime,
+    adj: float,
+) -> None:
+    """Adjust daily statistics after the hourly statistics were adjusted.
+
+    The day the adjustment starts in is compiled again, the sum of the
+    following days is adjusted in the database.
+    """
+    start_time_ts = start_time.timestamp()
+    if instance.statistics_daily_manager.active:
+        _, day_end_ts = next(_local_days(start_time_ts, start_time_ts + 1))
+        _adjust_sum_statistics(
+            session,
+            StatisticsDaily,
+            metadata_id,
+            dt_util.utc_from_timestamp(day_end_ts),
+            adj,
+        )
+    _update_daily_statistics(
+        instance, session, start_time_ts, start_time_ts + 1, [metadata_id]
+    )
+
+
 def _insert_statistics(
     session: Session,
     table: type[StatisticsBase],
@@ -736,6 +1142,9 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+        _invalidate_statistics_during_period_cache_on_commit(
+            instance, session, statistic_ids
+        )
 
 
 def update_statistics_metadata(
@@ -751,6 +1160,9 @@ def update_statistics_metadata(
             statistics_meta_manager.update_unit_of_measurement(
                 session, statistic_id, new_unit_of_measurement
             )
+            _invalidate_statistics_during_period_cache_on_commit(
+                instance, session, [statistic_id]
+            )
     if new_statistic_id is not UNDEFINED and new_statistic_id is not None:
         with session_scope(
             session=instance.get_session(),
@@ -761,6 +1173,9 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+            _invalidate_statistics_during_period_cache_on_commit(
+                instance, session, [statistic_id, new_statistic_id]
+            )
 
 
 async def async_list_statistic_ids(
@@ -895,8 +1310,13 @@ def _reduce_statistics(
     period_start_end: Callable[[float], tuple[float, float]],
     period: timedelta,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    mean_weights: dict[str, list[int]] | None = None,
 ) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
+    """Reduce hourly statistics to daily or monthly statistics.
+
+    If mean_weights is passed, the means are weighted with the number of
+    hours each statistic row was compiled from.
+    """
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
     period_seconds = period.total_seconds()
     _want_mean = "mean" in types
@@ -909,11 +1329,13 @@ def _reduce_statistics(
         max_values: list[float] = []
         mean_values: list[float] = []
         min_values: list[float] = []
+        weight_values: list[int] = []
+        weights = mean_weights.get(statistic_id) if mean_weights is not None else None
         prev_stat: StatisticsRow = stat_list[0]
         fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
 
         # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
+        for idx, statistic in enumerate(chain(stat_list, (fake_entry,))):
             if not same_period(prev_stat["start"], statistic["start"]):
                 start, end = period_start_end(prev_stat["start"])
                 # The previous statistic was the last entry of the period
@@ -922,7 +1344,15 @@ def _reduce_statistics(
                     "end": end,
                 }
                 if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
+                    if weights is None:
+                        row["mean"] = mean(mean_values) if mean_values else None
+                    else:
+                        row["mean"] = (
+                            sum(map(mul, mean_values, weight_values)) / total_weight
+                            if (total_weight := sum(weight_values))
+                            else None
+                        )
+                        weight_values.clear()
                     mean_values.clear()
                 if _want_min:
                     row["min"] = min(min_values) if min_values else None
@@ -941,6 +1371,8 @@ def _reduce_statistics(
                 max_values.append(_max)
             if _want_mean and (_mean := statistic.get("mean")) is not None:
                 mean_values.append(_mean)
+                if weights is not None:
+                    weight_values.append(weights[idx])
             if _want_min and (_min := statistic.get("min")) is not None:
                 min_values.append(_min)
             prev_stat = statistic
@@ -1039,11 +1471,17 @@ def reduce_week_ts_factory() -> (
 def _reduce_statistics_per_week(
     stats: dict[str, list[StatisticsRow]],
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    mean_weights: dict[str, list[int]] | None = None,
 ) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to weekly statistics."""
+    """Reduce hourly or daily statistics to weekly statistics."""
     _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
     return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
+        stats,
+        _same_week_ts,
+        _week_start_end_ts,
+        timedelta(days=7),
+        types,
+        mean_weights,
     )
 
 
@@ -1094,11 +1532,17 @@ def reduce_month_ts_factory() -> (
 def _reduce_statistics_per_month(
     stats: dict[str, list[StatisticsRow]],
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    mean_weights: dict[str, list[int]] | None = None,
 ) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to monthly statistics."""
+    """Reduce hourly or daily statistics to monthly statistics."""
     _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
     return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
+        stats,
+        _same_month_ts,
+        _month_start_end_ts,
+        timedelta(days=31),
+        types,
+        mean_weights,
     )
 
 
@@ -1108,6 +1552,7 @@ def _generate_statistics_during_period_stmt(
     metadata_ids: list[int] | None,
     table: type[StatisticsBase],
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    with_mean_weight: bool = False,
 ) -> StatementLambdaElement:
     """Prepare a database query for statistics during a given period.
 
@@ -1115,6 +1560,8 @@ def _generate_statistics_during_period_stmt(
     """
     start_time_ts = start_time.timestamp()
     stmt = _generate_select_columns_for_types_stmt(table, types)
+    if with_mean_weight:
+        stmt += lambda q: q.add_columns(StatisticsDaily.mean_weight)
     stmt += lambda q: q.filter(table.start_ts >= start_time_ts)
     if end_time is not None:
         end_time_ts = end_time.timestamp()
@@ -1642,7 +2089,7 @@ def _augment_result_with_change(
     start_time: datetime,
     units: dict[str, str] | None,
     _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily],
     metadata: dict[str, tuple[int, StatisticMetaData]],
     result: dict[str, list[StatisticsRow]],
 ) -> None:
@@ -1687,6 +2134,20 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _mean_weights_by_statistic_id(
+    stats: Sequence[Row],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+) -> dict[str, list[int]]:
+    """Return the mean weights of daily statistics rows by statistic_id."""
+    statistic_ids = {
+        metadata_id: statistic_id for statistic_id, (metadata_id, _) in metadata.items()
+    }
+    return {
+        statistic_ids[metadata_id]: [row.mean_weight for row in group]
+        for metadata_id, group in groupby(stats, attrgetter("metadata_id"))
+    }
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1754,11 +2215,20 @@ def _statistics_during_period_with_session(
         if end_time is not None:
             end_time = _find_month_end_time(dt_util.as_local(end_time))
 
-    table: type[Statistics | StatisticsShortTerm] = (
-        Statistics if period != "5minute" else StatisticsShortTerm
-    )
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily]
+    if period == "5minute":
+        table = StatisticsShortTerm
+    elif (
+        period in ("day", "week", "month")
+        and get_instance(hass).statistics_daily_manager.active
+    ):
+        # Days, weeks and months are reduced from far fewer daily statistics
+        table = StatisticsDaily
+    else:
+        table = Statistics
+    with_mean_weight = table is StatisticsDaily and period != "day" and "mean" in types
     stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
+        start_time, end_time, metadata_ids, table, types, with_mean_weight
     )
     stats = cast(
         Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
@@ -1777,15 +2247,19 @@ def _statistics_during_period_with_session(
         units,
         types,
     )
+    mean_weights = (
+        _mean_weights_by_statistic_id(stats, metadata) if with_mean_weight else None
+    )
 
     if period == "day":
+        # Also reduce daily statistics to get the end of days with a DST change
         result = _reduce_statistics_per_day(result, types)
 
     if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        result = _reduce_statistics_per_week(result, types, mean_weights)
 
     if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        result = _reduce_statistics_per_month(result, types, mean_weights)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2055,14 +2529,17 @@ def _build_sum_converted_stats(
     table_duration_seconds: float,
     start_ts_idx: int,
     sum_idx: int,
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    linear_conversion: tuple[float, float, float, float],
 ) -> list[StatisticsRow]:
-    """Build a list of sum statistics."""
+    """Build a list of sum statistics with a linear unit conversion."""
+    offset_before, from_ratio, to_ratio, offset_after = linear_conversion
     return [
         {
             "start": (start_ts := db_row[start_ts_idx]),
             "end": start_ts + table_duration_seconds,
-            "sum": None if (v := db_row[sum_idx]) is None else convert(v),
+            "sum": None
+            if (v := db_row[sum_idx]) is None
+            else ((v + offset_before) / from_ratio) * to_ratio + offset_after,
         }
         for db_row in db_rows
     ]
@@ -2130,9 +2607,13 @@ def _build_converted_stats(
     last_reset_ts_idx: int | None,
     state_idx: int | None,
     sum_idx: int | None,
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    linear_conversion: tuple[float, float, float, float],
 ) -> list[StatisticsRow]:
-    """Build a list of statistics with unit conversion."""
+    """Build a list of statistics with a linear unit conversion.
+
+    The conversion is inlined to avoid calling a converter for each value.
+    """
+    offset_before, from_ratio, to_ratio, offset_after = linear_conversion
     result: list[StatisticsRow] = []
     ent_results_append = result.append
     for db_row in db_rows:
@@ -2143,19 +2624,52 @@ def _build_converted_stats(
         if last_reset_ts_idx is not None:
             row["last_reset"] = db_row[last_reset_ts_idx]
         if mean_idx is not None:
-            row["mean"] = None if (v := db_row[mean_idx]) is None else convert(v)
+            row["mean"] = (
+                None
+                if (v := db_row[mean_idx]) is None
+                else ((v + offset_before) / from_ratio) * to_ratio + offset_after
+            )
         if min_idx is not None:
-            row["min"] = None if (v := db_row[min_idx]) is None else convert(v)
+            row["min"] = (
+                None
+                if (v := db_row[min_idx]) is None
+                else ((v + offset_before) / from_ratio) * to_ratio + offset_after
+            )
         if max_idx is not None:
-            row["max"] = None if (v := db_row[max_idx]) is None else convert(v)
+            row["max"] = (
+                None
+                if (v := db_row[max_idx]) is None
+                else ((v + offset_before) / from_ratio) * to_ratio + offset_after
+            )
         if state_idx is not None:
-            row["state"] = None if (v := db_row[state_idx]) is None else convert(v)
+            row["state"] = (
+                None
+                if (v := db_row[state_idx]) is None
+                else ((v + offset_before) / from_ratio) * to_ratio + offset_after
+            )
         if sum_idx is not None:
-            row["sum"] = None if (v := db_row[sum_idx]) is None else convert(v)
+            row["sum"] = (
+                None
+                if (v := db_row[sum_idx]) is None
+                else ((v + offset_before) / from_ratio) * to_ratio + offset_after
+            )
         ent_results_append(row)
     return result
 
 
+def _convert_stats(
+    stats: list[StatisticsRow],
+    keys: Iterable[Literal["max", "mean", "min", "state", "sum"]],
+    convert_many: Callable[[Iterable[float | None]], list[float | None]],
+) -> None:
+    """Convert the values of statistics in place with a non-linear unit conversion."""
+    for key in keys:
+        for row, value in zip(
+            stats, convert_many([row[key] for row in stats]), strict=True
+        ):
+            row[key] = value
+
+
 def _sorted_statistics_to_dict(
     hass: HomeAssistant,
     stats: Sequence[Row[Any]],
@@ -2201,20 +2715,31 @@ def _sorted_statistics_to_dict(
     sum_idx = field_map["sum"] if "sum" in types else None
     sum_only = len(types) == 1 and sum_idx is not None
     row_idxes = (mean_idx, min_idx, max_idx, last_reset_ts_idx, state_idx, sum_idx)
+    converted_keys: list[Literal["max", "mean", "min", "state", "sum"]] = [
+        key for key in ("max", "mean", "min", "state", "sum") if key in types
+    ]
     # Append all statistic entries, and optionally do unit conversion
     table_duration_seconds = table.duration.total_seconds()
     for meta_id, db_rows in stats_by_meta_id.items():
         metadata_by_id = metadata[meta_id]
         statistic_id = metadata_by_id["statistic_id"]
+        linear_conversion = None
+        convert_many = None
         if convert_units:
             state_unit = unit = metadata_by_id["unit_of_measurement"]
             if state := hass.states.get(statistic_id):
                 state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(
-                unit, state_unit, units, allow_none=False
-            )
-        else:
-            convert = None
+            if converter_unit := _get_statistic_display_unit_converter(
+                unit, state_unit, units
+            ):
+                converter, display_unit = converter_unit
+                # Most conversions are linear and are inlined in the
+                # build functions, the others are converted afterwards
+                linear_conversion = converter.get_linear_conversion(unit, display_unit)
+                if linear_conversion is None:
+                    convert_many = converter.converter_factory_many(
+                        unit, display_unit
+                    )
 
         build_args = (db_rows, table_duration_seconds, start_ts_idx)
         if sum_only:
@@ -2224,14 +2749,18 @@ def _sorted_statistics_to_dict(
             # For energy, we only need sum statistics, so we can optimize
             # this path to avoid the overhead of the more generic function.
             assert sum_idx is not None
-            if convert:
-                _stats = _build_sum_converted_stats(*build_args, sum_idx, convert)
+            if linear_conversion:
+                _stats = _build_sum_converted_stats(
+                    *build_args, sum_idx, linear_conversion
+                )
             else:
                 _stats = _build_sum_stats(*build_args, sum_idx)
-        elif convert:
-            _stats = _build_converted_stats(*build_args, *row_idxes, convert)
+        elif linear_conversion:
+            _stats = _build_converted_stats(*build_args, *row_idxes, linear_conversion)
         else:
             _stats = _build_stats(*build_args, *row_idxes)
+        if convert_many:
+            _convert_stats(_stats, converted_keys, convert_many)
 
         result[statistic_id] = _stats
 
@@ -2352,16 +2881,30 @@ def _import_statistics_with_session(
     old_metadata_dict = statistics_meta_manager.get_many(
         session, statistic_ids={metadata["statistic_id"]}
     )
-    _, metadata_id = statistics_meta_manager.update_or_add(
+    modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    start_timestamps: list[float] = []
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        start_timestamps.append(stat["start"].timestamp())
+
+    if modified_statistic_id is not None:
+        _invalidate_statistics_during_period_cache_on_commit(
+            instance, session, [modified_statistic_id]
+        )
 
     if table != StatisticsShortTerm:
+        if start_timestamps:
+            start_ts = min(start_timestamps)
+            end_ts = max(start_timestamps) + table.duration.total_seconds()
+            _update_daily_statistics(instance, session, start_ts, end_ts, [metadata_id])
+            _invalidate_statistics_during_period_cache_on_commit(
+                instance, session, [metadata["statistic_id"]], start_ts, end_ts
+            )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2382,6 +2925,31 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_STATISTICS_DURING_PERIOD_CACHE)
+def get_statistics_during_period_cache(
+    hass: HomeAssistant,
+) -> StatisticsDuringPeriodCache:
+    """Get the statistics_during_period result cache."""
+    return StatisticsDuringPeriodCache()
+
+
+def _invalidate_statistics_during_period_cache_on_commit(
+    instance: Recorder,
+    session: Session,
+    statistic_ids: Collection[str] | None = None,
+    start_ts: float = float("-inf"),
+    end_ts: float = float("inf"),
+) -> None:
+    """Invalidate cached results once the changed statistics are committed."""
+    cache = get_statistics_during_period_cache(instance.hass)
+    event.listen(
+        session,
+        "after_commit",
+        lambda _: cache.invalidate(statistic_ids, start_ts, end_ts),
+        once=True,
+    )
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2491,6 +3059,18 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        _adjust_daily_sum_statistics(
+            instance,
+            session,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0),
+            sum_adjustment,
+        )
+
+        _invalidate_statistics_during_period_cache_on_commit(
+            instance, session, [statistic_id], start_time.replace(minute=0).timestamp()
+        )
+
     return True
 
 
@@ -2552,12 +3132,19 @@ def change_statistics_unit(
             Statistics,
             StatisticsShortTerm,
         )
+        if instance.statistics_daily_manager.active:
+            tables += (StatisticsDaily,)
+        else:
+            instance.statistics_daily_manager.mark_dirty(0)
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
+        _invalidate_statistics_during_period_cache_on_commit(
+            instance, session, [statistic_id]
+        )
 
 
 @callback
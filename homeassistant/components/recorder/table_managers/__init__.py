@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import logging
+import sys
 from typing import TYPE_CHECKING, Any
 
 from lru import LRU
@@ -11,6 +13,21 @@ from homeassistant.util.event_type import EventType
 if TYPE_CHECKING:
     from ..core import Recorder
 
+_LOGGER = logging.getLogger(__name__)
+
+# Grow an LRU cache when more lookups than this
+# missed items that were evicted from it before
+LRU_GROW_REFETCH_RATE = 0.01
+
+# The memory an LRU cache may use for its items
+# and the number of items it holds at most
+LRU_MEMORY_BUDGET = 16 * 1024 * 1024
+LRU_MAX_SIZE = 262144
+
+# The estimated memory used by an item besides its key:
+# the int value and the entries in the LRU and the evicted hashes
+LRU_ITEM_OVERHEAD_BYTES = 200
+
 
 class BaseTableManager[_DataT]:
     """Base class for table managers."""
@@ -62,9 +79,48 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
 
         We keep track of the most recently used items
         and evict the least recently used items when the cache is full.
+
+        The hashes of the evicted items are kept in a second LRU of
+        the same size so a miss for an item that was evicted before
+        can be counted as a refetch, which means the cache is too small.
         """
         super().__init__(recorder)
-        self._id_map = LRU(lru_size)
+        self._min_lru_size = lru_size
+        self._id_map = LRU(lru_size, self._async_item_evicted)
+        self._evicted_hashes: LRU[int, None] = LRU(lru_size)
+        # The hits and misses are counted per resolved item instead of
+        # taken from the LRU since a miss in get_from_cache is looked
+        # up in the LRU again by get_many
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._refetches = 0
+        # The counters at the last adaptation of the LRU size
+        self._adapted_at: tuple[int, int, int, int] = (0, 0, 0, 0)
+
+    def _async_item_evicted(self, key: EventType[Any] | str, value: int) -> None:
+        """Remember the hash of an item evicted from the LRU."""
+        self._evictions += 1
+        self._evicted_hashes[hash(key)] = None
+
+    def get_from_cache(self, data: str) -> int | None:
+        """Resolve data to the id without accessing the underlying database.
+
+        Only hits are counted, a miss is counted when the caller
+        falls back to get.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (id_ := self._id_map.get(data)) is not None:
+            self._hits += 1
+        return id_
+
+    def _count_miss(self, key: EventType[Any] | str) -> None:
+        """Count a miss and count it as a refetch if the item was evicted before."""
+        self._misses += 1
+        if hash(key) in self._evicted_hashes:
+            self._refetches += 1
 
     def adjust_lru_size(self, new_size: int) -> None:
         """Adjust the LRU cache size.
@@ -74,4 +130,83 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         """
         lru = self._id_map
         if new_size > lru.get_size():
-            lru.set_size(new_size)
+            self._set_lru_size(new_size)
+
+    def adapt_lru_size(self, min_size: int = 0) -> None:
+        """Grow or shrink the LRU cache from the lookups since the last call.
+
+        The cache doubles when more than LRU_GROW_REFETCH_RATE of the
+        lookups missed items that were evicted before. It halves when
+        items were evicted but none of them were looked up again, since
+        a smaller cache would have had the same hits. The size never
+        goes below the initial size or min_size and never above what
+        fits in LRU_MEMORY_BUDGET.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        lru = self._id_map
+        hits, misses = self._hits, self._misses
+        last_hits, last_misses, last_evictions, last_refetches = self._adapted_at
+        lookups = hits + misses - last_hits - last_misses
+        evictions = self._evictions - last_evictions
+        refetches = self._refetches - last_refetches
+
+        size = current_size = lru.get_size()
+        if lookups and refetches / lookups > LRU_GROW_REFETCH_RATE:
+            size = current_size * 2
+        elif evictions and not refetches:
+            size = current_size // 2
+        size = max(min(size, self._max_lru_size()), self._min_lru_size, min_size)
+        if size != current_size:
+            _LOGGER.debug(
+                "Resizing %s LRU from %s to %s after %s lookups, "
+                "%s evictions and %s refetches",
+                type(self).__name__,
+                current_size,
+                size,
+                lookups,
+                evictions,
+                refetches,
+            )
+            self._set_lru_size(size)
+            if size > current_size:
+                # Items evicted from the smaller cache would have stayed
+                # in the larger one, so their misses are not refetches
+                self._evicted_hashes.clear()
+        # Evictions from shrinking the cache are not counted
+        self._adapted_at = (hits, misses, self._evictions, self._refetches)
+
+    def _max_lru_size(self) -> int:
+        """Return the LRU size that fits in the memory budget.
+
+        The size of an item is estimated from the keys in the cache.
+        """
+        lru = self._id_map
+        if not (count := len(lru)):
+            return LRU_MAX_SIZE
+        # LRU is not iterable
+        key_bytes = sum(sys.getsizeof(key) for key in lru.keys())  # noqa: SIM118
+        item_bytes = key_bytes / count + LRU_ITEM_OVERHEAD_BYTES
+        return max(min(int(LRU_MEMORY_BUDGET / item_bytes), LRU_MAX_SIZE), 1)
+
+    def _set_lru_size(self, new_size: int) -> None:
+        """Set the size of the LRU and of the evicted hashes."""
+        self._id_map.set_size(new_size)
+        self._evicted_hashes.set_size(new_size)
+
+    def lru_stats(self) -> dict[str, int]:
+        """Return the size and the counters of the LRU cache.
+
+        The counters are approximate when called outside
+        of the recorder thread.
+        """
+        lru = self._id_map
+        return {
+            "size": len(lru),
+            "max_size": lru.get_size(),
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "refetches": self._refetches,
+        }
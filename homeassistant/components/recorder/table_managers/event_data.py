@@ -77,7 +77,10 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         missing_hashes: set[int] = set()
         for shared_data, data_hash in shared_data_data_hashs:
             if (data_id := self._id_map.get(shared_data)) is None:
+                self._count_miss(shared_data)
                 missing_hashes.add(data_hash)
+            else:
+                self._hits += 1
 
             results[shared_data] = data_id
 
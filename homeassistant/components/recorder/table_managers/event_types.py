@@ -77,10 +77,13 @@ class EventTypeManager(BaseLRUTableManager[EventTypes]):
 
         for event_type in event_types:
             if (event_type_id := self._id_map.get(event_type)) is None:
+                self._count_miss(event_type)
                 if event_type in self._non_existent_event_types:
                     results[event_type] = None
                 else:
                     missing.append(event_type)
+            else:
+                self._hits += 1
 
             results[event_type] = event_type_id
 
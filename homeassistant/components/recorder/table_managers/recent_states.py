@@ -0,0 +1,155 @@
+"""Support keeping the recently recorded states in memory."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+import threading
+from typing import TYPE_CHECKING
+
+from homeassistant.core import State
+
+if TYPE_CHECKING:
+    from ..core import Recorder
+
+# The number of states kept for an entity, the oldest states
+# are dropped when an entity has more states than this
+MAX_RECENT_STATES = 2048
+
+
+class _RecentStates:
+    """The states recorded for an entity in order of last_updated."""
+
+    __slots__ = ("states", "timestamps")
+
+    def __init__(self) -> None:
+        """Initialize the recent states."""
+        self.states: list[State] = []
+        self.timestamps: list[float] = []
+
+
+class RecentStatesManager:
+    """Keep the recently recorded states of entities in memory.
+
+    Statistics are compiled from the states recorded in the last
+    period. Instead of querying them from the database for every
+    period, the states of the entities statistics are compiled for
+    are kept as they are recorded.
+
+    The states of an entity are complete from the first state kept
+    for it on. Since the manager only learns about states after it
+    started tracking an entity, for example after a restart, periods
+    that start earlier must still be queried from the database.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the recent states manager."""
+        self.recorder = recorder
+        self._tracked: dict[str, _RecentStates] = {}
+
+    def add(self, entity_id: str, state: State | None) -> None:
+        """Add a recorded state of an entity.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (recent := self._tracked.get(entity_id)) is None:
+            return
+        if state is None:
+            # The entity was removed
+            del self._tracked[entity_id]
+            return
+        timestamps = recent.timestamps
+        timestamp = state.last_updated_timestamp
+        if timestamps and timestamp <= timestamps[-1]:
+            # The state was kept when the entity started to be tracked
+            # or is older than it
+            return
+        recent.states.append(state)
+        timestamps.append(timestamp)
+        if len(timestamps) > MAX_RECENT_STATES:
+            del recent.states[: MAX_RECENT_STATES // 2]
+            del timestamps[: MAX_RECENT_STATES // 2]
+
+    def get_states(
+        self,
+        entity_ids: list[str],
+        start_time: datetime,
+        end_time: datetime,
+        significant_changes_only: bool = True,
+    ) -> tuple[dict[str, list[State]], list[str]]:
+        """Return the states of entities during a time period.
+
+        The states are returned in the same way as
+        get_full_significant_states_with_session returns them, with
+        the state at start_time first. States older than the state at
+        start_time are dropped since periods are compiled in order.
+
+        Entities whose states are not known for the whole period are
+        returned separately and are tracked from now on.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        result: dict[str, list[State]] = {}
+        missing: list[str] = []
+        if self.recorder.thread_id != threading.get_ident():
+            return result, list(entity_ids)
+        start_time_ts = start_time.timestamp()
+        end_time_ts = end_time.timestamp()
+        tracked = self._tracked
+        for entity_id in entity_ids:
+            if (recent := tracked.get(entity_id)) is None:
+                self._track(entity_id)
+                missing.append(entity_id)
+                continue
+            timestamps = recent.timestamps
+            if not timestamps or timestamps[0] >= start_time_ts:
+                missing.append(entity_id)
+                continue
+            states = recent.states
+            # The state at start_time is the last one updated before it
+            start_idx = bisect_left(timestamps, start_time_ts) - 1
+            end_idx = bisect_left(timestamps, end_time_ts)
+            entity_states = [states[start_idx]]
+            entity_states.extend(
+                state
+                for state in states[
+                    bisect_right(timestamps, start_time_ts, start_idx) : end_idx
+                ]
+                if not significant_changes_only
+                or state.last_changed == state.last_updated
+            )
+            result[entity_id] = entity_states
+            del states[:start_idx]
+            del timestamps[:start_idx]
+        return result, missing
+
+    def _track(self, entity_id: str) -> None:
+        """Start tracking the states of an entity.
+
+        The current state of the entity is kept as the first state if
+        it was recorded in the current recorder run.
+        """
+        recorder = self.recorder
+        if (entity_filter := recorder.entity_filter) is not None and not (
+            entity_filter(entity_id)
+        ):
+            return
+        recent = self._tracked[entity_id] = _RecentStates()
+        if (
+            recorder.enabled
+            and (state := recorder.hass.states.get(entity_id)) is not None
+            and (timestamp := state.last_updated_timestamp)
+            >= recorder.recorder_runs_manager.recording_start.timestamp()
+        ):
+            recent.states.append(state)
+            recent.timestamps.append(timestamp)
+
+    def reset(self) -> None:
+        """Reset the manager when the pending states were rolled back.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._tracked.clear()
@@ -88,7 +88,10 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         missing_hashes: set[int] = set()
         for shared_attrs, data_hash in shared_attrs_data_hashes:
             if (attributes_id := self._id_map.get(shared_attrs)) is None:
+                self._count_miss(shared_attrs)
                 missing_hashes.add(data_hash)
+            else:
+                self._hits += 1
 
             results[shared_attrs] = attributes_id
 
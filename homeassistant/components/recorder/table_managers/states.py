@@ -2,7 +2,127 @@
 
 from __future__ import annotations
 
-from ..db_schema import States
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, EventStateChangedData
+
+from ..db_schema import EVENT_ORIGIN_TO_IDX, StateAttributes, States, StatesMeta
+from ..models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+INSERT_STATES_RETURNING_STATE_ID = insert(States).returning(
+    States.state_id, sort_by_parameter_order=True
+)
+
+
+class PendingStatesRow:
+    """A states row waiting to be written with a bulk insert.
+
+    The row exposes the same attributes as a States object that the
+    recorder sets when processing a state_changed event, which allows
+    it to be used in place of a States object without the overhead of
+    constructing and flushing an ORM object.
+
+    References to a pending old state, StatesMeta or StateAttributes
+    are resolved to their ids when the row is inserted.
+    """
+
+    __slots__ = (
+        "entity_id",
+        "state",
+        "attributes",
+        "last_changed_ts",
+        "last_reported_ts",
+        "last_updated_ts",
+        "old_state_id",
+        "attributes_id",
+        "metadata_id",
+        "context_id_bin",
+        "context_user_id_bin",
+        "context_parent_id_bin",
+        "origin_idx",
+        "old_state",
+        "states_meta_rel",
+        "state_attributes",
+        "state_id",
+        "generation",
+    )
+
+    def __init__(self, event: Event[EventStateChangedData]) -> None:
+        """Create a row from a state_changed event."""
+        state = event.data["new_state"]
+        context = event.context
+        self.entity_id: str | None = event.data["entity_id"]
+        self.attributes: str | None = None
+        self.old_state_id: int | None = None
+        self.attributes_id: int | None = None
+        self.metadata_id: int | None = None
+        self.context_id_bin = ulid_to_bytes_or_none(context.id)
+        self.context_user_id_bin = uuid_hex_to_bytes_or_none(context.user_id)
+        self.context_parent_id_bin = ulid_to_bytes_or_none(context.parent_id)
+        self.origin_idx = EVENT_ORIGIN_TO_IDX.get(event.origin)
+        self.old_state: PendingStatesRow | None = None
+        self.states_meta_rel: StatesMeta | None = None
+        self.state_attributes: StateAttributes | None = None
+        self.state_id: int | None = None
+        # The insert round the row is written in, or None if the
+        # row has not been scheduled to be inserted.
+        self.generation: int | None = None
+        self.state: str | None
+        self.last_changed_ts: float | None
+        self.last_reported_ts: float | None
+        self.last_updated_ts: float
+        # None state means the state was removed from the state machine
+        if state is None:
+            self.state = ""
+            self.last_updated_ts = event.time_fired_timestamp
+            self.last_changed_ts = None
+            self.last_reported_ts = None
+            return
+
+        self.state = state.state
+        self.last_updated_ts = state.last_updated_timestamp
+        if state.last_updated == state.last_changed:
+            self.last_changed_ts = None
+        else:
+            self.last_changed_ts = state.last_changed_timestamp
+        if state.last_updated == state.last_reported:
+            self.last_reported_ts = None
+        else:
+            self.last_reported_ts = state.last_reported_timestamp
+
+    def as_insert_params(self) -> dict[str, Any]:
+        """Return the parameters to insert the row.
+
+        Any pending references must have been assigned ids
+        before this is called.
+        """
+        old_state_id = self.old_state_id
+        if (old_state := self.old_state) is not None:
+            old_state_id = old_state.state_id
+        metadata_id = self.metadata_id
+        if (states_meta := self.states_meta_rel) is not None:
+            metadata_id = states_meta.metadata_id
+        attributes_id = self.attributes_id
+        if (state_attributes := self.state_attributes) is not None:
+            attributes_id = state_attributes.attributes_id
+        return {
+            "entity_id": self.entity_id,
+            "state": self.state,
+            "attributes": self.attributes,
+            "last_changed_ts": self.last_changed_ts,
+            "last_reported_ts": self.last_reported_ts,
+            "last_updated_ts": self.last_updated_ts,
+            "old_state_id": old_state_id,
+            "attributes_id": attributes_id,
+            "metadata_id": metadata_id,
+            "context_id_bin": self.context_id_bin,
+            "context_user_id_bin": self.context_user_id_bin,
+            "context_parent_id_bin": self.context_parent_id_bin,
+            "origin_idx": self.origin_idx,
+        }
 
 
 class StatesManager:
@@ -10,11 +130,15 @@ class StatesManager:
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, States | PendingStatesRow] = {}
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
+        # Rows waiting to be bulk inserted, grouped by the round they
+        # must be inserted in so the old_state_id of each row can be
+        # resolved from a row inserted in a previous round.
+        self._pending_rows: list[list[PendingStatesRow]] = []
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    def pop_pending(self, entity_id: str) -> States | PendingStatesRow | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -35,7 +159,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: States | PendingStatesRow) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -45,6 +169,51 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_row(self, row: PendingStatesRow) -> None:
+        """Schedule a row to be written by the next bulk insert.
+
+        A row that links to a pending old state must be inserted in a later
+        round than the old state so the old_state_id is known.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        generation = 0
+        if (old_state := row.old_state) is not None and (
+            old_generation := old_state.generation
+        ) is not None:
+            generation = old_generation + 1
+        row.generation = generation
+        pending_rows = self._pending_rows
+        if generation == len(pending_rows):
+            pending_rows.append([row])
+        else:
+            pending_rows[generation].append(row)
+
+    def has_pending_rows(self) -> bool:
+        """Return if there are rows waiting to be bulk inserted."""
+        return bool(self._pending_rows)
+
+    def insert_pending_rows(self, session: Session) -> None:
+        """Write the pending rows with one executemany per round.
+
+        Any pending StatesMeta and StateAttributes must be flushed
+        before calling this so their ids are known.
+
+        The rows are kept until post_commit_pending is called so
+        the insert can be retried if the commit fails.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for rows in self._pending_rows:
+            result = session.execute(
+                INSERT_STATES_RETURNING_STATE_ID,
+                [row.as_insert_params() for row in rows],
+            )
+            for row, state_id in zip(rows, result.scalars(), strict=True):
+                row.state_id = state_id
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -62,8 +231,10 @@ class StatesManager:
         recorder thread.
         """
         for entity_id, db_states in self._pending.items():
-            self._last_committed_id[entity_id] = db_states.state_id
+            if (state_id := db_states.state_id) is not None:
+                self._last_committed_id[entity_id] = state_id
         self._pending.clear()
+        self._pending_rows.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -74,6 +245,15 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_rows.clear()
+
+    def committed_state_ids(self) -> set[int]:
+        """Return the state_ids of the last committed state of each entity.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return set(self._last_committed_id.values())
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
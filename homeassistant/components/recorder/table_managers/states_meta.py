@@ -91,7 +91,10 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         missing: list[str] = []
         for entity_id in entity_ids:
             if (metadata_id := self._id_map.get(entity_id)) is None:
+                self._count_miss(entity_id)
                 missing.append(entity_id)
+            else:
+                self._hits += 1
 
             results[entity_id] = metadata_id
 
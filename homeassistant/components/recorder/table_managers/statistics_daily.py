@@ -0,0 +1,51 @@
+"""Support managing the daily statistics rolled up from the hourly statistics."""
+
+from __future__ import annotations
+
+from datetime import tzinfo
+
+import homeassistant.util.dt as dt_util
+
+
+class StatisticsDailyManager:
+    """Track the state of the daily statistics.
+
+    The daily statistics start at midnight in the configured time zone
+    and are only valid as long as the time zone is not changed. They
+    are only kept up to date with the hourly statistics once the rows
+    in the database have been verified, or rebuilt, for the current
+    time zone.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the daily statistics manager."""
+        # The time zone the daily statistics were verified for
+        self.time_zone: tzinfo | None = None
+        # The start of the oldest hourly statistics changed while
+        # the daily statistics were not kept up to date
+        self.dirty_start_ts: float | None = None
+        # A task compiling the daily statistics is queued or running
+        self.compile_pending = False
+
+    @property
+    def active(self) -> bool:
+        """Return if the daily statistics are valid for the current time zone."""
+        return self.time_zone == dt_util.get_default_time_zone()
+
+    def mark_dirty(self, start_ts: float) -> None:
+        """Mark the daily statistics from start_ts on as outdated.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self.dirty_start_ts is None or start_ts < self.dirty_start_ts:
+            self.dirty_start_ts = start_ts
+
+    def reset(self) -> None:
+        """Reset the manager when the database was replaced.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.time_zone = None
+        self.dirty_start_ts = None
@@ -181,6 +181,23 @@ class CompileMissingStatisticsTask(RecorderTask):
         instance.queue_task(CompileMissingStatisticsTask())
 
 
+@dataclass(slots=True)
+class CompileDailyStatisticsTask(RecorderTask):
+    """An object to insert into the recorder queue to compile the daily statistics."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics task to compile the daily statistics."""
+        finished = True
+        try:
+            finished = statistics.compile_daily_statistics(instance)
+        finally:
+            # A new task may be queued once this one is done or failed
+            instance.statistics_daily_manager.compile_pending = not finished
+        if not finished:
+            # Schedule a new statistics task if this one didn't finish
+            instance.queue_task(CompileDailyStatisticsTask())
+
+
 @dataclass(slots=True)
 class ImportStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an import statistics task."""
@@ -358,6 +375,17 @@ class AdjustLRUSizeTask(RecorderTask):
         instance._adjust_lru_size()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class CreatePartitionsTask(RecorderTask):
+    """An object to insert into the recorder queue to create upcoming partitions."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task to create the partitions."""
+        instance._create_partitions()  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class StatesContextIDMigrationTask(RecorderTask):
     """An object to insert into the recorder queue to migrate states context ids."""
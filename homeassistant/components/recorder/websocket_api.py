@@ -39,6 +39,7 @@ from .statistics import (
     async_change_statistics_unit,
     async_import_statistics,
     async_list_statistic_ids,
+    get_statistics_during_period_cache,
     list_statistic_ids,
     statistic_during_period,
     statistics_during_period,
@@ -72,6 +73,7 @@ UNIT_SCHEMA = vol.Schema(
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the recorder websocket API."""
     websocket_api.async_register_command(hass, ws_adjust_sum_statistics)
+    websocket_api.async_register_command(hass, ws_cache_stats)
     websocket_api.async_register_command(hass, ws_change_statistics_unit)
     websocket_api.async_register_command(hass, ws_clear_statistics)
     websocket_api.async_register_command(hass, ws_get_statistic_during_period)
@@ -151,7 +153,20 @@ def _ws_get_statistics_during_period(
     units: dict[str, str],
     types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> bytes:
-    """Fetch statistics and convert them to json in the executor."""
+    """Fetch statistics and convert them to json in the executor.
+
+    Results of historic periods are requested over and over by the
+    dashboards, the serialized results are cached until the statistics
+    they were queried from change.
+    """
+    cache = get_statistics_during_period_cache(hass)
+    if (
+        key := cache.key(
+            hass, start_time, end_time, statistic_ids, period, units, types
+        )
+    ) is not None and (payload := cache.get(key)) is not None:
+        return messages.construct_result_message(msg_id, payload)
+    generation = cache.generation
     result = statistics_during_period(
         hass,
         start_time,
@@ -168,7 +183,10 @@ def _ws_get_statistics_during_period(
             row["end"] = int(row["end"] * 1000)
             if include_last_reset and (last_reset := row["last_reset"]) is not None:
                 row["last_reset"] = int(last_reset * 1000)
-    return json_bytes(messages.result_message(msg_id, result))
+    payload = json_bytes(result)
+    if key is not None:
+        cache.set(key, generation, payload)
+    return messages.construct_result_message(msg_id, payload)
 
 
 async def ws_handle_get_statistics_during_period(
@@ -513,3 +531,28 @@ def ws_info(
         "thread_running": is_running,
     }
     connection.send_result(msg["id"], recorder_info)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/cache_stats",
+    }
+)
+@callback
+def ws_cache_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the size and counters of the recorder caches."""
+    instance = get_instance(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "event_data": instance.event_data_manager.lru_stats(),
+            "event_types": instance.event_type_manager.lru_stats(),
+            "state_attributes": instance.state_attributes_manager.lru_stats(),
+            "states_meta": instance.states_meta_manager.lru_stats(),
+            "statistics_during_period": get_statistics_during_period_cache(
+                hass
+            ).stats(),
+        },
+    )
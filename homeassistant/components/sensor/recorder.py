@@ -399,34 +399,48 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
-    entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
-    ]
-    history_list: dict[str, list[State]] = {}
+    # Get history between start and end, the recorder keeps the recent
+    # states in memory so only the history of entities it did not keep
+    # the states for during the whole period is queried
+    recent_states_manager = get_instance(hass).recent_states_manager
+    history_start = start - datetime.timedelta.resolution
+    history_list, entities_full_history = recent_states_manager.get_states(
+        [i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]],
+        history_start,
+        end,
+        significant_changes_only=False,
+    )
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                history_start,
+                end,
+                entity_ids=entities_full_history,
+                significant_changes_only=False,
+            )
         )
-    entities_significant_history = [
-        i.entity_id
-        for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
-    ]
+    _history_list, entities_significant_history = recent_states_manager.get_states(
+        [
+            i.entity_id
+            for i in sensor_states
+            if "sum" not in wanted_statistics[i.entity_id]
+        ],
+        history_start,
+        end,
+    )
+    history_list.update(_history_list)
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                history_start,
+                end,
+                entity_ids=entities_significant_history,
+            )
         )
-        history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
@@ -0,0 +1,405 @@
+"""Incrementally maintained characteristics of a rolling window of samples.
+
+The statistics sensor keeps its samples in a pair of deques where new
+samples are appended to the right and the oldest samples are evicted from
+the left. Each tracker below is notified of every append and eviction and
+keeps the aggregate it is responsible for up to date in O(1) or O(log n)
+instead of recomputing it over the whole window.
+
+Trackers that accumulate floats resynchronize from the window once as many
+samples have been evicted as the window holds, which keeps the rounding
+error of the running values bounded while the amortized cost stays O(1).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+
+
+class WindowTracker:
+    """Base class for a tracker of a rolling window characteristic."""
+
+    def sample_added(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Handle a sample appended to the right of the window."""
+        raise NotImplementedError
+
+    def sample_removed(
+        self,
+        value: float,
+        age: datetime,
+        states: deque[float],
+        ages: deque[datetime],
+    ) -> None:
+        """Handle the oldest sample evicted from the left of the window."""
+        raise NotImplementedError
+
+
+class _ResyncingTracker(WindowTracker):
+    """Tracker with float accumulators that are recomputed periodically."""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._removals = 0
+        self.resync(deque(), deque())
+
+    def resync(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Recompute the accumulators from the window."""
+        raise NotImplementedError
+
+    def sample_removed(
+        self,
+        value: float,
+        age: datetime,
+        states: deque[float],
+        ages: deque[datetime],
+    ) -> None:
+        """Handle the oldest sample evicted from the left of the window."""
+        self._removals += 1
+        if self._removals >= len(states):
+            self._removals = 0
+            self.resync(states, ages)
+            return
+        self._remove(value, age, states, ages)
+
+    def _remove(
+        self,
+        value: float,
+        age: datetime,
+        states: deque[float],
+        ages: deque[datetime],
+    ) -> None:
+        """Remove the evicted sample from the accumulators."""
+        raise NotImplementedError
+
+
+class RunningSum(_ResyncingTracker):
+    """Track the sum of the samples."""
+
+    total: float
+
+    def resync(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Recompute the sum from the window."""
+        self.total = math.fsum(states)
+
+    def sample_added(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Add the new sample to the sum."""
+        self.total += states[-1]
+
+    def _remove(
+        self,
+        value: float,
+        age: datetime,
+        states: deque[float],
+        ages: deque[datetime],
+    ) -> None:
+        """Subtract the evicted sample from the sum."""
+        self.total -= value
+
+
+class RunningVariance(_ResyncingTracker):
+    """Track the mean and variance of the samples with Welford's algorithm."""
+
+    mean: float
+    _sum_squared_deviations: float
+    _count: int
+
+    def resync(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Recompute the mean and variance from the window in two passes."""
+        self._count = count = len(states)
+        self.mean = mean = math.fsum(states) / count if count else 0.0
+        self._sum_squared_deviations = math.fsum((x - mean) ** 2 for x in states)
+
+    def sample_added(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Add the new sample to the mean and variance."""
+        value = states[-1]
+        self._count += 1
+        delta = value - self.mean
+        self.mean += delta / self._count
+        self._sum_squared_deviations += delta * (value - self.mean)
+
+    def _remove(
+        self,
+        value: float,
+        age: datetime,
+        states: deque[float],
+        ages: deque[datetime],
+    ) -> None:
+        """Remove the evicted sample from the mean and variance."""
+        self._count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self._count
+        self._sum_squared_deviations -= delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two samples."""
+        # Cancellation can make the running value slightly negative
+        return max(self._sum_squared_deviations, 0.0) / (self._count - 1)
+
+
+class SortedValues(WindowTracker):
+    """Keep the samples sorted to read the median and percentiles.
+
+    Finding the position to insert or remove a sample is O(log n); moving
+    the references in the list is O(n) but a memmove that is negligible
+    compared to sorting the window on every update. NaN samples are left
+    out as they can not be ordered, so values may hold fewer samples than
+    the window.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self.values: list[float] = []
+
+    def sample_added(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Insert the new sample."""
+        if not math.isnan(value := states[-1]):
+            insort(self.values, value)
+
+    def sample_removed(
+        self,
+        value: float,
+        age: datetime,
+        states: deque[float],
+        ages: deque[datetime],
+    ) -> None:
+        """Remove the evicted sample."""
+        if not math.isnan(value):
+            values = self.values
+            del values[bisect_left(values, value)]
+
+    def median(self) -> float:
+        """Return the median in the same way as statistics.median.
+
+        Requires at least one sample.
+        """
+        values = self.values
+        count = len(values)
+        middle = count // 2
+        if count % 2 == 1:
+            return values[middle]
+        return (values[middle - 1] + values[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile in the same way as statistics.quantiles.
+
+        Matches statistics.quantiles(n=100, method="exclusive"),
+        requires at least two samples.
+        """
+        values = self.values
+        count = len(values)
+        rescaled = percentile * (count + 1)
+        index = min(max(rescaled // 100, 1), count - 1)
+        delta = rescaled - index * 100
+        return (values[index - 1] * (100 - delta) + values[index] * delta) / 100
+
+
+class MonotonicExtreme(WindowTracker):
+    """Track the minimum or maximum sample with a monotonic deque.
+
+    The deque holds the samples that can still become the extreme once
+    the samples before them are evicted. Equal samples are not dropped so
+    the front is always the oldest occurrence of the extreme value.
+    """
+
+    def __init__(self, maximum: bool) -> None:
+        """Initialize the tracker."""
+        self._maximum = maximum
+        self._candidates: deque[tuple[float, datetime, int]] = deque()
+        # Sequence numbers of the next sample to add and to evict
+        self._added = 0
+        self._removed = 0
+
+    def sample_added(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Drop the candidates the new sample supersedes and append it."""
+        value = states[-1]
+        candidates = self._candidates
+        if self._maximum:
+            while candidates and candidates[-1][0] < value:
+                candidates.pop()
+        else:
+            while candidates and candidates[-1][0] > value:
+                candidates.pop()
+        candidates.append((value, ages[-1], self._added))
+        self._added += 1
+
+    def sample_removed(
+        self,
+        value: float,
+        age: datetime,
+        states: deque[float],
+        ages: deque[datetime],
+    ) -> None:
+        """Drop the evicted sample if it is the current extreme."""
+        candidates = self._candidates
+        if candidates and candidates[0][2] == self._removed:
+            candidates.popleft()
+        self._removed += 1
+
+    @property
+    def value(self) -> float:
+        """Return the extreme sample, requires at least one sample."""
+        return self._candidates[0][0]
+
+    @property
+    def age(self) -> datetime:
+        """Return the age of the oldest extreme sample."""
+        return self._candidates[0][1]
+
+
+class RunningCount(WindowTracker):
+    """Track the number of samples that are on for a binary source."""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self.count_on = 0
+
+    def sample_added(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Count the new sample if it is on."""
+        if states[-1]:
+            self.count_on += 1
+
+    def sample_removed(
+        self,
+        value: float,
+        age: datetime,
+        states: deque[float],
+        ages: deque[datetime],
+    ) -> None:
+        """Uncount the evicted sample if it was on."""
+        if value:
+            self.count_on -= 1
+
+
+class RunningSumOfDifferences(_ResyncingTracker):
+    """Track the sum of the differences between consecutive samples.
+
+    With nonnegative set, a decrease is treated as a reset to zero
+    and counts as the new value.
+    """
+
+    total: float
+
+    def __init__(self, nonnegative: bool) -> None:
+        """Initialize the tracker."""
+        self._nonnegative = nonnegative
+        super().__init__()
+
+    def _difference(self, previous: float, current: float) -> float:
+        """Return the difference between two consecutive samples."""
+        if self._nonnegative:
+            return current - previous if current >= previous else current
+        return abs(current - previous)
+
+    def resync(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Recompute the sum from the window."""
+        values = list(states)
+        self.total = math.fsum(
+            self._difference(previous, current)
+            for previous, current in zip(values, values[1:], strict=False)
+        )
+
+    def sample_added(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Add the difference to the previous sample."""
+        if len(states) >= 2:
+            self.total += self._difference(states[-2], states[-1])
+
+    def _remove(
+        self,
+        value: float,
+        age: datetime,
+        states: deque[float],
+        ages: deque[datetime],
+    ) -> None:
+        """Subtract the difference between the evicted and the oldest sample."""
+        if states:
+            self.total -= self._difference(value, states[0])
+
+
+class RunningArea(_ResyncingTracker):
+    """Track the area under the samples over time.
+
+    The area between two samples is interpolated linearly, or with linear
+    unset, the previous sample is held until the next one.
+    """
+
+    area: float
+
+    def __init__(self, linear: bool) -> None:
+        """Initialize the tracker."""
+        self._linear = linear
+        super().__init__()
+
+    def _segment(
+        self,
+        previous: float,
+        current: float,
+        previous_age: datetime,
+        current_age: datetime,
+    ) -> float:
+        """Return the area between two consecutive samples."""
+        seconds = (current_age - previous_age).total_seconds()
+        if self._linear:
+            return 0.5 * (current + previous) * seconds
+        return previous * seconds
+
+    def resync(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Recompute the area from the window."""
+        self.area = math.fsum(
+            self._segment(states[i - 1], states[i], ages[i - 1], ages[i])
+            for i in range(1, len(states))
+        )
+
+    def sample_added(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Add the segment to the previous sample."""
+        if len(states) >= 2:
+            self.area += self._segment(states[-2], states[-1], ages[-2], ages[-1])
+
+    def _remove(
+        self,
+        value: float,
+        age: datetime,
+        states: deque[float],
+        ages: deque[datetime],
+    ) -> None:
+        """Subtract the segment between the evicted and the oldest sample."""
+        if states:
+            self.area -= self._segment(value, states[0], age, ages[0])
+
+
+class RunningCircularMean(_ResyncingTracker):
+    """Track the sums of the sines and cosines of samples in degrees."""
+
+    _sin_sum: float
+    _cos_sum: float
+
+    def resync(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Recompute the sums from the window."""
+        self._sin_sum = math.fsum(math.sin(math.radians(x)) for x in states)
+        self._cos_sum = math.fsum(math.cos(math.radians(x)) for x in states)
+
+    def sample_added(self, states: deque[float], ages: deque[datetime]) -> None:
+        """Add the new sample to the sums."""
+        radians = math.radians(states[-1])
+        self._sin_sum += math.sin(radians)
+        self._cos_sum += math.cos(radians)
+
+    def _remove(
+        self,
+        value: float,
+        age: datetime,
+        states: deque[float],
+        ages: deque[datetime],
+    ) -> None:
+        """Subtract the evicted sample from the sums."""
+        radians = math.radians(value)
+        self._sin_sum -= math.sin(radians)
+        self._cos_sum -= math.cos(radians)
+
+    @property
+    def mean(self) -> float:
+        """Return the circular mean in degrees."""
+        return (math.degrees(math.atan2(self._sin_sum, self._cos_sum)) + 360) % 360
@@ -6,9 +6,9 @@ from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -54,6 +54,17 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .rolling_window import (
+    MonotonicExtreme,
+    RunningArea,
+    RunningCircularMean,
+    RunningCount,
+    RunningSum,
+    RunningSumOfDifferences,
+    RunningVariance,
+    SortedValues,
+    WindowTracker,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -180,6 +191,43 @@ STATS_BINARY_PERCENTAGE = {
     STAT_MEAN,
 }
 
+# Trackers which maintain the aggregate a characteristic is computed from
+# while samples are added and evicted, instead of recomputing it from the
+# whole buffer on every update
+STATS_NUMERIC_TRACKERS: dict[str, Callable[[], WindowTracker]] = {
+    STAT_AVERAGE_LINEAR: partial(RunningArea, linear=True),
+    STAT_AVERAGE_STEP: partial(RunningArea, linear=False),
+    STAT_AVERAGE_TIMELESS: RunningSum,
+    STAT_DATETIME_VALUE_MAX: partial(MonotonicExtreme, maximum=True),
+    STAT_DATETIME_VALUE_MIN: partial(MonotonicExtreme, maximum=False),
+    STAT_DISTANCE_95P: RunningVariance,
+    STAT_DISTANCE_99P: RunningVariance,
+    STAT_DISTANCE_ABSOLUTE: SortedValues,
+    STAT_MEAN: RunningSum,
+    STAT_MEAN_CIRCULAR: RunningCircularMean,
+    STAT_MEDIAN: SortedValues,
+    STAT_NOISINESS: partial(RunningSumOfDifferences, nonnegative=False),
+    STAT_PERCENTILE: SortedValues,
+    STAT_STANDARD_DEVIATION: RunningVariance,
+    STAT_SUM: RunningSum,
+    STAT_SUM_DIFFERENCES: partial(RunningSumOfDifferences, nonnegative=False),
+    STAT_SUM_DIFFERENCES_NONNEGATIVE: partial(
+        RunningSumOfDifferences, nonnegative=True
+    ),
+    STAT_TOTAL: RunningSum,
+    STAT_VALUE_MAX: partial(MonotonicExtreme, maximum=True),
+    STAT_VALUE_MIN: partial(MonotonicExtreme, maximum=False),
+    STAT_VARIANCE: RunningVariance,
+}
+
+STATS_BINARY_TRACKERS: dict[str, Callable[[], WindowTracker]] = {
+    STAT_AVERAGE_STEP: partial(RunningArea, linear=False),
+    STAT_AVERAGE_TIMELESS: RunningCount,
+    STAT_COUNT_BINARY_ON: RunningCount,
+    STAT_COUNT_BINARY_OFF: RunningCount,
+    STAT_MEAN: RunningCount,
+}
+
 CONF_STATE_CHARACTERISTIC = "state_characteristic"
 CONF_SAMPLES_MAX_BUFFER_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
@@ -324,6 +372,10 @@ class StatisticsSensor(SensorEntity):
         self._state_characteristic_fn: Callable[[], StateType | datetime] = (
             self._callable_characteristic_fn(self._state_characteristic)
         )
+        trackers = STATS_BINARY_TRACKERS if self.is_binary else STATS_NUMERIC_TRACKERS
+        self._tracker: WindowTracker | None = None
+        if tracker_factory := trackers.get(self._state_characteristic):
+            self._tracker = tracker_factory()
 
         self._update_listener: CALLBACK_TYPE | None = None
 
@@ -370,12 +422,18 @@ class StatisticsSensor(SensorEntity):
             return
 
         try:
+            value: float | bool
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
+                value = float(new_state.state)
+            if len(self.states) == self._samples_max_buffer_size:
+                self._remove_oldest_sample()
+            self.states.append(value)
             self.ages.append(new_state.last_updated)
+            if self._tracker is not None:
+                self._tracker.sample_added(self.states, self.ages)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -388,6 +446,13 @@ class StatisticsSensor(SensorEntity):
 
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
+    def _remove_oldest_sample(self) -> None:
+        """Remove the oldest sample from the buffer."""
+        value = self.states.popleft()
+        age = self.ages.popleft()
+        if self._tracker is not None:
+            self._tracker.sample_removed(value, age, self.states, self.ages)
+
     def _derive_unit_of_measurement(self, new_state: State) -> str | None:
         base_unit: str | None = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         unit: str | None
@@ -499,8 +564,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._remove_oldest_sample()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
@@ -654,25 +718,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
+            area = cast(RunningArea, self._tracker).area
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return area / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
+            area = cast(RunningArea, self._tracker).area
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return area / age_range_seconds
         return None
@@ -712,12 +765,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return cast(MonotonicExtreme, self._tracker).age
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return cast(MonotonicExtreme, self._tracker).age
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -731,25 +784,24 @@ class StatisticsSensor(SensorEntity):
         return None
 
     def _stat_distance_absolute(self) -> StateType:
-        if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+        if values := cast(SortedValues, self._tracker).values:
+            return values[-1] - values[0]
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return cast(RunningSum, self._tracker).total / len(self.states)
         return None
 
     def _stat_mean_circular(self) -> StateType:
         if len(self.states) > 0:
-            sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
-            cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
-            return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
+            return cast(RunningCircularMean, self._tracker).mean
         return None
 
     def _stat_median(self) -> StateType:
-        if len(self.states) > 0:
-            return statistics.median(self.states)
+        # The sorted values leave out NaN samples
+        if (tracker := cast(SortedValues, self._tracker)).values:
+            return tracker.median()
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -758,35 +810,28 @@ class StatisticsSensor(SensorEntity):
         return None
 
     def _stat_percentile(self) -> StateType:
-        if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+        if len((tracker := cast(SortedValues, self._tracker)).values) >= 2:
+            return tracker.percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return math.sqrt(cast(RunningVariance, self._tracker).variance)
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return cast(RunningSum, self._tracker).total
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                abs(j - i)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return cast(RunningSumOfDifferences, self._tracker).total
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return cast(RunningSumOfDifferences, self._tracker).total
         return None
 
     def _stat_total(self) -> StateType:
@@ -794,27 +839,24 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return cast(MonotonicExtreme, self._tracker).value
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return cast(MonotonicExtreme, self._tracker).value
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return cast(RunningVariance, self._tracker).variance
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
+            on_seconds = cast(RunningArea, self._tracker).area
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return 100 / age_range_seconds * on_seconds
         return None
@@ -826,10 +868,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return cast(RunningCount, self._tracker).count_on
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - cast(RunningCount, self._tracker).count_on
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -839,5 +881,6 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            count_on = cast(RunningCount, self._tracker).count_on
+            return 100.0 / len(self.states) * count_on
         return None
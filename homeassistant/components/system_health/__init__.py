@@ -65,7 +65,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
     await integration_platform.async_process_integration_platforms(
-        hass, DOMAIN, _register_system_health_platform
+        hass, DOMAIN, _register_system_health_platform, import_on_demand=True
     )
 
     return True
@@ -115,6 +115,7 @@ async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle an info request via a subscription."""
+    await integration_platform.async_load_integration_platforms(hass, DOMAIN)
     registrations: dict[str, SystemHealthRegistration] = hass.data[DOMAIN]
     data = {}
     pending_info: dict[tuple[str, str], asyncio.Task] = {}
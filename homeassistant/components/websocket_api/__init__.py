@@ -11,7 +11,15 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 
-from . import commands, connection, const, decorators, http, messages  # noqa: F401
+from . import (  # noqa: F401
+    chunked,
+    commands,
+    connection,
+    const,
+    decorators,
+    http,
+    messages,
+)
 from .connection import ActiveConnection, current_connection  # noqa: F401
 from .const import (  # noqa: F401
     ERR_HOME_ASSISTANT_ERROR,
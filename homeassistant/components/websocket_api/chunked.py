@@ -0,0 +1,106 @@
+"""Send the result of a query over a long time range in time slices."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime as dt, timedelta
+from typing import Any, Final
+
+from homeassistant.core import callback
+from homeassistant.helpers.json import json_bytes
+
+from . import const
+from .connection import ActiveConnection
+from .messages import event_message
+
+# The smallest time step of a recorded timestamp
+CHUNK_BOUNDARY_OVERLAP: Final = timedelta(microseconds=1)
+
+type ChunkFetcher = Callable[[dt, dt, dt | None], Awaitable[bytes]]
+
+
+def chunk_message(msg_id: int, message: dict[str, Any], cursor: dt | None) -> bytes:
+    """Generate a websocket event message for a chunk.
+
+    The cursor is the start_time to continue the query from if the
+    client has to resume it, or None for the last chunk.
+    """
+    message["cursor"] = cursor.isoformat() if cursor else None
+    return json_bytes(event_message(msg_id, message))
+
+
+@callback
+def async_send_empty_chunk(
+    connection: ActiveConnection, msg_id: int, message: dict[str, Any]
+) -> None:
+    """Send an empty last chunk when we know all results are filtered away."""
+    connection.send_result(msg_id)
+    connection.send_message(chunk_message(msg_id, message, None))
+
+
+async def async_send_chunks(
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    chunk_duration: timedelta,
+    fetch_chunk: ChunkFetcher,
+) -> None:
+    """Fetch the result one time slice at a time and send each as a chunk.
+
+    fetch_chunk is called with the start time, end time and cursor of
+    each slice and returns the message made with chunk_message. The next
+    slice is fetched while the previous one is written, but it is only
+    queued once the client received the previous one. At most one chunk
+    is waiting to be sent and one is being fetched, no matter how slowly
+    the client reads.
+
+    If a slice fails to be fetched, a last chunk with an error and the
+    cursor to resume the query from is sent instead, since the result
+    was already sent.
+    """
+    task = asyncio.current_task()
+
+    @callback
+    def _cancel() -> None:
+        """Stop sending chunks when the client unsubscribes or disconnects."""
+        if task:
+            task.cancel()
+
+    connection.subscriptions[msg_id] = _cancel
+    connection.send_result(msg_id)
+    chunk_start_time = chunk_end_time = start_time
+    try:
+        while True:
+            chunk_end_time = min(chunk_end_time + chunk_duration, end_time)
+            cursor: dt | None = None
+            if chunk_end_time < end_time:
+                # The queries exclude both the start and end time, so the next
+                # chunk starts just before this one ends to include rows
+                # recorded exactly at the boundary
+                cursor = chunk_end_time - CHUNK_BOUNDARY_OVERLAP
+            try:
+                chunk = await fetch_chunk(chunk_start_time, chunk_end_time, cursor)
+            except Exception:
+                connection.logger.exception("Error fetching chunk")
+                connection.send_message(
+                    chunk_message(
+                        msg_id,
+                        {
+                            "error": {
+                                "code": const.ERR_UNKNOWN_ERROR,
+                                "message": "Unknown error",
+                            }
+                        },
+                        chunk_start_time,
+                    )
+                )
+                break
+            await connection.async_wait_drained()
+            connection.send_message(chunk)
+            if cursor is None:
+                break
+            chunk_start_time = cursor
+    finally:
+        connection.subscriptions.pop(msg_id, None)
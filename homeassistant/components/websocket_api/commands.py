@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
 from functools import lru_cache, partial
 import json
 import logging
@@ -19,6 +20,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -55,7 +57,12 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.setup import (
+    async_get_loaded_integrations,
+    async_get_setup_timings,
+    async_get_setup_trace_events,
+)
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -63,6 +70,9 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+DATA_ENTITIES_SUBSCRIPTIONS: HassKey[_EntitiesSubscriptions] = HassKey(
+    "websocket_api_entities_subscriptions"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -82,6 +92,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_setup_timeline)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -363,28 +374,111 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str],
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+@dataclass(slots=True, eq=False)
+class _EntitiesSubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    send_message: Callable[[str | bytes | dict[str, Any]], None]
+    send_coalescable_message: Callable[[Hashable, bytes, Callable[[Any], bytes]], None]
+    entity_ids: set[str]
+    user: User
+    # Completes a message from cached_state_diff_message_without_id
+    message_id_suffix: bytes
+
+
+class _EntitiesSubscriptions:
+    """Fan out state changed events to the subscribe_entities subscriptions.
+
+    A single state changed listener serves the subscriptions of all
+    connections. Subscriptions to specific entities are indexed by
+    entity_id, and the state diff message of an event is serialized
+    once and shared by every subscription that receives it.
+
+    The messages are keyed by subscription and entity_id so a connection
+    that falls behind merges the pending changes of an entity into a
+    single message with its latest state.
+    """
+
+    __slots__ = ("_hass", "_all_entities", "_by_entity_id", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self._hass = hass
+        # Dicts are used as ordered sets
+        self._all_entities: dict[_EntitiesSubscription, None] = {}
+        self._by_entity_id: dict[str, dict[_EntitiesSubscription, None]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, subscription: _EntitiesSubscription) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        if subscription.entity_ids:
+            for entity_id in subscription.entity_ids:
+                self._by_entity_id.setdefault(entity_id, {})[subscription] = None
+        else:
+            self._all_entities[subscription] = None
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_entity_changes
+            )
+        return partial(self._async_remove, subscription)
+
+    @callback
+    def _async_remove(self, subscription: _EntitiesSubscription) -> None:
+        """Remove a subscription."""
+        if subscription.entity_ids:
+            for entity_id in subscription.entity_ids:
+                subscriptions = self._by_entity_id[entity_id]
+                del subscriptions[subscription]
+                if not subscriptions:
+                    del self._by_entity_id[entity_id]
+        else:
+            del self._all_entities[subscription]
+        if not self._all_entities and not self._by_entity_id and self._unsub:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_forward_entity_changes(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Forward entity state changed events to the subscribed websockets."""
+        entity_id = event.data["entity_id"]
+        by_entity_id = self._by_entity_id.get(entity_id)
+        if not by_entity_id and not self._all_entities:
+            return
+        # Copy the subscriptions since sending a message can close a
+        # connection, which removes its subscriptions
+        subscriptions = (*self._all_entities, *(by_entity_id or ()))
+        # The diff is serialized once and shared by all subscriptions
+        message_without_id = messages.cached_state_diff_message_without_id(event)
+        replacement = partial(_state_replace_message, event)
+        for subscription in subscriptions:
+            # We have to lookup the permissions again because the user might
+            # have changed since the subscription was created.
+            user = subscription.user
+            permissions = user.permissions
+            if (
+                not user.is_admin
+                and not permissions.access_all_entities(POLICY_READ)
+                and not permissions.check_entity(entity_id, POLICY_READ)
+            ):
+                continue
+            subscription.send_coalescable_message(
+                (subscription, entity_id),
+                message_without_id + subscription.message_id_suffix,
+                replacement,
+            )
+
+
+def _state_replace_message(
+    event: Event[EventStateChangedData], key: tuple[_EntitiesSubscription, str]
+) -> bytes:
+    """Return the message that replaces the pending messages of an entity."""
+    return (
+        messages.cached_state_replace_message_without_id(event)
+        + key[0].message_id_suffix
+    )
 
 
 @callback
@@ -403,16 +497,17 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    message_id_as_bytes = str(msg["id"]).encode()
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
+    if (entities_subscriptions := hass.data.get(DATA_ENTITIES_SUBSCRIPTIONS)) is None:
+        entities_subscriptions = _EntitiesSubscriptions(hass)
+        hass.data[DATA_ENTITIES_SUBSCRIPTIONS] = entities_subscriptions
+    connection.subscriptions[msg["id"]] = entities_subscriptions.async_add(
+        _EntitiesSubscription(
             connection.send_message,
+            connection.send_coalescable_message,
             entity_ids,
             connection.user,
-            message_id_as_bytes,
-        ),
+            b',"id":' + str(msg["id"]).encode() + b"}",
+        )
     )
     connection.send_result(msg["id"])
 
@@ -547,6 +642,18 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/setup_timeline"})
+def handle_integration_setup_timeline(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle setup timeline command."""
+    connection.send_result(
+        msg["id"],
+        {"traceEvents": async_get_setup_trace_events(hass), "displayTimeUnit": "ms"},
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
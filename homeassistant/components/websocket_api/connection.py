@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Awaitable, Callable, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -19,7 +19,7 @@ from . import const, messages
 from .util import describe_request
 
 if TYPE_CHECKING:
-    from .http import WebSocketAdapter
+    from .http import OutboundQueueMetrics, WebSocketAdapter
 
 
 current_connection = ContextVar["ActiveConnection | None"](
@@ -37,6 +37,9 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "send_coalescable_message",
+        "async_wait_drained",
+        "outbound_metrics",
         "user",
         "refresh_token_id",
         "subscriptions",
@@ -59,6 +62,17 @@ class ActiveConnection:
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # Replaced by the websocket handler with one that merges
+        # messages with the same key that are still queued
+        self.send_coalescable_message: Callable[
+            [Hashable, bytes, Callable[[Any], bytes]], None
+        ] = self._send_uncoalesced_message
+        # Replaced by the websocket handler with one that waits until the
+        # queued messages have been written to the client
+        self.async_wait_drained: Callable[[], Awaitable[None]] = self._async_drained
+        # Set by the websocket handler to the metrics of its outbound queue,
+        # including the messages that were coalesced
+        self.outbound_metrics: OutboundQueueMetrics | None = None
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
@@ -123,6 +137,16 @@ class ActiveConnection:
 
         return index + 1, unsub
 
+    @callback
+    def _send_uncoalesced_message(
+        self, key: Hashable, message: bytes, replacement: Callable[[Any], bytes]
+    ) -> None:
+        """Send a coalescable message without coalescing it."""
+        self.send_message(message)
+
+    async def _async_drained(self) -> None:
+        """Return right away since messages are not queued."""
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
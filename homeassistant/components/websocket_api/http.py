@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable, Iterable
+from dataclasses import dataclass
 import datetime as dt
 from functools import partial
 import logging
@@ -24,6 +25,7 @@ from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_COALESCE,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -63,6 +65,30 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+@dataclass(slots=True)
+class OutboundQueueMetrics:
+    """Metrics of the outbound message queue of a connection."""
+
+    # Highest number of messages waiting in the queue
+    peak_queue_depth: int = 0
+    # Messages merged into a message with the same key that was still queued
+    messages_coalesced: int = 0
+    # Messages handed to the websocket, coalesced messages count as one
+    messages_written: int = 0
+    bytes_written: int = 0
+
+
+class _CoalescedMessage:
+    """A queued message that can be replaced until it is written."""
+
+    __slots__ = ("key", "message")
+
+    def __init__(self, key: Hashable, message: bytes) -> None:
+        """Initialize the queued message."""
+        self.key = key
+        self.message = message
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -79,8 +105,11 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_coalesced_messages",
         "_ready_future",
         "_release_ready_queue_size",
+        "_drain_waiters",
+        "metrics",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -101,9 +130,16 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[bytes] = deque()
+        self._message_queue: deque[bytes | _CoalescedMessage] = deque()
+        # Queued messages that can still be replaced, by key. Their number
+        # is bounded by the keys, so they do not count towards the limits
+        # on pending messages.
+        self._coalesced_messages: dict[Hashable, _CoalescedMessage] = {}
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Futures resolved once the message queue is empty
+        self._drain_waiters: list[asyncio.Future[None]] = []
+        self.metrics = OutboundQueueMetrics()
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -129,6 +165,8 @@ class WebSocketHandler:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
         message_queue = self._message_queue
+        coalesced = self._coalesced_messages
+        metrics = self.metrics
         logger = self._logger
         wsock = self._wsock
         loop = self._loop
@@ -140,6 +178,8 @@ class WebSocketHandler:
         try:
             while not wsock.closed:
                 if not message_queue:
+                    if self._drain_waiters:
+                        self._release_drain_waiters()
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
 
@@ -151,16 +191,35 @@ class WebSocketHandler:
                     can_coalesce = self._connection and self._connection.can_coalesce
 
                 if not can_coalesce or ready_message_count == 1:
-                    message = message_queue.popleft()
+                    queued = message_queue.popleft()
+                    if isinstance(queued, _CoalescedMessage):
+                        del coalesced[queued.key]
+                        message = queued.message
+                    else:
+                        message = queued
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
+                    metrics.messages_written += 1
+                    metrics.bytes_written += len(message)
                     await send_bytes_text(message)
                     continue
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
+                if coalesced:
+                    messages: Iterable[bytes] = [
+                        queued.message
+                        if isinstance(queued, _CoalescedMessage)
+                        else queued
+                        for queued in message_queue
+                    ]
+                    coalesced.clear()
+                else:
+                    messages = message_queue  # type: ignore[assignment]
+                coalesced_messages = b"".join((b"[", b",".join(messages), b"]"))
                 message_queue.clear()
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
+                metrics.messages_written += 1
+                metrics.bytes_written += len(coalesced_messages)
                 await send_bytes_text(coalesced_messages)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
@@ -171,6 +230,28 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._release_drain_waiters()
+
+    @callback
+    def _release_drain_waiters(self) -> None:
+        """Release the callers waiting for the message queue to drain."""
+        waiters = self._drain_waiters
+        self._drain_waiters = []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _async_wait_drained(self) -> None:
+        """Wait until the queued messages have been written to the client.
+
+        Lets a sender of large messages keep at most one of them queued
+        instead of piling them up until the client is disconnected.
+        """
+        if self._closing or not self._message_queue:
+            return
+        waiter: asyncio.Future[None] = self._loop.create_future()
+        self._drain_waiters.append(waiter)
+        await waiter
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -200,7 +281,12 @@ class WebSocketHandler:
 
         message_queue = self._message_queue
         message_queue.append(message)
-        if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
+        queue_size_after_add = len(message_queue)
+        if queue_size_after_add > self.metrics.peak_queue_depth:
+            self.metrics.peak_queue_depth = queue_size_after_add
+        if (
+            pending_size := queue_size_after_add - len(self._coalesced_messages)
+        ) >= MAX_PENDING_MSG:
             self._logger.error(
                 (
                     "%s: Client unable to keep up with pending messages. Reached %s pending"
@@ -221,7 +307,7 @@ class WebSocketHandler:
 
         peak_checker_active = self._peak_checker_unsub is not None
 
-        if queue_size_after_add <= PENDING_MSG_PEAK:
+        if pending_size <= PENDING_MSG_PEAK:
             if peak_checker_active:
                 self._cancel_peak_checker()
             return
@@ -231,6 +317,45 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _send_coalescable_message(
+        self, key: Hashable, message: bytes, replacement: Callable[[Any], bytes]
+    ) -> None:
+        """Queue a message that can be merged with a queued message with the same key.
+
+        Once the client falls behind, the message is queued so that it is
+        replaced in place while it is still pending by the message that
+        replacement returns when called with the key, which must stand on its
+        own since the client never receives the message it replaces. Slow
+        clients therefore receive the latest message for each key instead of
+        being disconnected when the updates pile up.
+
+        Async friendly.
+        """
+        if self._closing:
+            return
+
+        coalesced = self._coalesced_messages
+        if (queued := coalesced.get(key)) is not None:
+            queued.message = replacement(key)
+            self.metrics.messages_coalesced += 1
+            return
+
+        message_queue = self._message_queue
+        if len(message_queue) < PENDING_MSG_COALESCE:
+            self._send_message(message)
+            return
+
+        message_queue.append(coalesced.setdefault(key, _CoalescedMessage(key, message)))
+        queue_size_after_add = len(message_queue)
+        if queue_size_after_add > self.metrics.peak_queue_depth:
+            self.metrics.peak_queue_depth = queue_size_after_add
+
+        if self._release_ready_queue_size == 0:
+            # Try to coalesce more messages to reduce the number of writes
+            self._release_ready_queue_size = queue_size_after_add
+            self._loop.call_soon(self._release_ready_future_or_reschedule)
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -262,7 +387,7 @@ class WebSocketHandler:
         """Check that we are no longer above the write peak."""
         self._peak_checker_unsub = None
 
-        if len(self._message_queue) < PENDING_MSG_PEAK:
+        if len(self._message_queue) - len(self._coalesced_messages) < PENDING_MSG_PEAK:
             return
 
         self._logger.error(
@@ -360,6 +485,9 @@ class WebSocketHandler:
             # We only start the writer queue after the auth phase is completed
             # since there is no need to queue messages before the auth phase
             self._connection = connection
+            connection.send_coalescable_message = self._send_coalescable_message
+            connection.async_wait_drained = self._async_wait_drained
+            connection.outbound_metrics = self.metrics
             self._writer_task = create_eager_task(self._writer(send_bytes_text))
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -482,6 +610,7 @@ class WebSocketHandler:
                         self._logger.warning(
                             "%s: Disconnected: %s", self.description, disconnect_warn
                         )
+                    debug("%s: Outbound queue %s", self.description, self.metrics)
 
                     if connection is not None:
                         hass.data[DATA_CONNECTIONS] -= 1
@@ -495,6 +624,7 @@ class WebSocketHandler:
                     self._hass = None  # type: ignore[assignment]
                     self._logger = None  # type: ignore[assignment]
                     self._message_queue = None  # type: ignore[assignment]
+                    self._coalesced_messages = None  # type: ignore[assignment]
                     self._handle_task = None
                     self._writer_task = None
                     self._ready_future = None
@@ -141,24 +141,47 @@ def _partial_cached_event_message(event: Event) -> bytes:
     )
 
 
-def cached_state_diff_message(
-    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
-) -> bytes:
-    """Return an event message.
+def cached_state_diff_message_without_id(event: Event[EventStateChangedData]) -> bytes:
+    """Return an event message without the id and the closing brace.
 
-    Serialize to json once per message.
+    Used to send the same event to many subscriptions, each
+    appending its own id and the closing brace.
+    """
+    return _partial_cached_state_diff_message(event)[:-1]
 
-    Since we can have many clients connected that are
-    all getting many of the same events (mostly state changed)
-    we can avoid serializing the same data for each connection.
+
+def cached_state_replace_message_without_id(
+    event: Event[EventStateChangedData],
+) -> bytes:
+    """Return an event message that replaces the entity state as a whole.
+
+    Unlike the diff, it does not depend on the previous state, so it can
+    stand in for any pending diffs of the entity that were not sent yet.
     """
-    return b"".join(
-        (
-            _partial_cached_state_diff_message(event)[:-1],
-            b',"id":',
-            message_id_as_bytes,
-            b"}",
+    return _partial_cached_state_replace_message(event)[:-1]
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_state_replace_message(
+    event: Event[EventStateChangedData],
+) -> bytes:
+    """Cache and serialize the event to json as an add or remove of the entity."""
+    if (new_state := event.data["new_state"]) is None or event.data[
+        "old_state"
+    ] is None:
+        return _partial_cached_state_diff_message(event)
+    return (
+        _message_to_json_bytes_or_none(
+            {
+                "type": "event",
+                "event": {
+                    ENTITY_EVENT_ADD: {
+                        new_state.entity_id: new_state.as_compressed_state
+                    }
+                },
+            }
         )
+        or INVALID_JSON_PARTIAL_MESSAGE
     )
 
 
@@ -166,8 +189,8 @@ def cached_state_diff_message(
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
 
-    The message is constructed without the id which
-    will be appended in cached_state_diff_message
+    The message is constructed without the id which each
+    subscription appends to cached_state_diff_message_without_id
     """
     return (
         _message_to_json_bytes_or_none(
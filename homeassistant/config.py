@@ -65,6 +65,7 @@ from .exceptions import ConfigValidationError, HomeAssistantError
 from .generated.currencies import HISTORIC_CURRENCIES
 from .helpers import config_validation as cv, issue_registry as ir
 from .helpers.entity_values import EntityValues
+from .helpers.storage import Store
 from .helpers.translation import async_get_exception_message
 from .helpers.typing import ConfigType
 from .loader import ComponentProtocol, Integration, IntegrationNotFound
@@ -73,7 +74,13 @@ from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
-from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml import (
+    SECRET_YAML,
+    Secrets,
+    YamlFileCache,
+    YamlTypeError,
+    load_yaml_dict,
+)
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -84,6 +91,13 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE: HassKey[EntityValues] = HassKey("hass_customize")
+DATA_YAML_FILE_CACHE: HassKey[YamlFileCache] = HassKey("yaml_file_cache")
+DATA_YAML_FILE_CACHE_STORE: HassKey[Store[dict[str, Any]]] = HassKey(
+    "yaml_file_cache_store"
+)
+YAML_FILE_CACHE_STORAGE_KEY = "core.yaml_file_cache"
+YAML_FILE_CACHE_STORAGE_VERSION = 1
+YAML_FILE_CACHE_SAVE_DELAY = 10
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
 SCRIPT_CONFIG_PATH = "scripts.yaml"
@@ -441,6 +455,42 @@ def _write_default_config(config_dir: str) -> bool:
     return True
 
 
+async def async_get_yaml_file_cache(hass: HomeAssistant) -> YamlFileCache:
+    """Return the cache of the parsed YAML configuration files.
+
+    The cache is stored, so the YAML files are only parsed again when they
+    change, also when Home Assistant is started.
+    """
+    if (yaml_cache := hass.data.get(DATA_YAML_FILE_CACHE)) is not None:
+        return yaml_cache
+    store = hass.data.setdefault(
+        DATA_YAML_FILE_CACHE_STORE,
+        Store(
+            hass,
+            YAML_FILE_CACHE_STORAGE_VERSION,
+            YAML_FILE_CACHE_STORAGE_KEY,
+            private=True,
+            atomic_writes=True,
+        ),
+    )
+    stored_files: dict[str, Any] | None = None
+    stored = await store.async_load()
+    # The files are parsed again after an update as parsing may change
+    if stored is not None and stored.get("version") == __version__:
+        stored_files = stored["files"]
+    return hass.data.setdefault(DATA_YAML_FILE_CACHE, YamlFileCache(stored_files))
+
+
+async def _async_save_yaml_file_cache(
+    hass: HomeAssistant, yaml_cache: YamlFileCache
+) -> None:
+    """Store the cache of the parsed YAML configuration files."""
+    files = await hass.loop.run_in_executor(None, yaml_cache.as_dict)
+    hass.data[DATA_YAML_FILE_CACHE_STORE].async_delay_save(
+        lambda: {"version": __version__, "files": files}, YAML_FILE_CACHE_SAVE_DELAY
+    )
+
+
 async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     """Load YAML from a Home Assistant configuration file.
 
@@ -448,6 +498,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     configuration by itself. Include package merge.
     """
     secrets = Secrets(Path(hass.config.config_dir))
+    yaml_cache = await async_get_yaml_file_cache(hass)
 
     # Not using async_add_executor_job because this is an internal method.
     try:
@@ -456,6 +507,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
             load_yaml_config_file,
             hass.config.path(YAML_CONFIG_FILE),
             secrets,
+            yaml_cache,
         )
     except HomeAssistantError as exc:
         if not (base_exc := exc.__cause__) or not isinstance(base_exc, MarkedYAMLError):
@@ -468,6 +520,9 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
             base_exc.problem_mark.name = _relpath(hass, base_exc.problem_mark.name)
         raise
 
+    if yaml_cache.changed:
+        await _async_save_yaml_file_cache(hass, yaml_cache)
+
     invalid_domains = []
     for key in config:
         try:
@@ -497,7 +552,9 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
 
 
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str,
+    secrets: Secrets | None = None,
+    yaml_cache: YamlFileCache | None = None,
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
@@ -506,7 +563,7 @@ def load_yaml_config_file(
     This method needs to run in an executor.
     """
     try:
-        conf_dict = load_yaml_dict(config_path, secrets)
+        conf_dict = load_yaml_dict(config_path, secrets, yaml_cache)
     except YamlTypeError as exc:
         msg = (
             f"The configuration file {os.path.basename(config_path)} "
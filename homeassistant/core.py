@@ -12,6 +12,7 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Hashable,
     Iterable,
     KeysView,
     Mapping,
@@ -1424,7 +1425,13 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_dispatch",
+        "_hass",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1433,6 +1440,12 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # The jobs to visit when an event type is fired, which are the
+        # listeners of the event type followed by the match all listeners.
+        # Rebuilt on the next fire after the listeners change.
+        self._dispatch: dict[
+            EventType[Any] | str, tuple[_FilterableJobType[Any], ...]
+        ] = {}
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1513,14 +1526,11 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
-        listeners = self._listeners.get(event_type, EMPTY_LIST)
-        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
-            match_all_listeners = self._match_all_listeners
-        else:
-            match_all_listeners = EMPTY_LIST
+        if (jobs := self._dispatch.get(event_type)) is None:
+            jobs = self._async_build_dispatch(event_type)
 
         event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
+        for job, event_filter in jobs:
             if event_filter is not None:
                 try:
                     if event_data is None or not event_filter(event_data):
@@ -1543,6 +1553,30 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    @callback
+    def _async_build_dispatch(
+        self, event_type: EventType[_DataT] | str
+    ) -> tuple[_FilterableJobType[Any], ...]:
+        """Build the jobs to visit when an event type is fired."""
+        listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            jobs = (*listeners, *self._match_all_listeners)
+        else:
+            jobs = tuple(listeners)
+        if listeners:
+            # Only event types with listeners are cached, so the cache
+            # does not grow with every event type that is fired
+            self._dispatch[event_type] = jobs
+        return jobs
+
+    @callback
+    def _async_invalidate_dispatch(self, event_type: EventType[_DataT] | str) -> None:
+        """Invalidate the jobs to visit after the listeners changed."""
+        if event_type == MATCH_ALL:
+            self._dispatch.clear()
+        else:
+            self._dispatch.pop(event_type, None)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1608,6 +1642,8 @@ class EventBus:
             # EVENT_STATE_CHANGED
             self._listeners[EVENT_STATE_REPORTED].append(filterable_job)
             self._listeners[EVENT_STATE_CHANGED].append(filterable_job)
+            self._async_invalidate_dispatch(EVENT_STATE_REPORTED)
+            self._async_invalidate_dispatch(EVENT_STATE_CHANGED)
             return functools.partial(
                 self._async_remove_multiple_listeners,
                 (EVENT_STATE_REPORTED, EVENT_STATE_CHANGED),
@@ -1633,6 +1669,7 @@ class EventBus:
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
         self._listeners[event_type].append(filterable_job)
+        self._async_invalidate_dispatch(event_type)
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
@@ -1714,6 +1751,7 @@ class EventBus:
         """
         try:
             self._listeners[event_type].remove(filterable_job)
+            self._async_invalidate_dispatch(event_type)
 
             # delete event_type list if empty
             if not self._listeners[event_type] and event_type != MATCH_ALL:
@@ -1989,6 +2027,157 @@ class State:
         )
 
 
+def _intern_attributes(
+    attributes: Mapping[str, Any] | None,
+    attributes_cache: dict[Hashable, ReadOnlyDict[str, Any]] | None,
+) -> ReadOnlyDict[str, Any]:
+    """Return a shared ReadOnlyDict for attributes already in the cache."""
+    if type(attributes) is not ReadOnlyDict:
+        attributes = ReadOnlyDict(attributes or {})
+    if attributes_cache is None:
+        return attributes
+    # The type is part of the key so 1, 1.0 and True are not shared
+    key = tuple((name, type(value), value) for name, value in attributes.items())
+    try:
+        return attributes_cache.setdefault(key, attributes)
+    except TypeError:
+        # Attributes with unhashable values are not shared
+        return attributes
+
+
+def _timestamp_from_dict_value(value: Any) -> float | None:
+    """Return a timestamp from a datetime or ISO string in a state dict."""
+    if isinstance(value, str):
+        value = dt_util.parse_datetime(value)
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    return None
+
+
+class CompactState(State):
+    """A compact version of State for states that are held on to.
+
+    The timestamps are stored as floats, the datetimes, the domain
+    and the object_id are only created when they are accessed.
+    States created with the same attributes cache share identical
+    attributes.
+    """
+
+    # No __slots__ as State has none: every instance keeps a __dict__,
+    # which the cached properties need to store their values, and the
+    # instances created in the same order share the keys of their dicts.
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        entity_id: str,
+        state: str,
+        attributes: ReadOnlyDict[str, Any],
+        last_changed_timestamp: float,
+        last_reported_timestamp: float,
+        last_updated_timestamp: float,
+        context: Context,
+    ) -> None:
+        """Initialize a new compact state."""
+        self.entity_id = entity_id
+        self.state = state
+        self.attributes = attributes
+        self.last_changed_timestamp = last_changed_timestamp
+        self.last_reported_timestamp = last_reported_timestamp
+        self.last_updated_timestamp = last_updated_timestamp
+        self.context = context
+        self.state_info = None
+
+    @cached_property  # type: ignore[override]
+    def domain(self) -> str:
+        """Domain of this state."""
+        return split_entity_id(self.entity_id)[0]
+
+    @cached_property  # type: ignore[override]
+    def object_id(self) -> str:
+        """Object id of this state."""
+        return split_entity_id(self.entity_id)[1]
+
+    @cached_property  # type: ignore[override]
+    def last_changed(self) -> datetime.datetime:
+        """Last changed datetime."""
+        return dt_util.utc_from_timestamp(self.last_changed_timestamp)
+
+    @cached_property  # type: ignore[override]
+    def last_reported(self) -> datetime.datetime:
+        """Last reported datetime."""
+        return dt_util.utc_from_timestamp(self.last_reported_timestamp)
+
+    @cached_property  # type: ignore[override]
+    def last_updated(self) -> datetime.datetime:
+        """Last updated datetime."""
+        return dt_util.utc_from_timestamp(self.last_updated_timestamp)
+
+    @classmethod
+    def from_state(
+        cls,
+        state: State,
+        attributes_cache: dict[Hashable, ReadOnlyDict[str, Any]] | None = None,
+    ) -> Self:
+        """Initialize a compact state from a state.
+
+        Async friendly.
+        """
+        return cls(
+            state.entity_id,
+            state.state,
+            _intern_attributes(state.attributes, attributes_cache),
+            state.last_changed_timestamp,
+            state.last_reported_timestamp,
+            state.last_updated_timestamp,
+            state.context,
+        )
+
+    @classmethod
+    def from_dict(
+        cls,
+        json_dict: dict[str, Any],
+        attributes_cache: dict[Hashable, ReadOnlyDict[str, Any]] | None = None,
+    ) -> Self | None:
+        """Initialize a compact state from a dict.
+
+        Async friendly.
+        """
+        if not (json_dict and "entity_id" in json_dict and "state" in json_dict):
+            return None
+
+        entity_id = json_dict["entity_id"]
+        if not valid_entity_id(entity_id):
+            raise InvalidEntityFormatError(
+                f"Invalid entity id encountered: {entity_id}. "
+                "Format should be <domain>.<object_id>"
+            )
+        state = str(json_dict["state"])
+        validate_state(state)
+
+        last_reported = (
+            _timestamp_from_dict_value(json_dict.get("last_reported")) or time.time()
+        )
+        last_updated = (
+            _timestamp_from_dict_value(json_dict.get("last_updated")) or last_reported
+        )
+        last_changed = (
+            _timestamp_from_dict_value(json_dict.get("last_changed")) or last_updated
+        )
+
+        if context := json_dict.get("context"):
+            context = Context(id=context.get("id"), user_id=context.get("user_id"))
+
+        return cls(
+            entity_id,
+            state,
+            _intern_attributes(json_dict.get("attributes"), attributes_cache),
+            last_changed,
+            last_reported,
+            last_updated,
+            context or Context(),
+        )
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
@@ -2241,7 +2430,6 @@ class StateMachine:
         This method must be run in the event loop.
         """
         new_state = str(new_state)
-        attributes = attributes or {}
         old_state = self._states_data.get(entity_id)
         if old_state is None:
             # If the state is missing, try to convert the entity_id to lowercase
@@ -2249,15 +2437,6 @@ class StateMachine:
             entity_id = entity_id.lower()
             old_state = self._states_data.get(entity_id)
 
-        if old_state is None:
-            same_state = False
-            same_attr = False
-            last_changed = None
-        else:
-            same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
-            last_changed = old_state.last_changed if same_state else None
-
         # It is much faster to convert a timestamp to a utc datetime object
         # than converting a utc datetime object to a timestamp since cpython
         # does not have a fast path for handling the UTC timezone and has to do
@@ -2273,6 +2452,98 @@ class StateMachine:
             timestamp = time.time()
         now = dt_util.utc_from_timestamp(timestamp)
 
+        self._async_set_state(
+            entity_id,
+            old_state,
+            new_state,
+            attributes or {},
+            force_update,
+            context,
+            state_info,
+            timestamp,
+            now,
+            old_state is None,
+        )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the states of many entities at once.
+
+        Each item of states is a tuple of the entity_id, the state and the
+        attributes, which are handled like in async_set.
+
+        All states are validated before any of them is set, so an invalid
+        state does not leave the batch half applied. The events that are
+        fired share one timestamp and one context.
+
+        This method must be run in the event loop.
+        """
+        states_data = self._states_data
+        writes: list[tuple[str, str, Mapping[str, Any]]] = []
+        for entity_id, new_state, attributes in states:
+            new_state = str(new_state)
+            validate_state(new_state)
+            if entity_id not in states_data:
+                entity_id = entity_id.lower()
+                if entity_id not in states_data and not valid_entity_id(entity_id):
+                    raise InvalidEntityFormatError(
+                        f"Invalid entity id encountered: {entity_id}. "
+                        "Format should be <domain>.<object_id>"
+                    )
+            writes.append((entity_id, new_state, attributes or {}))
+
+        timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+        for entity_id, new_state, attributes in writes:
+            # The same entity may be set more than once in a batch
+            # so the old state is looked up as the states are set
+            self._async_set_state(
+                entity_id,
+                states_data.get(entity_id),
+                new_state,
+                attributes,
+                force_update,
+                context,
+                None,
+                timestamp,
+                now,
+                False,
+            )
+
+    @callback
+    def _async_set_state(
+        self,
+        entity_id: str,
+        old_state: State | None,
+        new_state: str,
+        attributes: Mapping[str, Any],
+        force_update: bool,
+        context: Context | None,
+        state_info: StateInfo | None,
+        timestamp: float,
+        now: datetime.datetime,
+        validate_entity_id: bool,
+    ) -> None:
+        """Set the state of an entity once the entity_id was resolved.
+
+        This method must be run in the event loop.
+        """
+        if old_state is None:
+            same_state = False
+            same_attr = False
+            last_changed = None
+        else:
+            same_state = old_state.state == new_state and not force_update
+            same_attr = old_state.attributes == attributes
+            last_changed = old_state.last_changed if same_state else None
+
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
@@ -2308,7 +2579,7 @@ class StateMachine:
             now,
             now,
             context,
-            old_state is None,
+            validate_entity_id,
             state_info,
             timestamp,
         )
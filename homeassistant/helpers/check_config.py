@@ -14,6 +14,7 @@ from homeassistant import loader
 from homeassistant.config import (  # type: ignore[attr-defined]
     CONF_PACKAGES,
     CORE_CONFIG_SCHEMA,
+    DATA_YAML_FILE_CACHE,
     YAML_CONFIG_FILE,
     config_per_platform,
     extract_domain_configs,
@@ -146,10 +147,13 @@ async def async_check_ha_config_file(  # noqa: C901
         if not await hass.async_add_executor_job(os.path.isfile, config_path):
             return result.add_error("File configuration.yaml not found.")
 
+        # Only the running instance uses the YAML file cache, the
+        # check_config script tracks the files and secrets it loads
         config = await hass.async_add_executor_job(
             load_yaml_config_file,
             config_path,
             yaml_loader.Secrets(Path(hass.config.config_dir)),
+            hass.data.get(DATA_YAML_FILE_CACHE),
         )
     except FileNotFoundError:
         return result.add_error(f"File not found: {config_path}")
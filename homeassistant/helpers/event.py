@@ -1913,11 +1913,19 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    new_state = event.data["new_state"]
+    old_state = event.data["old_state"]
 
     if info.filter(entity_id):
-        return True
+        # Skip changes of fields the template did not read, like
+        # attributes that update frequently
+        return (
+            new_state is None
+            or old_state is None
+            or info.read_fields_changed(entity_id, old_state, new_state)
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import partial
 import logging
 from types import ModuleType
@@ -36,6 +36,11 @@ class IntegrationPlatform:
     platform_name: str
     process_job: HassJob[[HomeAssistant, str, Any], Awaitable[None] | None]
     seen_components: set[str]
+    # Components whose platform has not been imported yet because the
+    # platform is only imported on first use. None when the platform is
+    # imported as soon as the component is loaded.
+    pending_components: set[str] | None = None
+    load_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
 
 @callback
@@ -55,6 +60,9 @@ def _async_integration_platform_component_loaded(
         if component_name in integration_platform.seen_components:
             continue
         integration_platform.seen_components.add(component_name)
+        if (pending := integration_platform.pending_components) is not None:
+            pending.add(component_name)
+            continue
         integration_platforms_by_name[integration_platform.platform_name] = (
             integration_platform
         )
@@ -160,8 +168,14 @@ async def async_process_integration_platforms(
     # Any = platform.
     process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None] | None],
     wait_for_platforms: bool = False,
+    import_on_demand: bool = False,
 ) -> None:
-    """Process a specific platform for all current and future loaded integrations."""
+    """Process a specific platform for all current and future loaded integrations.
+
+    If import_on_demand is set, the platform is not imported when the
+    integration is loaded. Instead, it is imported and processed when
+    async_load_integration_platforms is called before the platforms are used.
+    """
     if DATA_INTEGRATION_PLATFORMS not in hass.data:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS] = []
         hass.bus.async_listen(
@@ -175,7 +189,6 @@ async def async_process_integration_platforms(
     else:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS]
 
-    async_register_preload_platform(hass, platform_name)
     top_level_components = hass.config.top_level_components.copy()
     process_job = HassJob(
         catch_log_exception(
@@ -184,6 +197,17 @@ async def async_process_integration_platforms(
         ),
         f"process_platform {platform_name}",
     )
+    if import_on_demand:
+        integration_platforms.append(
+            IntegrationPlatform(
+                platform_name,
+                process_job,
+                top_level_components,
+                top_level_components.copy(),
+            )
+        )
+        return
+
     integration_platform = IntegrationPlatform(
         platform_name, process_job, top_level_components
     )
@@ -218,6 +242,31 @@ async def async_process_integration_platforms(
         await future
 
 
+async def async_load_integration_platforms(
+    hass: HomeAssistant, platform_name: str
+) -> None:
+    """Import and process a platform that is imported on demand.
+
+    The platform is only imported for the integrations that were loaded
+    since the last call.
+    """
+    for integration_platform in hass.data.get(DATA_INTEGRATION_PLATFORMS, ()):
+        if integration_platform.platform_name != platform_name or (
+            not integration_platform.pending_components
+            and not integration_platform.load_lock.locked()
+        ):
+            continue
+        async with integration_platform.load_lock:
+            pending_components = integration_platform.pending_components
+            if not pending_components:
+                continue
+            components = pending_components.copy()
+            pending_components.clear()
+            await _async_process_integration_platforms(
+                hass, platform_name, components, integration_platform.process_job
+            )
+
+
 async def _async_process_integration_platforms(
     hass: HomeAssistant,
     platform_name: str,
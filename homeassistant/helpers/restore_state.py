@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Hashable
 from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
 
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
+from homeassistant.core import (
+    CompactState,
+    HomeAssistant,
+    State,
+    callback,
+    valid_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import json_loads
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import start
 from .entity import Entity
@@ -82,7 +90,11 @@ class StoredState:
         }
 
     @classmethod
-    def from_dict(cls, json_dict: dict) -> Self:
+    def from_dict(
+        cls,
+        json_dict: dict,
+        attributes_cache: dict[Hashable, ReadOnlyDict[str, Any]] | None = None,
+    ) -> Self:
         """Initialize a stored state from a dict."""
         extra_data_dict = json_dict.get("extra_data")
         extra_data = RestoredExtraData(extra_data_dict) if extra_data_dict else None
@@ -92,7 +104,9 @@ class StoredState:
             last_seen = dt_util.parse_datetime(last_seen)
 
         return cls(
-            cast(State, State.from_dict(json_dict["state"])), extra_data, last_seen
+            cast(State, CompactState.from_dict(json_dict["state"], attributes_cache)),
+            extra_data,
+            last_seen,
         )
 
 
@@ -163,8 +177,12 @@ class RestoreStateData:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
         else:
+            # Restored states with identical attributes share them
+            attributes_cache: dict[Hashable, ReadOnlyDict[str, Any]] = {}
             self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+                item["state"]["entity_id"]: StoredState.from_dict(
+                    item, attributes_cache
+                )
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
@@ -275,7 +293,7 @@ class RestoreStateData:
         # To fully mimic all the attribute data types when loaded from storage,
         # we're going to serialize it to JSON and then re-load it.
         if state is not None:
-            state = State.from_dict(json_loads(state.as_dict_json))  # type: ignore[arg-type]
+            state = CompactState.from_dict(json_loads(state.as_dict_json))  # type: ignore[arg-type]
         if state is not None:
             self.last_states[entity_id] = StoredState(
                 state, extra_data, dt_util.utcnow()
@@ -7,6 +7,7 @@ from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 from functools import cached_property
+from hashlib import sha1
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
@@ -33,6 +34,7 @@ from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -48,6 +50,8 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -226,6 +230,220 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+class _StoreJournal:
+    """Append the changes of a store to a journal next to its snapshot.
+
+    The journal starts with a header naming the generation of the snapshot
+    it applies to, followed by one line with the changes of every write.
+    Lists are compared item by item so changing a single registry entry only
+    appends that entry. When the journal grows larger than the snapshot, the
+    snapshot is rewritten with a new generation and the journal is removed.
+    """
+
+    def __init__(self, private: bool, fsync: bool) -> None:
+        """Initialize the journal."""
+        self._private = private
+        self._fsync = fsync
+        self._generation: str | None = None
+        self._version: tuple[int, int] | None = None
+        self._digests: dict[str | None, Any] | None = None
+        self._snapshot_size = 0
+        self._journal_size = 0
+
+    @staticmethod
+    def path(path: str) -> str:
+        """Return the journal path for a snapshot path."""
+        return f"{path}{JOURNAL_SUFFIX}"
+
+    def load(self, path: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the journal of a snapshot to the loaded data.
+
+        The next write appends to the journal if it could be read completely,
+        otherwise it writes a new snapshot.
+        """
+        self._digests = None
+        self._journal_size = 0
+        self._generation = generation = data.pop("journal_generation", None)
+        try:
+            with open(self.path(path), "rb") as fdesc:
+                journal = fdesc.read()
+        except FileNotFoundError:
+            journal = b""
+        lines = journal.splitlines()
+        try:
+            header = json_util.json_loads(lines[0]) if lines else None
+        except ValueError:
+            header = None
+        if lines and (
+            not isinstance(header, dict)
+            or generation is None
+            or header.get("generation") != generation
+        ):
+            # The snapshot was rewritten before the stale journal was removed
+            _LOGGER.debug("Ignoring stale journal for %s", path)
+            return data
+        for line in lines[1:]:
+            try:
+                changes = json_util.json_loads(line)
+            except ValueError:
+                # An incomplete line is left behind by an interrupted write
+                _LOGGER.warning("Ignoring incomplete journal entry for %s", path)
+                return data
+            data["data"] = _apply_journal_changes(data["data"], changes)
+        if generation is not None and isinstance(data["data"], (dict, list)):
+            self._version = (data["version"], data.get("minor_version", 1))
+            self._snapshot_size = os.path.getsize(path)
+            self._journal_size = len(journal)
+            self._digests = _diff_journal_data({}, data["data"])[1]
+        return data
+
+    @property
+    def has_changes(self) -> bool:
+        """Return if the snapshot is outdated without the journal."""
+        return self._journal_size > 0
+
+    def compact(self, path: str) -> None:
+        """Rewrite the snapshot with the changes in the journal applied."""
+        if not self._journal_size or not (data := json_util.load_json(path)):
+            return
+        data = self.load(path, data)
+        self.start_snapshot(data)
+        json_helper.save_json(path, data, self._private, atomic_writes=self._fsync)
+        self.finish_snapshot(path, data)
+
+    def append(self, path: str, data: dict[str, Any]) -> bool:
+        """Append the changes to the journal.
+
+        Returns False if a new snapshot has to be written instead.
+        """
+        if (
+            self._digests is None
+            or self._version != (data["version"], data["minor_version"])
+            or not isinstance(data["data"], (dict, list))
+            or isinstance(data["data"], list) is not (None in self._digests)
+        ):
+            return False
+        try:
+            changes, digests = _diff_journal_data(self._digests, data["data"])
+            if not changes:
+                return True
+            line = json_helper.json_bytes(changes) + b"\n"
+        except TypeError:
+            return False
+        if not self._journal_size:
+            header = json_helper.json_bytes({"generation": self._generation})
+            line = header + b"\n" + line
+        if self._journal_size + len(line) > self._snapshot_size:
+            return False
+        try:
+            fd = os.open(
+                self.path(path),
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                if not self._journal_size:
+                    os.ftruncate(fd, 0)
+                if os.write(fd, line) != len(line):
+                    raise OSError("Incomplete write")
+                if self._fsync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as err:
+            _LOGGER.warning("Error appending to journal for %s: %s", path, err)
+            self._digests = None
+            return False
+        self._digests = digests
+        self._journal_size += len(line)
+        return True
+
+    def start_snapshot(self, data: dict[str, Any]) -> None:
+        """Start a new generation for a snapshot that is about to be written."""
+        self._digests = None
+        self._generation = ulid_now()
+        data["journal_generation"] = self._generation
+
+    def finish_snapshot(self, path: str, data: dict[str, Any]) -> None:
+        """Remove the journal of the previous snapshot once it is written."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.path(path))
+        self._version = (data["version"], data["minor_version"])
+        self._snapshot_size = os.path.getsize(path)
+        self._journal_size = 0
+        if isinstance(data["data"], (dict, list)):
+            self._digests = _diff_journal_data({}, data["data"])[1]
+
+
+def _journal_digest(value: Any) -> bytes:
+    """Return the digest of a JSON value."""
+    return sha1(json_helper.json_bytes(value)).digest()
+
+
+def _diff_journal_data(
+    old_digests: dict[str | None, Any], data: dict[str, Any] | list[Any]
+) -> tuple[list[list[Any]], dict[str | None, Any]]:
+    """Return the changes since the previous write and the new digests."""
+    changes: list[list[Any]] = []
+    digests: dict[str | None, Any] = {}
+    values: Mapping[str | None, Any] = {None: data} if isinstance(data, list) else data
+    for key, value in values.items():
+        old = old_digests.get(key)
+        if not isinstance(value, list):
+            digests[key] = digest = _journal_digest(value)
+            if digest != old:
+                changes.append(["set", key, value])
+            continue
+        digests[key] = new = [_journal_digest(item) for item in value]
+        if not isinstance(old, list):
+            changes.append(["set", key, value])
+        elif len(old) == len(new):
+            changes.extend(
+                ["splice", key, idx, 1, [value[idx]]]
+                for idx, (old_digest, new_digest) in enumerate(
+                    zip(old, new, strict=True)
+                )
+                if old_digest != new_digest
+            )
+        else:
+            # Items were added or removed, write the range between the
+            # unchanged items at the start and the end of the list
+            shortest = min(len(old), len(new))
+            start = 0
+            while start < shortest and old[start] == new[start]:
+                start += 1
+            end = 0
+            while end < shortest - start and old[-end - 1] == new[-end - 1]:
+                end += 1
+            changes.append(
+                [
+                    "splice",
+                    key,
+                    start,
+                    len(old) - start - end,
+                    value[start : len(value) - end],
+                ]
+            )
+    changes.extend(["del", key] for key in old_digests if key not in digests)
+    return changes, digests
+
+
+def _apply_journal_changes(data: Any, changes: list[list[Any]]) -> Any:
+    """Apply changes from a journal line to the data."""
+    for change in changes:
+        match change:
+            case ["set", None, value]:
+                data = value
+            case ["set", key, value]:
+                data[key] = value
+            case ["del", key]:
+                data.pop(key, None)
+            case ["splice", key, start, count, items]:
+                target = data if key is None else data[key]
+                target[start : start + count] = items
+    return data
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -241,8 +459,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With journal enabled, writes append the changes since the previous
+        write to a journal instead of rewriting the whole file.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,6 +481,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = (
+            _StoreJournal(private, atomic_writes)
+            if journal and (encoder is None or encoder is JSONEncoder)
+            else None
+        )
 
     @cached_property
     def path(self):
@@ -325,6 +553,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal is not None:
+                data = await self._async_load_journal(data)
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -386,6 +616,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
             if data == {}:
                 return None
+            if self._journal is not None:
+                data = await self._async_load_journal(data)
 
         # Add minor_version if not set
         if "minor_version" not in data:
@@ -420,6 +652,19 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         return stored
 
+    async def _async_load_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the journal to the loaded data."""
+        assert self._journal is not None
+        # The journal continues from the loaded data, which must not
+        # change while it is loaded
+        async with self._write_lock:
+            data = await self.hass.async_add_executor_job(
+                self._journal.load, self.path, data
+            )
+        if self._journal.has_changes:
+            self._async_ensure_final_write_listener()
+        return data
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -518,6 +763,17 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
         await self._async_handle_write_data()
+        if self._journal is None or self._read_only:
+            return
+        # Fold the journal into the snapshot, so the snapshot is
+        # complete without the journal after a clean shutdown
+        async with self._write_lock:
+            try:
+                await self.hass.async_add_executor_job(
+                    self._journal.compact, self.path
+                )
+            except (HomeAssistantError, OSError) as err:
+                _LOGGER.error("Error compacting journal for %s: %s", self.key, err)
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
@@ -541,6 +797,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if (
+                self._journal is not None
+                and self._journal.has_changes
+                and self.hass.state is not CoreState.final_write
+            ):
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -551,6 +814,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if (journal := self._journal) is not None:
+            # The final write compacts the journal into a new snapshot
+            if self.hass.state is not CoreState.final_write and journal.append(
+                path, data
+            ):
+                _LOGGER.debug("Appended changes for %s to journal", self.key)
+                return
+            journal.start_snapshot(data)
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -559,6 +831,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if journal is not None:
+            journal.finish_snapshot(path, data)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -572,3 +846,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal is not None:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, self._journal.path(self.path)
+                )
@@ -13,8 +13,9 @@ from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
 import json
 import logging
+import marshal
 import math
-from operator import contains
+from operator import attrgetter, contains
 import pathlib
 import random
 import re
@@ -39,6 +40,7 @@ import voluptuous as vol
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_PERSONS,
@@ -110,15 +112,34 @@ _RESERVED_NAMES = {
     "jinja_pass_arg",
 }
 
-_COLLECTABLE_STATE_ATTRIBUTES = {
-    "state",
-    "attributes",
-    "last_changed",
-    "last_updated",
-    "context",
-    "domain",
-    "object_id",
-    "name",
+# Fields of a state that are recorded in RenderInfo.entity_fields when read.
+# A single attribute is recorded as STATE_FIELD_ATTRIBUTE_PREFIX + its name,
+# STATE_FIELD_ALL is recorded when the template may depend on any field.
+STATE_FIELD_ALL = "*"
+STATE_FIELD_ATTRIBUTE_PREFIX = "attributes."
+_STATE_FIELD_GETTERS: dict[str, Callable[[State], Any]] = {
+    field: attrgetter(field)
+    for field in (
+        "state",
+        "attributes",
+        "last_changed",
+        "last_updated",
+        "last_reported",
+        "context",
+    )
+}
+
+# The field each collectable property reads, domain and object_id
+# never change for an entity so reading them records no field
+_COLLECTABLE_STATE_ATTRIBUTES: dict[str, str | None] = {
+    "state": "state",
+    "attributes": "attributes",
+    "last_changed": "last_changed",
+    "last_updated": "last_updated",
+    "context": "context",
+    "domain": None,
+    "object_id": None,
+    "name": STATE_FIELD_ATTRIBUTE_PREFIX + ATTR_FRIENDLY_NAME,
 }
 
 ALL_STATES_RATE_LIMIT = 60  # seconds
@@ -149,10 +170,25 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+#
+# The same template strings appear many times across template entities,
+# automations and blueprints. The per environment template_cache only shares
+# the compiled code while a Template still references it, so the marshaled
+# code is also kept in a process wide LRU cache that outlives the Template
+# instances and saves compiling them again when they are recreated, for
+# example on reload.
+#
+COMPILED_TEMPLATE_CODE_CACHE_SIZE = 4096
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
+# Keyed by template source and the hass, limited and strict flags
+# of the environment the code was compiled for
+COMPILED_TEMPLATE_CODE_LRU: LRU[tuple[str, bool, bool, bool], bytes] = LRU(
+    COMPILED_TEMPLATE_CODE_CACHE_SIZE
+)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
 ORJSON_PASSTHROUGH_OPTIONS = (
@@ -372,6 +408,7 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_fields",
         "rate_limit",
         "has_time",
     )
@@ -390,6 +427,9 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # The fields read of the entities in entities, entities missing
+        # here may depend on any field
+        self.entity_fields: dict[str, collections.abc.Set[str]] = {}
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -402,6 +442,7 @@ class RenderInfo:
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
             f" entities={self.entities}"
+            f" entity_fields={self.entity_fields}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
             f" exception={self.exception}"
@@ -432,6 +473,31 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def read_fields_changed(
+        self, entity_id: str, old_state: State, new_state: State
+    ) -> bool:
+        """Return if a state change touches a field the template read.
+
+        Entities matched by domain or all states are iterated without
+        recording the fields, so any change of them counts.
+        """
+        if (
+            self.all_states
+            or self.exception
+            or (fields := self.entity_fields.get(entity_id)) is None
+            or (self.domains and split_entity_id(entity_id)[0] in self.domains)
+        ):
+            return True
+        for field in fields:
+            if (getter := _STATE_FIELD_GETTERS.get(field)) is not None:
+                if getter(old_state) != getter(new_state):
+                    return True
+                continue
+            name = field[len(STATE_FIELD_ATTRIBUTE_PREFIX) :]
+            if old_state.attributes.get(name) != new_state.attributes.get(name):
+                return True
+        return False
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -445,6 +511,11 @@ class RenderInfo:
 
     def _freeze_sets(self) -> None:
         self.entities = frozenset(self.entities)
+        self.entity_fields = {
+            entity_id: frozenset(fields)
+            for entity_id, fields in self.entity_fields.items()
+            if STATE_FIELD_ALL not in fields
+        }
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
@@ -1004,9 +1075,9 @@ class TemplateStateBase(State):
         self._collect = collect
         self._entity_id = entity_id
 
-    def _collect_state(self) -> None:
+    def _collect_state(self, field: str | None = STATE_FIELD_ALL) -> None:
         if self._collect and (render_info := _render_info.get()):
-            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            _collect_render_info_field(render_info, self._entity_id, field)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
@@ -1015,7 +1086,9 @@ class TemplateStateBase(State):
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                _collect_render_info_field(
+                    render_info, self._entity_id, _COLLECTABLE_STATE_ATTRIBUTES[item]
+                )
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1034,55 +1107,55 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state("state")
         return self._state.state
 
     @property
     def attributes(self) -> ReadOnlyDict[str, Any]:  # type: ignore[override]
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_state("attributes")
         return self._state.attributes
 
     @property
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state("last_changed")
         return self._state.last_changed
 
     @property
     def last_reported(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_reported."""
-        self._collect_state()
+        self._collect_state("last_reported")
         return self._state.last_reported
 
     @property
     def last_updated(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state("last_updated")
         return self._state.last_updated
 
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_state("context")
         return self._state.context
 
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state(None)
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state(None)
         return self._state.object_id
 
     @property
     def name(self) -> str:
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state(STATE_FIELD_ATTRIBUTE_PREFIX + ATTR_FRIENDLY_NAME)
         return self._state.name
 
     @property
@@ -1099,7 +1172,8 @@ class TemplateStateBase(State):
             async_rounded_state,
         )
 
-        self._collect_state()
+        self._collect_state("state")
+        self._collect_state("attributes")
         if rounded and self._state.domain == SENSOR_DOMAIN:
             state = async_rounded_state(self._hass, self._entity_id, self._state)
         else:
@@ -1113,6 +1187,11 @@ class TemplateStateBase(State):
         self._collect_state()
         return self._state.__eq__(other)
 
+    def _get_attribute(self, name: str) -> Any:
+        """Return an attribute, only collecting that attribute."""
+        self._collect_state(STATE_FIELD_ATTRIBUTE_PREFIX + name)
+        return self._state.attributes.get(name)
+
 
 class TemplateState(TemplateStateBase):
     """Class to represent a state object in a template."""
@@ -1156,7 +1235,19 @@ _create_template_state_no_collect = partial(TemplateState, collect=False)
 
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := _render_info.get()) is not None:
-        entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
+        _collect_render_info_field(entity_collect, entity_id, STATE_FIELD_ALL)
+
+
+def _collect_render_info_field(
+    render_info: RenderInfo, entity_id: str, field: str | None
+) -> None:
+    """Record that the template read a field of an entity."""
+    render_info.entities.add(entity_id)  # type: ignore[attr-defined]
+    fields = render_info.entity_fields.get(entity_id)
+    if fields is None:
+        fields = render_info.entity_fields[entity_id] = set()
+    if field is not None:
+        fields.add(field)  # type: ignore[attr-defined]
 
 
 def _state_generator(
@@ -1837,7 +1928,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._get_attribute(name)  # noqa: SLF001
     return None
 
 
@@ -2758,6 +2849,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self._compiled_code_flags = (hass is not None, bool(limited), bool(strict))
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3111,7 +3203,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if type(source) is not str:  # noqa: E721
+            compiled = super().compile(source)
+        elif (
+            marshaled := COMPILED_TEMPLATE_CODE_LRU.get(
+                cache_key := (source, *self._compiled_code_flags)
+            )
+        ) is not None:
+            compiled = marshal.loads(marshaled)
+        else:
+            compiled = super().compile(source)
+            COMPILED_TEMPLATE_CODE_LRU[cache_key] = marshal.dumps(compiled)
         self.template_cache[source] = compiled
         return compiled
 
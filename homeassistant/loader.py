@@ -29,7 +29,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -49,6 +49,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -64,10 +65,12 @@ _LOGGER = logging.getLogger(__name__)
 #
 # This list can be extended by calling async_register_preload_platform
 #
+# Platforms that are rarely used at runtime, like diagnostics and
+# system_health, are not preloaded and are imported on first use instead.
+#
 BASE_PRELOAD_PLATFORMS = [
     "config",
     "config_flow",
-    "diagnostics",
     "energy",
     "group",
     "logbook",
@@ -76,7 +79,6 @@ BASE_PRELOAD_PLATFORMS = [
     "media_source",
     "recorder",
     "repairs",
-    "system_health",
     "trigger",
 ]
 
@@ -115,6 +117,10 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_CACHE: HassKey[IntegrationManifestCache] = HassKey("manifest_cache")
+MANIFEST_CACHE_STORAGE_KEY = "core.integration_manifests"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 60
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -245,6 +251,176 @@ class Manifest(TypedDict, total=False):
     single_config_entry: bool
 
 
+class CachedIntegration(TypedDict):
+    """An integration in the manifest cache."""
+
+    file_path: str
+    # The modification time and size of the manifest.json file and
+    # the modification time of the integration directory
+    stat: list[int]
+    manifest: Manifest
+    top_level_files: list[str] | None
+    all_dependencies: list[str] | None
+
+
+class IntegrationManifestCache:
+    """Cache of the manifests and dependencies of the loaded integrations.
+
+    A cached manifest is used instead of reading the manifest.json file and
+    listing the integration directory when the files did not change since the
+    cache was saved. Since a changed manifest can change the dependencies of
+    other integrations, the cached dependencies are only used when no cached
+    manifest changed and the same custom integrations are installed.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: Store[dict[str, Any]]) -> None:
+        """Initialize the manifest cache."""
+        self._hass = hass
+        self._store = store
+        self._integrations: dict[str, CachedIntegration] = {}
+        self._custom_components: list[str] | None = None
+        self._loaded_data: dict[str, Any] | None = None
+        self.dependencies_valid = False
+        self.hits = 0
+        self.misses = 0
+
+    def validate(self, data: dict[str, Any] | None) -> None:
+        """Keep the cached integrations which did not change.
+
+        This method must be run in the executor.
+        """
+        if not data or data.get("ha_version") != __version__:
+            return
+        self._loaded_data = data
+        dependencies_valid = True
+        for pkg_path, cached in data["integrations"].items():
+            if _stat_integration(pathlib.Path(cached["file_path"])) == cached["stat"]:
+                self._integrations[pkg_path] = cached
+            else:
+                dependencies_valid = False
+        self._custom_components = data["custom_components"]
+        self.dependencies_valid = dependencies_valid
+
+    def get(self, pkg_path: str, file_path: pathlib.Path) -> CachedIntegration | None:
+        """Return a cached integration."""
+        cached = self._integrations.get(pkg_path)
+        if cached is None or cached["file_path"] != str(file_path):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return cached
+
+    def add(
+        self,
+        pkg_path: str,
+        file_path: pathlib.Path,
+        stat: list[int],
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Add an integration which was read from the manifest.json file."""
+        if pkg_path in self._integrations:
+            # The integration was resolved from another directory
+            self.dependencies_valid = False
+        self._integrations[pkg_path] = {
+            "file_path": str(file_path),
+            "stat": stat,
+            "manifest": manifest,
+            "top_level_files": None
+            if top_level_files is None
+            else sorted(top_level_files),
+            "all_dependencies": None,
+        }
+
+    @callback
+    def async_set_custom_components(self, domains: Iterable[str]) -> None:
+        """Set the domains of the custom integrations."""
+        custom_components = sorted(domains)
+        if custom_components != self._custom_components:
+            self.dependencies_valid = False
+        self._custom_components = custom_components
+
+    @callback
+    def async_get_dependencies(self, integration: Integration) -> set[str] | None:
+        """Return the cached dependencies of an integration."""
+        if (
+            not self.dependencies_valid
+            or (cached := self._integrations.get(integration.pkg_path)) is None
+            or cached["file_path"] != str(integration.file_path)
+            or (all_dependencies := cached["all_dependencies"]) is None
+        ):
+            return None
+        return set(all_dependencies)
+
+    @callback
+    def _async_data_to_save(self) -> dict[str, Any]:
+        """Return the data of the cache."""
+        integrations: dict[str, CachedIntegration] = {}
+        for int_or_fut in self._hass.data[DATA_INTEGRATIONS].values():
+            if (
+                type(int_or_fut) is not Integration
+                or (cached := self._integrations.get(int_or_fut.pkg_path)) is None
+                or cached["file_path"] != str(int_or_fut.file_path)
+            ):
+                continue
+            all_dependencies: list[str] | None = None
+            if int_or_fut.all_dependencies_resolved:
+                with suppress(RuntimeError):
+                    all_dependencies = sorted(int_or_fut.all_dependencies)
+            integrations[int_or_fut.pkg_path] = {
+                **cached,
+                "all_dependencies": all_dependencies,
+            }
+        return {
+            "ha_version": __version__,
+            "custom_components": self._custom_components or [],
+            "integrations": integrations,
+        }
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the cache if the loaded integrations changed."""
+        if self._async_data_to_save() != self._loaded_data:
+            self._store.async_delay_save(
+                self._async_data_to_save, MANIFEST_CACHE_SAVE_DELAY
+            )
+
+
+def _stat_integration(file_path: pathlib.Path) -> list[int] | None:
+    """Return the modification times and size of the files of an integration."""
+    try:
+        manifest_stat = (file_path / "manifest.json").stat()
+        dir_stat = file_path.stat()
+    except OSError:
+        return None
+    return [manifest_stat.st_mtime_ns, manifest_stat.st_size, dir_stat.st_mtime_ns]
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> None:
+    """Load the cache of the integration manifests and dependencies."""
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store = Store[dict[str, Any]](
+        hass, MANIFEST_CACHE_STORAGE_VERSION, MANIFEST_CACHE_STORAGE_KEY
+    )
+    manifest_cache = IntegrationManifestCache(hass, store)
+    try:
+        data = await store.async_load()
+    except Exception:  # noqa: BLE001
+        _LOGGER.debug("Unable to load the integration manifest cache", exc_info=True)
+        data = None
+    await hass.async_add_executor_job(manifest_cache.validate, data)
+    hass.data[DATA_MANIFEST_CACHE] = manifest_cache
+
+
+@callback
+def async_save_manifest_cache(hass: HomeAssistant) -> None:
+    """Save the manifests and dependencies of the loaded integrations."""
+    if manifest_cache := hass.data.get(DATA_MANIFEST_CACHE):
+        manifest_cache.async_schedule_save()
+
+
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the necessary data structures."""
     _async_mount_config_dir(hass)
@@ -314,6 +490,8 @@ async def async_get_custom_components(
 
         comps = await _async_get_custom_components(hass)
 
+        if manifest_cache := hass.data.get(DATA_MANIFEST_CACHE):
+            manifest_cache.async_set_custom_components(comps)
         hass.data[DATA_CUSTOM_COMPONENTS] = comps
         future.set_result(comps)
         return comps
@@ -642,31 +820,44 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_cache = hass.data.get(DATA_MANIFEST_CACHE)
+        pkg_path = f"{root_module.__name__}.{domain}"
         for base in root_module.__path__:
-            manifest_path = pathlib.Path(base) / domain / "manifest.json"
-
-            if not manifest_path.is_file():
-                continue
-
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+            file_path = pathlib.Path(base) / domain
+            manifest_path = file_path / "manifest.json"
+            top_level_files: set[str] | None
+
+            if manifest_cache and (cached := manifest_cache.get(pkg_path, file_path)):
+                manifest = cached["manifest"]
+                if (cached_files := cached["top_level_files"]) is None:
+                    top_level_files = None
+                else:
+                    top_level_files = set(cached_files)
+            else:
+                if not manifest_path.is_file():
+                    continue
+
+                # Stat before reading so a change while reading
+                # invalidates the cached manifest
+                stat = _stat_integration(file_path) if manifest_cache else None
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if manifest_cache and stat:
+                    manifest_cache.add(
+                        pkg_path, file_path, stat, manifest, top_level_files
+                    )
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
-            integration = cls(
-                hass,
-                f"{root_module.__name__}.{domain}",
-                file_path,
-                manifest,
-                None if is_virtual else set(os.listdir(file_path)),
-            )
+            integration = cls(hass, pkg_path, file_path, manifest, top_level_files)
 
             if not integration.import_executor:
                 _LOGGER.warning(IMPORT_EVENT_LOOP_WARNING, integration.domain)
@@ -922,6 +1113,13 @@ class Integration:
         if self._all_dependencies_resolved is not None:
             return self._all_dependencies_resolved
 
+        if (manifest_cache := self.hass.data.get(DATA_MANIFEST_CACHE)) and (
+            dependencies := manifest_cache.async_get_dependencies(self)
+        ) is not None:
+            self._all_dependencies = dependencies
+            self._all_dependencies_resolved = True
+            return True
+
         self._all_dependencies_resolved = False
         try:
             dependencies = await _async_component_dependencies(self.hass, self)
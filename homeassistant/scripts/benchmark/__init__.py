@@ -7,10 +7,17 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import time
 from timeit import default_timer as timer
 
+import attr
+
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
@@ -18,7 +25,9 @@ from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
-from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.helpers.json import JSON_DUMP, JSONEncoder, json_bytes
+from homeassistant.util import dt as dt_util
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -312,6 +321,1648 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_write_states_orm(hass):
+    """Write 100k state changes to the recorder database as States objects."""
+    return await hass.async_add_executor_job(_recorder_write_states, False)
+
+
+@benchmark
+async def recorder_write_states_bulk(hass):
+    """Write 100k state changes to the recorder database with bulk inserts."""
+    return await hass.async_add_executor_job(_recorder_write_states, True)
+
+
+def _recorder_write_states(bulk_insert: bool) -> float:
+    """Write state changes for 1000 entities the way the recorder does.
+
+    The database defaults to a temporary SQLite file and can be
+    changed to a MariaDB or PostgreSQL database with the
+    RECORDER_BENCHMARK_DB_URL environment variable.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine
+
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy.orm import Session
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.table_managers.states import (
+        PendingStatesRow,
+        StatesManager,
+    )
+
+    entity_count = 1000
+    events_per_commit = 1000
+    events_to_write = 10**5
+
+    with TemporaryDirectory() as tmp_dir:
+        db_url = os.environ.get(
+            "RECORDER_BENCHMARK_DB_URL", f"sqlite:///{tmp_dir}/benchmark.db"
+        )
+        engine = create_engine(db_url)
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        if bulk_insert:
+            assert engine.dialect.insert_executemany_returning_sort_by_parameter_order
+
+        with Session(engine) as session:
+            attributes = StateAttributes(shared_attrs="{}", hash=0)
+            states_metas = [
+                StatesMeta(entity_id=f"sensor.benchmark_{idx}")
+                for idx in range(entity_count)
+            ]
+            session.add(attributes)
+            session.add_all(states_metas)
+            session.commit()
+            attributes_id = attributes.attributes_id
+            metadata_ids = [states_meta.metadata_id for states_meta in states_metas]
+
+        events: list[core.Event[core.EventStateChangedData]] = []
+        old_states: dict[str, core.State] = {}
+        for idx in range(events_to_write):
+            entity_id = f"sensor.benchmark_{idx % entity_count}"
+            new_state = core.State(entity_id, str(idx))
+            events.append(
+                core.Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_states.get(entity_id),
+                        "new_state": new_state,
+                    },
+                )
+            )
+            old_states[entity_id] = new_state
+
+        states_manager = StatesManager()
+        start = timer()
+        with Session(engine, expire_on_commit=False) as session:
+            for idx, event in enumerate(events, 1):
+                entity_id = event.data["entity_id"]
+                dbstate: PendingStatesRow | States = (
+                    PendingStatesRow(event) if bulk_insert else States.from_event(event)
+                )
+                if pending_state := states_manager.pop_pending(entity_id):
+                    # The pending state is always the same type as dbstate
+                    dbstate.old_state = pending_state  # type: ignore[assignment]
+                elif old_state_id := states_manager.pop_committed(entity_id):
+                    dbstate.old_state_id = old_state_id
+                states_manager.add_pending(entity_id, dbstate)
+                dbstate.entity_id = None
+                dbstate.metadata_id = metadata_ids[idx % entity_count]
+                dbstate.attributes_id = attributes_id
+                if isinstance(dbstate, PendingStatesRow):
+                    states_manager.add_pending_row(dbstate)
+                else:
+                    session.add(dbstate)
+                if idx % events_per_commit == 0:
+                    if bulk_insert:
+                        states_manager.insert_pending_rows(session)
+                    session.commit()
+                    states_manager.post_commit_pending()
+        runtime = timer() - start
+        engine.dispose()
+
+    print(f"Wrote {events_to_write / runtime:.0f} events/s to {engine.dialect.name}")
+    return runtime
+
+
+@benchmark
+async def recorder_ingest(hass):
+    """Drive the recorder with synthetic events, see _recorder_ingest."""
+    return await _recorder_ingest(hass)
+
+
+@benchmark
+async def recorder_ingest_attribute_churn(hass):
+    """Drive the recorder with state changes that mostly change attributes."""
+    return await _recorder_ingest(hass, attribute_churn=0.8)
+
+
+@benchmark
+async def recorder_ingest_mixed_events(hass):
+    """Drive the recorder with as many other events as state changes."""
+    return await _recorder_ingest(hass, state_changed_ratio=0.5)
+
+
+async def _recorder_ingest(
+    hass: core.HomeAssistant,
+    entity_count: int = 1000,
+    events_to_fire: int = 10**5,
+    state_changed_ratio: float = 0.9,
+    attribute_churn: float = 0.1,
+    commit_interval: int = 1,
+) -> float:
+    """Fire synthetic events and measure how fast the recorder ingests them.
+
+    Of the events, state_changed_ratio are state changes of entity_count
+    entities, and attribute_churn of those change the attributes as
+    well, the other events are regular events. The events are fired in
+    batches on the event loop while the recorder thread writes them.
+
+    The defaults can be overridden with the RECORDER_BENCHMARK_ENTITIES,
+    RECORDER_BENCHMARK_EVENTS, RECORDER_BENCHMARK_STATE_CHANGED_RATIO,
+    RECORDER_BENCHMARK_ATTRIBUTE_CHURN and
+    RECORDER_BENCHMARK_COMMIT_INTERVAL environment variables. The
+    database defaults to a temporary SQLite file and can be changed to a
+    MariaDB or PostgreSQL database with RECORDER_BENCHMARK_DB_URL.
+
+    Reports events/s until all events are committed, the commit latency
+    percentiles, the backlog of the recorder queue and the peak RSS.
+    """
+    # pylint: disable=import-outside-toplevel
+    import random
+    import resource
+
+    from homeassistant import config_entries, loader
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.helpers import recorder as recorder_helper
+    from homeassistant.setup import async_setup_component
+
+    # pylint: enable=import-outside-toplevel
+
+    environ = os.environ
+    entity_count = int(environ.get("RECORDER_BENCHMARK_ENTITIES", entity_count))
+    events_to_fire = int(environ.get("RECORDER_BENCHMARK_EVENTS", events_to_fire))
+    state_changed_ratio = float(
+        environ.get("RECORDER_BENCHMARK_STATE_CHANGED_RATIO", state_changed_ratio)
+    )
+    attribute_churn = float(
+        environ.get("RECORDER_BENCHMARK_ATTRIBUTE_CHURN", attribute_churn)
+    )
+    commit_interval = int(
+        environ.get("RECORDER_BENCHMARK_COMMIT_INTERVAL", commit_interval)
+    )
+    events_per_batch = 1000
+
+    # Generate the events up front so only firing them is measured
+    rand = random.Random(0)
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(entity_count)]
+    attributes = {
+        entity_id: {"unit_of_measurement": "W", "friendly_name": entity_id, "seq": 0}
+        for entity_id in entity_ids
+    }
+    synthetic_events: list[tuple[str, str | None, dict | None]] = []
+    for idx in range(events_to_fire):
+        if rand.random() >= state_changed_ratio:
+            synthetic_events.append(("benchmark_event", None, {"idx": idx}))
+            continue
+        entity_id = rand.choice(entity_ids)
+        if rand.random() < attribute_churn:
+            attributes[entity_id] = {**attributes[entity_id], "seq": idx}
+        synthetic_events.append((entity_id, str(idx), attributes[entity_id]))
+
+    with TemporaryDirectory() as tmp_dir:
+        loader.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        assert await async_setup_component(
+            hass,
+            "recorder",
+            {
+                "recorder": {
+                    "db_url": environ.get(
+                        "RECORDER_BENCHMARK_DB_URL", f"sqlite:///{tmp_dir}/benchmark.db"
+                    ),
+                    "commit_interval": commit_interval,
+                }
+            },
+        )
+        await hass.async_start()
+        instance = get_instance(hass)
+        await instance.async_db_ready
+
+        commit_latencies: list[float] = []
+        commit_event_session = instance._commit_event_session  # noqa: SLF001
+
+        def timed_commit_event_session() -> None:
+            """Commit the event session and record how long it took."""
+            commit_start = timer()
+            commit_event_session()
+            commit_latencies.append(timer() - commit_start)
+
+        instance._commit_event_session = timed_commit_event_session  # type: ignore[method-assign]  # noqa: SLF001
+
+        backlogs: list[int] = []
+        async_set = hass.states.async_set
+        async_fire = hass.bus.async_fire
+        start = timer()
+        for batch_start in range(0, events_to_fire, events_per_batch):
+            for entity_id_or_event, state, data in synthetic_events[
+                batch_start : batch_start + events_per_batch
+            ]:
+                if state is None:
+                    async_fire(entity_id_or_event, data)
+                else:
+                    async_set(entity_id_or_event, state, data)
+            backlogs.append(instance.backlog)
+            # Let the recorder queue up the batch like the loop would
+            await asyncio.sleep(0)
+        fired = timer() - start
+        backlog_after_firing = instance.backlog
+        await instance.async_block_till_done()
+        runtime = timer() - start
+        # Stop the recorder thread before the database file is removed
+        await hass.async_stop()
+
+    commit_latencies.sort()
+    backlogs.sort()
+
+    def percentile_ms(percent: int) -> float:
+        """Return a percentile of the commit latencies in milliseconds."""
+        index = min(len(commit_latencies) * percent // 100, len(commit_latencies) - 1)
+        return commit_latencies[index] * 1000
+
+    print(
+        f"Recorded {events_to_fire / runtime:.0f} events/s to"
+        f" {instance.dialect_name}, fired in {fired:.2f}s, drained in"
+        f" {runtime - fired:.2f}s"
+    )
+    print(
+        f"{len(commit_latencies)} commits, latency p50 {percentile_ms(50):.1f}ms"
+        f" p95 {percentile_ms(95):.1f}ms p99 {percentile_ms(99):.1f}ms"
+        f" max {percentile_ms(100):.1f}ms"
+    )
+    print(
+        f"Backlog peak {backlogs[-1]}, median {backlogs[len(backlogs) // 2]},"
+        f" after firing {backlog_after_firing}"
+    )
+    # ru_maxrss is in KiB on Linux
+    print(
+        f"Peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f}MiB"
+    )
+    return runtime
+
+
+@benchmark
+async def recorder_purge(hass):
+    """Purge all rows of a large synthetic database, see _recorder_purge."""
+    return await _recorder_purge(hass)
+
+
+@benchmark
+async def recorder_purge_shared_attributes(hass):
+    """Purge the older half of a database where attributes rarely change.
+
+    The entities get new attributes every 1000 states so most of the
+    attributes of the purged states are still used by the kept states.
+    """
+    return await _recorder_purge(hass, keep_days=7, states_per_attributes=1000)
+
+
+async def _recorder_purge(
+    hass: core.HomeAssistant,
+    keep_days: int | None = None,
+    states_per_attributes: int = 100,
+) -> float:
+    """Purge a large synthetic recorder database.
+
+    The states of 1000 entities, with new attributes every
+    states_per_attributes states of an entity, and a tenth as many
+    events are spread over the last 14 days. All rows are purged unless
+    keep_days is set. The number of states can be changed with the
+    RECORDER_BENCHMARK_STATES environment variable. The database
+    defaults to a temporary SQLite file and can be changed to a MariaDB
+    or PostgreSQL database with RECORDER_BENCHMARK_DB_URL.
+
+    With RECORDER_BENCHMARK_PARTITION_INTERVAL set to daily or weekly
+    on PostgreSQL the tables are partitioned when the recorder starts
+    and the rows end up in the legacy partition, which the purge drops
+    instead of deleting the rows in batches when all rows are purged.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import func, select
+
+    from homeassistant import config_entries, loader
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.db_schema import StateAttributes, States
+    from homeassistant.components.recorder.purge import purge_old_data
+    from homeassistant.components.recorder.util import session_scope
+    from homeassistant.helpers import recorder as recorder_helper
+    from homeassistant.setup import async_setup_component
+
+    # pylint: enable=import-outside-toplevel
+
+    environ = os.environ
+    states_count = int(environ.get("RECORDER_BENCHMARK_STATES", 2 * 10**5))
+    recorder_config = {}
+    if partition_interval := environ.get("RECORDER_BENCHMARK_PARTITION_INTERVAL"):
+        recorder_config["partition_interval"] = partition_interval
+
+    with TemporaryDirectory() as tmp_dir:
+        loader.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        assert await async_setup_component(
+            hass,
+            "recorder",
+            {
+                "recorder": {
+                    "db_url": environ.get(
+                        "RECORDER_BENCHMARK_DB_URL", f"sqlite:///{tmp_dir}/benchmark.db"
+                    ),
+                    **recorder_config,
+                }
+            },
+        )
+        await hass.async_start()
+        instance = get_instance(hass)
+        await instance.async_db_ready
+        await instance.async_block_till_done()
+        await instance.async_add_executor_job(
+            _recorder_fill_database, instance, states_count, states_per_attributes
+        )
+        if keep_days is None:
+            purge_before = dt_util.utcnow() + timedelta(days=1)
+        else:
+            purge_before = dt_util.utcnow() - timedelta(days=keep_days)
+
+        def purge() -> None:
+            """Purge until all old rows are gone."""
+            while not purge_old_data(instance, purge_before, repack=False):
+                pass
+
+        def count_rows() -> tuple[int, int]:
+            """Return the number of states and attributes."""
+            with session_scope(session=instance.get_session()) as session:
+                return (
+                    session.execute(select(func.count(States.state_id))).scalar_one(),
+                    session.execute(
+                        select(func.count(StateAttributes.attributes_id))
+                    ).scalar_one(),
+                )
+
+        states_before, attributes_before = await instance.async_add_executor_job(
+            count_rows
+        )
+        start = timer()
+        await instance.async_add_executor_job(purge)
+        runtime = timer() - start
+        states_after, attributes_after = await instance.async_add_executor_job(
+            count_rows
+        )
+        await hass.async_stop()
+
+    partitioned = " partitioned" if instance.partition_interval else ""
+    print(
+        f"Purged {states_before - states_after} states and"
+        f" {attributes_before - attributes_after} attributes at"
+        f" {(states_before - states_after) / runtime:.0f} states/s from"
+        f"{partitioned} {instance.dialect_name}"
+    )
+    return runtime
+
+
+def _recorder_fill_database(instance, states_count, states_per_attributes):
+    """Insert synthetic states and events spread over the last 14 days."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import insert
+
+    from homeassistant.components.recorder.db_schema import (
+        EventData,
+        Events,
+        EventTypes,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+    from homeassistant.components.recorder.util import session_scope
+
+    # pylint: enable=import-outside-toplevel
+
+    entity_count = 1000
+    events_per_data = 100
+    events_count = states_count // 10
+    start = time.time() - 14 * 86400
+    step = 14 * 86400 / states_count
+
+    def attributes_index(idx: int) -> int:
+        """Return the index of the attributes of a state."""
+        return idx % entity_count + entity_count * (
+            idx // entity_count // states_per_attributes
+        )
+
+    with session_scope(session=instance.get_session()) as session:
+        states_metas = [
+            StatesMeta(entity_id=f"sensor.benchmark_{idx}")
+            for idx in range(entity_count)
+        ]
+        attributes = [
+            StateAttributes(shared_attrs=f'{{"seq":{idx}}}', hash=idx)
+            for idx in range(attributes_index(states_count - 1) + 1)
+        ]
+        event_datas = [
+            EventData(shared_data=f'{{"seq":{idx}}}', hash=idx)
+            for idx in range(events_count // events_per_data + 1)
+        ]
+        event_type = EventTypes(event_type="benchmark_event")
+        session.add_all([*states_metas, *attributes, *event_datas, event_type])
+        session.flush()
+        for chunk_start in range(0, states_count, 10000):
+            session.execute(
+                insert(States),
+                [
+                    {
+                        "state": str(idx),
+                        "last_updated_ts": start + idx * step,
+                        "last_changed_ts": start + idx * step,
+                        "metadata_id": states_metas[idx % entity_count].metadata_id,
+                        "attributes_id": attributes[
+                            attributes_index(idx)
+                        ].attributes_id,
+                    }
+                    for idx in range(
+                        chunk_start, min(chunk_start + 10000, states_count)
+                    )
+                ],
+            )
+        session.execute(
+            insert(Events),
+            [
+                {
+                    "time_fired_ts": start + idx * step * 10,
+                    "event_type_id": event_type.event_type_id,
+                    "data_id": event_datas[idx // events_per_data].data_id,
+                }
+                for idx in range(events_count)
+            ],
+        )
+
+
+@benchmark
+async def recorder_compile_statistics(hass):
+    """Compile 5-minute statistics of statistics enabled sensors.
+
+    2000 sensors, a quarter of them with a sum and the others with a
+    mean, change state every 30 seconds. The statistics of three
+    periods are compiled after a first period that sets up the
+    statistics metadata. The number of sensors can be changed with the
+    RECORDER_BENCHMARK_ENTITIES environment variable. The database
+    defaults to a temporary SQLite file and can be changed to a MariaDB
+    or PostgreSQL database with RECORDER_BENCHMARK_DB_URL.
+
+    With RECORDER_BENCHMARK_QUERY_HISTORY set the states are queried
+    from the database for every period instead of using the recent
+    states the recorder keeps.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries, loader
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.tasks import StatisticsTask
+    from homeassistant.helpers import recorder as recorder_helper
+    from homeassistant.setup import async_setup_component
+
+    # pylint: enable=import-outside-toplevel
+
+    environ = os.environ
+    entity_count = int(environ.get("RECORDER_BENCHMARK_ENTITIES", 2000))
+    periods = 4
+    updates_per_period = 10
+    mean_attributes = {
+        "device_class": "power",
+        "state_class": "measurement",
+        "unit_of_measurement": "W",
+    }
+    sum_attributes = {
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit_of_measurement": "kWh",
+    }
+
+    with TemporaryDirectory() as tmp_dir:
+        loader.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        assert await async_setup_component(
+            hass,
+            "recorder",
+            {
+                "recorder": {
+                    "db_url": environ.get(
+                        "RECORDER_BENCHMARK_DB_URL", f"sqlite:///{tmp_dir}/benchmark.db"
+                    ),
+                }
+            },
+        )
+        assert await async_setup_component(hass, "sensor", {})
+        await hass.async_start()
+        instance = get_instance(hass)
+        await instance.async_db_ready
+        await hass.async_block_till_done()
+        await instance.async_block_till_done()
+        if environ.get("RECORDER_BENCHMARK_QUERY_HISTORY"):
+            instance.recent_states_manager.get_states = (
+                lambda entity_ids, *args, **kwargs: ({}, list(entity_ids))
+            )
+
+        # The periods start after the recorder started so the states
+        # are recorded in the current recorder run
+        now = time.time()
+        first_period_ts = now - now % 300 + 300
+        async_set = hass.states.async_set
+        runtimes: list[float] = []
+        for period in range(periods):
+            period_start_ts = first_period_ts + period * 300
+            for update in range(updates_per_period):
+                timestamp = period_start_ts + (update + 0.5) * 300 / updates_per_period
+                for idx in range(entity_count):
+                    if idx % 4:
+                        async_set(
+                            f"sensor.benchmark_{idx}",
+                            str((idx + update) % 100),
+                            mean_attributes,
+                            timestamp=timestamp,
+                        )
+                    else:
+                        async_set(
+                            f"sensor.benchmark_{idx}",
+                            str(period * updates_per_period + update),
+                            sum_attributes,
+                            timestamp=timestamp,
+                        )
+                await asyncio.sleep(0)
+            await instance.async_block_till_done()
+            start = timer()
+            instance.queue_task(
+                StatisticsTask(dt_util.utc_from_timestamp(period_start_ts), False)
+            )
+            await instance.async_block_till_done()
+            runtimes.append(timer() - start)
+        await hass.async_stop()
+
+    source = (
+        "the database"
+        if environ.get("RECORDER_BENCHMARK_QUERY_HISTORY")
+        else "recent states"
+    )
+    print(
+        f"Compiled the statistics of {entity_count} sensors in"
+        f" {runtimes[0]:.3f}s for the first period and"
+        f" {sum(runtimes[1:]) / (periods - 1):.3f}s per period from {source}"
+        f" on {instance.dialect_name}"
+    )
+    return sum(runtimes[1:])
+
+
+def _recorder_fill_statistics(instance, statistic_ids, hours):
+    """Insert synthetic hourly statistics for the last hours."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import insert
+
+    from homeassistant.components.recorder.db_schema import Statistics, StatisticsMeta
+    from homeassistant.components.recorder.util import session_scope
+
+    # pylint: enable=import-outside-toplevel
+
+    now = time.time()
+    first_start_ts = now - now % 3600 - hours * 3600
+    with session_scope(session=instance.get_session()) as session:
+        metas = [
+            StatisticsMeta(
+                statistic_id=statistic_id,
+                source="test",
+                unit_of_measurement="kWh",
+                has_mean=True,
+                has_sum=True,
+                name=None,
+            )
+            for statistic_id in statistic_ids
+        ]
+        session.add_all(metas)
+        session.flush()
+        for meta in metas:
+            for chunk_start in range(0, hours, 10000):
+                session.execute(
+                    insert(Statistics),
+                    [
+                        {
+                            "metadata_id": meta.id,
+                            "start_ts": first_start_ts + hour * 3600,
+                            "mean": hour % 24,
+                            "min": hour % 24 - 1,
+                            "max": hour % 24 + 1,
+                            "state": hour,
+                            "sum": hour,
+                        }
+                        for hour in range(chunk_start, min(chunk_start + 10000, hours))
+                    ],
+                )
+
+
+@benchmark
+async def recorder_statistics_during_period_month(hass):
+    """Query a year of monthly statistics from three years of hourly statistics.
+
+    20 statistics with a mean and a sum are queried for the last year
+    by month. The daily statistics are compiled before the queries. The
+    database defaults to a temporary SQLite file and can be changed to a
+    MariaDB or PostgreSQL database with RECORDER_BENCHMARK_DB_URL.
+
+    With RECORDER_BENCHMARK_QUERY_HOURLY set the months are reduced from
+    the hourly statistics instead of the daily statistics.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries, loader
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.statistics import statistics_during_period
+    from homeassistant.components.recorder.tasks import CompileDailyStatisticsTask
+    from homeassistant.helpers import recorder as recorder_helper
+    from homeassistant.setup import async_setup_component
+
+    # pylint: enable=import-outside-toplevel
+
+    environ = os.environ
+    statistics_count = 20
+    hours = 3 * 365 * 24
+    queries = 10
+    now = time.time()
+    statistic_ids = {f"test:benchmark_{idx}" for idx in range(statistics_count)}
+
+    with TemporaryDirectory() as tmp_dir:
+        loader.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        assert await async_setup_component(
+            hass,
+            "recorder",
+            {
+                "recorder": {
+                    "db_url": environ.get(
+                        "RECORDER_BENCHMARK_DB_URL", f"sqlite:///{tmp_dir}/benchmark.db"
+                    ),
+                }
+            },
+        )
+        await hass.async_start()
+        instance = get_instance(hass)
+        await instance.async_db_ready
+        await hass.async_block_till_done()
+        await instance.async_block_till_done()
+        await instance.async_add_executor_job(
+            _recorder_fill_statistics, instance, statistic_ids, hours
+        )
+
+        statistics_daily_manager = instance.statistics_daily_manager
+        statistics_daily_manager.time_zone = None
+        start = timer()
+        while not statistics_daily_manager.active:
+            instance.queue_task(CompileDailyStatisticsTask())
+            await instance.async_block_till_done()
+        compile_runtime = timer() - start
+        if environ.get("RECORDER_BENCHMARK_QUERY_HOURLY"):
+            statistics_daily_manager.time_zone = None
+
+        start_time = dt_util.utc_from_timestamp(now - 365 * 86400)
+        types = {"change", "max", "mean", "min", "state", "sum"}
+        start = timer()
+        for _ in range(queries):
+            await instance.async_add_executor_job(
+                statistics_during_period,
+                hass,
+                start_time,
+                None,
+                statistic_ids,
+                "month",
+                None,
+                types,
+            )
+        runtime = timer() - start
+        await hass.async_stop()
+
+    source = "hourly" if environ.get("RECORDER_BENCHMARK_QUERY_HOURLY") else "daily"
+    print(
+        f"Compiled the daily statistics in {compile_runtime:.3f}s, queried a"
+        f" year by month in {runtime / queries:.3f}s from the {source}"
+        f" statistics on {instance.dialect_name}"
+    )
+    return runtime
+
+
+@benchmark
+async def recorder_statistics_during_period_cache(hass):
+    """Repeat the statistics_during_period websocket queries of a dashboard.
+
+    A dashboard with 20 statistics queries the hours of the last week
+    100 times. The database defaults to a temporary SQLite file and can
+    be changed to a MariaDB or PostgreSQL database with
+    RECORDER_BENCHMARK_DB_URL.
+
+    With RECORDER_BENCHMARK_NO_CACHE set the cache is invalidated before
+    every query.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries, loader
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.statistics import (
+        get_statistics_during_period_cache,
+    )
+    from homeassistant.components.recorder.websocket_api import (
+        _ws_get_statistics_during_period,
+    )
+    from homeassistant.helpers import recorder as recorder_helper
+    from homeassistant.setup import async_setup_component
+
+    # pylint: enable=import-outside-toplevel
+
+    environ = os.environ
+    statistics_count = 20
+    hours = 30 * 24
+    queries = 100
+    statistic_ids = {f"test:benchmark_{idx}" for idx in range(statistics_count)}
+
+    with TemporaryDirectory() as tmp_dir:
+        loader.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        assert await async_setup_component(
+            hass,
+            "recorder",
+            {
+                "recorder": {
+                    "db_url": environ.get(
+                        "RECORDER_BENCHMARK_DB_URL", f"sqlite:///{tmp_dir}/benchmark.db"
+                    ),
+                }
+            },
+        )
+        await hass.async_start()
+        instance = get_instance(hass)
+        await instance.async_db_ready
+        await hass.async_block_till_done()
+        await instance.async_block_till_done()
+        await instance.async_add_executor_job(
+            _recorder_fill_statistics, instance, statistic_ids, hours
+        )
+
+        cache = get_statistics_during_period_cache(hass)
+        end_time = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        start_time = end_time - timedelta(days=7)
+        types = {"change", "max", "mean", "min", "state", "sum"}
+        start = timer()
+        for msg_id in range(queries):
+            if environ.get("RECORDER_BENCHMARK_NO_CACHE"):
+                cache.invalidate()
+            await instance.async_add_executor_job(
+                _ws_get_statistics_during_period,
+                hass,
+                msg_id,
+                start_time,
+                end_time,
+                statistic_ids,
+                "hour",
+                {},
+                types,
+            )
+        runtime = timer() - start
+        stats = cache.stats()
+        await hass.async_stop()
+
+    print(
+        f"Queried a week of hourly statistics in {runtime / queries * 1000:.2f}ms"
+        f" with {stats['hits']} hits and {stats['misses']} misses"
+        f" on {instance.dialect_name}"
+    )
+    return runtime
+
+
+@benchmark
+async def unit_conversion_many(hass):
+    """Convert 1M statistics values from kWh to MWh and from °C to °F.
+
+    The values are converted by the batch converters and by calling
+    the converter of a single value for comparison.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.const import UnitOfEnergy, UnitOfTemperature
+    from homeassistant.util.unit_conversion import (
+        EnergyConverter,
+        TemperatureConverter,
+    )
+
+    # pylint: enable=import-outside-toplevel
+
+    values = [None if idx % 100 == 0 else idx / 7 for idx in range(10**6)]
+    runtime = 0.0
+    for converter, from_unit, to_unit in (
+        (EnergyConverter, UnitOfEnergy.KILO_WATT_HOUR, UnitOfEnergy.MEGA_WATT_HOUR),
+        (TemperatureConverter, UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT),
+    ):
+        convert = converter.converter_factory_allow_none(from_unit, to_unit)
+        start = timer()
+        [convert(value) for value in values]
+        single_runtime = timer() - start
+
+        convert_many = converter.converter_factory_many(from_unit, to_unit)
+        start = timer()
+        convert_many(values)
+        many_runtime = timer() - start
+        runtime += many_runtime
+
+        print(
+            f"Converted {from_unit} to {to_unit} in {many_runtime * 1000:.0f}ms,"
+            f" {single_runtime * 1000:.0f}ms one value at a time"
+        )
+    return runtime
+
+
+@benchmark
+async def loader_manifest_cache(hass):
+    """Resolve all built-in integrations and their dependencies as on startup.
+
+    Each run uses a new instance with the same configuration directory,
+    the first run creates the manifest cache that the other runs load.
+    With LOADER_BENCHMARK_NO_CACHE set the manifest cache is not loaded.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import components, loader
+
+    # pylint: enable=import-outside-toplevel
+
+    runs = 5
+    use_cache = not os.environ.get("LOADER_BENCHMARK_NO_CACHE")
+    domains = [
+        entry.name
+        for entry in os.scandir(components.__path__[0])
+        if os.path.isfile(os.path.join(entry.path, "manifest.json"))
+    ]
+    runtimes = []
+
+    with TemporaryDirectory() as tmp_dir:
+        for _ in range(runs):
+            run_hass = core.HomeAssistant(tmp_dir)
+            loader.async_setup(run_hass)
+            start = timer()
+            if use_cache:
+                await loader.async_load_manifest_cache(run_hass)
+            integrations = await loader.async_get_integrations(run_hass, domains)
+            await asyncio.gather(
+                *(
+                    integration.resolve_dependencies()
+                    for integration in integrations.values()
+                    if isinstance(integration, loader.Integration)
+                )
+            )
+            runtimes.append(timer() - start)
+            loader.async_save_manifest_cache(run_hass)
+            await run_hass.async_stop()
+
+    print(
+        f"Resolved {len(domains)} integrations in {runtimes[0] * 1000:.0f}ms"
+        f" on the first run and {min(runtimes[1:]) * 1000:.0f}ms after"
+        f" {'with' if use_cache else 'without'} the manifest cache"
+    )
+    return sum(runtimes[1:])
+
+
+@benchmark
+async def lazy_platform_imports(hass):
+    """Import the platforms of all built-in integrations that are not preloaded.
+
+    The integrations are imported first in a new process, then their
+    diagnostics and system_health platforms, which is what preloading
+    these platforms costs on startup when all integrations are loaded.
+    """
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    from homeassistant import components
+
+    # pylint: enable=import-outside-toplevel
+
+    def has_platform(integration_path: str, platform_name: str) -> bool:
+        """Return if the integration has a platform module or package."""
+        platform_path = os.path.join(integration_path, platform_name)
+        return os.path.isfile(f"{platform_path}.py") or (
+            os.path.isdir(platform_path)
+            and os.path.isfile(os.path.join(platform_path, "__init__.py"))
+        )
+
+    platforms = [
+        (entry.name, platform_name)
+        for entry in os.scandir(components.__path__[0])
+        if entry.is_dir()
+        for platform_name in ("diagnostics", "system_health")
+        if has_platform(entry.path, platform_name)
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        imported, runtime, rss_growth = await hass.loop.run_in_executor(
+            executor, _import_integration_platforms, platforms
+        )
+
+    print(
+        f"Imported {imported} of {len(platforms)} diagnostics and system_health"
+        f" platforms in {runtime * 1000:.0f}ms, max RSS grew by"
+        f" {rss_growth / 1024:.1f}MiB"
+    )
+    return runtime
+
+
+def _import_integration_platforms(
+    platforms: list[tuple[str, str]],
+) -> tuple[int, float, int]:
+    """Import the integrations and then the platforms in a new process.
+
+    Return the number of platforms imported, the time it took to import
+    them and how much the max RSS grew in KiB while importing them.
+    """
+    # pylint: disable=import-outside-toplevel
+    import importlib
+    import resource
+
+    # pylint: enable=import-outside-toplevel
+
+    loaded_platforms = []
+    for domain, platform_name in platforms:
+        with suppress(Exception):
+            importlib.import_module(f"homeassistant.components.{domain}")
+            loaded_platforms.append((domain, platform_name))
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    imported = 0
+    start = timer()
+    for domain, platform_name in loaded_platforms:
+        with suppress(Exception):
+            importlib.import_module(f"homeassistant.components.{domain}.{platform_name}")
+            imported += 1
+    runtime = timer() - start
+    rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+    return imported, runtime, rss_growth
+
+
+@benchmark
+async def yaml_config_reload(hass):
+    """Load a configuration split over 800 files, fully and incrementally.
+
+    The incremental reload only parses the changed file and the
+    configuration.yaml file including it.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util.yaml import Secrets, YamlFileCache, load_yaml_dict
+
+    file_count = 800
+    runs = 10
+
+    with TemporaryDirectory() as tmp_dir:
+        packages_dir = os.path.join(tmp_dir, "packages")
+        os.mkdir(packages_dir)
+        with open(
+            os.path.join(tmp_dir, "secrets.yaml"), "w", encoding="utf-8"
+        ) as secrets_file:
+            secrets_file.write("api_key: abc123\n")
+        with open(
+            os.path.join(tmp_dir, "configuration.yaml"), "w", encoding="utf-8"
+        ) as config_file:
+            config_file.write(
+                "homeassistant:\n  packages: !include_dir_named packages\n"
+            )
+        package_paths = []
+        for idx in range(file_count):
+            package_path = os.path.join(packages_dir, f"package_{idx}.yaml")
+            package_paths.append(package_path)
+            with open(package_path, "w", encoding="utf-8") as package_file:
+                package_file.write(
+                    f"""
+rest:
+  - resource: http://192.168.1.{idx % 255}/api
+    headers:
+      authorization: !secret api_key
+    sensor:
+      - name: Sensor {idx}
+        value_template: "{{{{ value_json.value }}}}"
+automation:
+  - alias: Automation {idx}
+    trigger:
+      - platform: state
+        entity_id: sensor.sensor_{idx}
+        to: "on"
+    action:
+      - service: light.turn_on
+        target:
+          entity_id: light.light_{idx}
+        data:
+          brightness: {idx % 255}
+"""
+                )
+
+        config_path = os.path.join(tmp_dir, "configuration.yaml")
+        yaml_cache = YamlFileCache()
+
+        def _load(yaml_cache):
+            return load_yaml_dict(config_path, Secrets(Path(tmp_dir)), yaml_cache)
+
+        start = timer()
+        for _ in range(runs):
+            await hass.async_add_executor_job(_load, None)
+        full_runtime = (timer() - start) / runs
+
+        await hass.async_add_executor_job(_load, yaml_cache)
+        start = timer()
+        for _ in range(runs):
+            await hass.async_add_executor_job(_load, yaml_cache)
+        unchanged_runtime = (timer() - start) / runs
+
+        changed_runtime = 0.0
+        for idx in range(runs):
+            with open(package_paths[idx], "a", encoding="utf-8") as package_file:
+                package_file.write("# changed\n")
+            start = timer()
+            await hass.async_add_executor_job(_load, yaml_cache)
+            changed_runtime += timer() - start
+        changed_runtime /= runs
+
+    print(
+        f"Loaded {file_count} files in {full_runtime * 1000:.0f}ms without the cache,"
+        f" {unchanged_runtime * 1000:.0f}ms when unchanged and"
+        f" {changed_runtime * 1000:.0f}ms with one changed file"
+    )
+    return full_runtime + unchanged_runtime + changed_runtime
+
+
+@benchmark
+async def entity_registry_mass_rename(hass):
+    """Rename 1k entities of a 10k entity registry, saving every 20 renames.
+
+    The bytes written are compared between rewriting the whole file on
+    every save and appending the changes to a journal.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import entity_registry as er, storage
+
+    entity_count = 10**4
+    renames = 10**3
+    renames_per_save = 20
+
+    def create_entries():
+        """Create the registry entries."""
+        return [
+            er.RegistryEntry(
+                entity_id=f"sensor.sensor_{idx}",
+                unique_id=f"unique_{idx}",
+                platform="zha",
+                device_id=f"device_{idx // 4}",
+                original_name=f"Sensor {idx}",
+            )
+            for idx in range(entity_count)
+        ]
+
+    def data_to_save(entries):
+        """Return the data like the entity registry does."""
+        return {
+            "entities": [entry.as_storage_fragment for entry in entries],
+            "deleted_entities": [],
+        }
+
+    def bytes_written(path, previous):
+        """Return the bytes written by the last save and the new file sizes."""
+        snapshot = os.stat(path)
+        journal_path = f"{path}{storage.JOURNAL_SUFFIX}"
+        journal_size = (
+            os.path.getsize(journal_path) if os.path.exists(journal_path) else 0
+        )
+        current = ((snapshot.st_ino, snapshot.st_mtime_ns), journal_size)
+        written = 0
+        if current[0] != previous[0]:
+            written += snapshot.st_size
+        if journal_size >= previous[1]:
+            written += journal_size - previous[1]
+        else:
+            written += journal_size
+        return written, current
+
+    runtime = 0.0
+    for journal in (False, True):
+        entries = create_entries()
+        with TemporaryDirectory() as tmp_dir:
+            run_hass = core.HomeAssistant(tmp_dir)
+            store = storage.Store(
+                run_hass, 1, er.STORAGE_KEY, atomic_writes=True, journal=journal
+            )
+            await store.async_save(data_to_save(entries))
+            _, sizes = await run_hass.async_add_executor_job(
+                bytes_written, store.path, (None, 0)
+            )
+            total_written = 0
+            elapsed = 0.0
+            for idx in range(renames):
+                pos = idx * 7919 % entity_count
+                entries[pos] = attr.evolve(entries[pos], name=f"Renamed {idx}")
+                if (idx + 1) % renames_per_save:
+                    continue
+                start = timer()
+                await store.async_save(data_to_save(entries))
+                elapsed += timer() - start
+                written, sizes = await run_hass.async_add_executor_job(
+                    bytes_written, store.path, sizes
+                )
+                total_written += written
+            store2 = storage.Store(run_hass, 1, er.STORAGE_KEY, journal=journal)
+            loaded = await store2.async_load()
+            assert loaded is not None
+            assert len(loaded["entities"]) == entity_count
+            assert [entity["name"] for entity in loaded["entities"]] == [
+                entry.name for entry in entries
+            ]
+            await run_hass.async_stop()
+        runtime += elapsed
+        print(
+            f"{'Journal' if journal else 'Full writes'}:"
+            f" {total_written / 1024:.0f}KiB written for {renames} renames"
+            f" in {elapsed * 1000:.0f}ms"
+        )
+
+    return runtime
+
+
+@benchmark
+async def mqtt_match_wildcard_subscriptions(hass):
+    """Match 100k topics against 10k MQTT wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    subscription_count = 10**4
+    messages_to_match = 10**5
+
+    @core.callback
+    def listener(_):
+        """Handle message."""
+
+    job = core.HassJob(listener)
+    trie = SubscriptionTrie()
+    for idx in range(subscription_count):
+        trie.add(Subscription(f"zigbee2mqtt/device_{idx}/+/set", False, job))
+    trie.add(Subscription("zigbee2mqtt/#", False, job))
+    topics = [
+        f"zigbee2mqtt/device_{idx % subscription_count}/light_{idx}/set"
+        for idx in range(messages_to_match)
+    ]
+
+    start = timer()
+
+    for topic in topics:
+        assert len(trie.matches(topic)) == 2
+
+    runtime = timer() - start
+    print(f"Matched {messages_to_match / runtime:.0f} messages/s")
+    return runtime
+
+
+@benchmark
+async def statistics_sensor_rolling_window(hass):
+    """Update statistics sensors over a full 10k sample buffer."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics.sensor import StatisticsSensor
+
+    buffer_size = 10**4
+    updates = 5 * 10**4
+    now = dt_util.utcnow()
+    states = [
+        core.State(
+            "sensor.source",
+            str((idx * 7919) % 1000 / 10),
+            last_updated=now + timedelta(seconds=idx),
+        )
+        for idx in range(buffer_size + updates)
+    ]
+    sensors = [
+        StatisticsSensor(
+            "sensor.source",
+            characteristic,
+            None,
+            characteristic,
+            buffer_size,
+            None,
+            False,
+            2,
+            95,
+        )
+        for characteristic in (
+            "mean",
+            "median",
+            "percentile",
+            "standard_deviation",
+            "value_max",
+            "average_linear",
+        )
+    ]
+    for sensor in sensors:
+        for state in states[:buffer_size]:
+            sensor._add_state_to_queue(state)  # noqa: SLF001
+
+    start = timer()
+
+    for state in states[buffer_size:]:
+        for sensor in sensors:
+            sensor._add_state_to_queue(state)  # noqa: SLF001
+            sensor._state_characteristic_fn()  # noqa: SLF001
+
+    runtime = timer() - start
+    print(f"Processed {updates * len(sensors) / runtime:.0f} sensor updates/s")
+    return runtime
+
+
+@benchmark
+async def history_significant_states_columns(hass):
+    """Convert 2M minimal history rows of 200 entities to compressed JSON."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.history.modern import (
+        _sorted_states_to_columns,
+    )
+
+    entity_count = 200
+    rows_per_entity = 10**4
+    entity_ids = [f"sensor.sensor_{idx}" for idx in range(entity_count)]
+    entity_id_to_metadata_id = {
+        entity_id: idx for idx, entity_id in enumerate(entity_ids)
+    }
+    # Rows as returned by the significant states query without attributes
+    rows = [
+        (metadata_id, str(idx % 37), 1718000000.123 + idx * 259.2)
+        for metadata_id in range(entity_count)
+        for idx in range(rows_per_entity)
+    ]
+
+    start = timer()
+
+    json_bytes(
+        _sorted_states_to_columns(
+            rows, None, entity_ids, entity_id_to_metadata_id, True, True
+        )
+    )
+
+    runtime = timer() - start
+    print(f"Converted {len(rows) / runtime:.0f} rows/s")
+    return runtime
+
+
+@benchmark
+async def websocket_subscribe_entities_fan_out(hass):
+    """Fan out 100k state changes of 5k entities to 50 websocket connections."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import User
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.commands import (
+        handle_subscribe_entities,
+    )
+
+    connection_count = 50
+    entity_count = 5 * 10**3
+    state_changes = 10**5
+    sent_messages = 0
+
+    class Connection:
+        """Websocket connection that only counts the messages it sends."""
+
+        def __init__(self, user):
+            self.user = user
+            self.subscriptions = {}
+
+        def send_message(self, message):
+            nonlocal sent_messages
+            sent_messages += 1
+
+        def send_coalescable_message(self, key, message, replacement):
+            nonlocal sent_messages
+            sent_messages += 1
+
+        def send_result(self, msg_id, result=None):
+            """Ignore the result."""
+
+    entity_ids = [f"light.light_{idx}" for idx in range(entity_count)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "off")
+    user = User(name="Dashboard", perm_lookup=None, is_owner=True, is_active=True)
+    for msg_id in range(connection_count):
+        handle_subscribe_entities(
+            hass, Connection(user), {"id": msg_id, "type": "subscribe_entities"}
+        )
+    await hass.async_block_till_done()
+    sent_messages = 0
+
+    start = timer()
+
+    for idx in range(state_changes):
+        hass.states.async_set(
+            entity_ids[idx % entity_count], "off" if idx // entity_count % 2 else "on"
+        )
+    await hass.async_block_till_done()
+
+    runtime = timer() - start
+    assert sent_messages == connection_count * state_changes
+    print(f"Sent {sent_messages / runtime:.0f} messages/s")
+    return runtime
+
+
+@benchmark
+async def template_compile_cached_code(hass):
+    """Compile 5k templates of 1k distinct sources again after a reload."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import template
+
+    template_count = 5 * 10**3
+    source_count = 10**3
+    sources = [
+        "{% if is_state('binary_sensor.door_"
+        + str(idx % source_count)
+        + "', 'on') %}{{ states('sensor.temperature_"
+        + str(idx % source_count)
+        + "') | float(0) | round(1) }}{% else %}{{ 'closed' }}{% endif %}"
+        for idx in range(template_count)
+    ]
+
+    def compile_templates():
+        """Compile the templates like on startup and return the time it took."""
+        start = timer()
+        templates = [template.Template(source, hass) for source in sources]
+        for tpl in templates:
+            tpl.ensure_valid()
+        return timer() - start
+
+    template.COMPILED_TEMPLATE_CODE_LRU.clear()
+    startup = compile_templates()
+    runtime = compile_templates()
+    print(f"Startup took {startup:.3f}s, reload took {runtime:.3f}s")
+    return runtime
+
+
+@benchmark
+async def event_bus_filtered_dispatch(hass):
+    """Fire 100k state changed events at a growing number of listeners.
+
+    Each listener wants one entity through an event filter.
+    """
+    count = 0
+    events_to_fire = 10**5
+    runtime = 0.0
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    def filter_entity_id(entity_id):
+        """Return a filter that matches a single entity."""
+
+        @core.callback
+        def event_filter(event_data):
+            """Filter event."""
+            return event_data["entity_id"] == entity_id
+
+        return event_filter
+
+    def fire_events(entity_ids):
+        """Fire the events round robin and return the time it took."""
+        all_event_data = [
+            {
+                "entity_id": entity_id,
+                "old_state": core.State(entity_id, "off"),
+                "new_state": core.State(entity_id, "on"),
+            }
+            for entity_id in entity_ids
+        ]
+        start = timer()
+        for idx in range(events_to_fire):
+            hass.bus.async_fire_internal(
+                EVENT_STATE_CHANGED, all_event_data[idx % len(all_event_data)]
+            )
+        return timer() - start
+
+    for listener_count in (10, 100, 1000):
+        entity_ids = [f"light.kitchen_{idx}" for idx in range(listener_count)]
+        unsubs = [
+            hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                listener,
+                event_filter=filter_entity_id(entity_id),
+            )
+            for entity_id in entity_ids
+        ]
+        count = 0
+        elapsed = fire_events(entity_ids)
+        await hass.async_block_till_done()
+        assert count == events_to_fire
+        for unsub in unsubs:
+            unsub()
+        runtime += elapsed
+        print(
+            f"{listener_count} filtered listeners: "
+            f"{events_to_fire / elapsed:.0f} fires/s"
+        )
+
+    return runtime
+
+
+def _synthetic_state_attributes(idx):
+    """Return attributes for a synthetic sensor.
+
+    Like on a real system, a share of the sensors only have attributes
+    that are identical across sensors of the same kind.
+    """
+    attributes = {
+        "unit_of_measurement": ("°C", "%", "W", "kWh")[idx % 4],
+        "device_class": ("temperature", "humidity", "power", "energy")[idx % 4],
+        "state_class": "measurement",
+    }
+    if idx % 2:
+        attributes["friendly_name"] = f"Sensor {idx}"
+    return attributes
+
+
+@benchmark
+async def compact_state_memory(hass):
+    """Copy the states of a 10k entity state machine as State and CompactState.
+
+    The copies are made from the JSON dicts like restored states are.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import tracemalloc
+
+    entity_count = 10**4
+    for idx in range(entity_count):
+        hass.states.async_set(
+            f"sensor.sensor_{idx}", str(idx), _synthetic_state_attributes(idx)
+        )
+    json_dicts = [json.loads(state.as_dict_json) for state in hass.states.async_all()]
+
+    def copy_states(from_dict):
+        """Copy the states and return the time and memory it took."""
+        tracemalloc.start()
+        start = timer()
+        copies = [from_dict(json_dict) for json_dict in json_dicts]
+        elapsed = timer() - start
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert len(copies) == entity_count
+        return elapsed, size
+
+    _, state_size = copy_states(core.State.from_dict)
+    attributes_cache = {}
+    runtime, compact_size = copy_states(
+        lambda json_dict: core.CompactState.from_dict(json_dict, attributes_cache)
+    )
+    print(
+        f"State: {state_size / entity_count:.0f} bytes per state, "
+        f"CompactState: {compact_size / entity_count:.0f} bytes per state"
+    )
+    return runtime
+
+
+@benchmark
+async def state_changed_throughput(hass):
+    """Fire 100k state changed events for 10k entities.
+
+    The new states are created like the state machine does, once as State
+    and once as CompactState. A listener reads the timestamps like the
+    recorder and websocket api do.
+    """
+    entity_count = 10**4
+    events_to_fire = 10**5
+    count = 0
+
+    @core.callback
+    def listener(event):
+        """Handle event."""
+        nonlocal count
+        new_state = event.data["new_state"]
+        assert new_state.last_updated_timestamp
+        assert new_state.last_changed_timestamp
+        count += 1
+
+    entity_ids = [f"sensor.sensor_{idx}" for idx in range(entity_count)]
+    all_attributes = [
+        ReadOnlyDict(_synthetic_state_attributes(idx)) for idx in range(entity_count)
+    ]
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+
+    def create_state(entity_id, state, attributes, timestamp, context):
+        """Create a State like StateMachine.async_set."""
+        now = dt_util.utc_from_timestamp(timestamp)
+        return core.State(
+            entity_id,
+            state,
+            attributes,
+            None,
+            now,
+            now,
+            context,
+            False,
+            None,
+            timestamp,
+        )
+
+    def create_compact_state(entity_id, state, attributes, timestamp, context):
+        """Create a CompactState with the same values."""
+        return core.CompactState(
+            entity_id, state, attributes, timestamp, timestamp, timestamp, context
+        )
+
+    runtime = 0.0
+    for name, state_factory in (
+        ("State", create_state),
+        ("CompactState", create_compact_state),
+    ):
+        count = 0
+        start = timer()
+        for idx in range(events_to_fire):
+            timestamp = time.time()
+            context = core.Context()
+            entity_id = entity_ids[idx % entity_count]
+            hass.bus.async_fire_internal(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": None,
+                    "new_state": state_factory(
+                        entity_id,
+                        str(idx),
+                        all_attributes[idx % entity_count],
+                        timestamp,
+                        context,
+                    ),
+                },
+                context=context,
+                time_fired=timestamp,
+            )
+        await hass.async_block_till_done()
+        runtime = timer() - start
+        assert count == events_to_fire
+        print(f"{name}: {events_to_fire / runtime:.0f} state changes/s")
+
+    return runtime
+
+
+@benchmark
+async def state_machine_set_many_burst(hass):
+    """Update 500 entities in a burst 200 times, one by one and as a batch.
+
+    A state changed listener and a keyed state tracker listen to all
+    entities.
+    """
+    entity_count = 500
+    bursts = 200
+    count = 0
+
+    @core.callback
+    def listener(event):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    entity_ids = [f"sensor.zha_{idx}" for idx in range(entity_count)]
+    all_attributes = [_synthetic_state_attributes(idx) for idx in range(entity_count)]
+    for entity_id, attributes in zip(entity_ids, all_attributes, strict=True):
+        hass.states.async_set(entity_id, "initial", attributes)
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    async_track_state_change_event(hass, entity_ids, listener)
+
+    def set_one_by_one(burst):
+        """Set the states of the burst one by one."""
+        for entity_id, attributes in zip(entity_ids, all_attributes, strict=True):
+            hass.states.async_set(entity_id, str(burst), attributes)
+
+    def set_many(burst):
+        """Set the states of the burst as a batch."""
+        hass.states.async_set_many(
+            (entity_id, str(burst), attributes)
+            for entity_id, attributes in zip(entity_ids, all_attributes, strict=True)
+        )
+
+    runtime = 0.0
+    for name, set_burst in (
+        ("async_set", set_one_by_one),
+        ("async_set_many", set_many),
+    ):
+        count = 0
+        start = timer()
+        for burst in range(bursts):
+            set_burst(f"{name}{burst}")
+        await hass.async_block_till_done()
+        runtime = timer() - start
+        assert count == 2 * bursts * entity_count
+        print(f"{name}: {bursts / runtime:.0f} bursts/s")
+
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -7,6 +7,7 @@ from collections import defaultdict
 from collections.abc import Awaitable, Callable, Mapping
 import contextlib
 import contextvars
+from dataclasses import dataclass
 from enum import StrEnum
 from functools import partial
 import logging.handlers
@@ -74,6 +75,10 @@ DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# DATA_SETUP_TIMELINE is a list, indicating when the phases of setting
+# up the components started and finished during startup.
+DATA_SETUP_TIMELINE: HassKey[list[SetupTimelineSpan]] = HassKey("setup_timeline")
+
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -311,7 +316,10 @@ async def _async_setup_component(
     # Process requirements as soon as possible, so we can import the component
     # without requiring imports to be in functions.
     try:
-        await async_process_deps_reqs(hass, config, integration)
+        with async_record_setup_phase(
+            hass, integration=domain, phase=SetupPhases.REQUIREMENTS
+        ):
+            await async_process_deps_reqs(hass, config, integration)
     except HomeAssistantError as err:
         log_error(str(err))
         return False
@@ -319,7 +327,10 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with async_record_setup_phase(
+            hass, integration=domain, phase=SetupPhases.IMPORT
+        ):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
@@ -665,6 +676,34 @@ class SetupPhases(StrEnum):
     """Wait time for the platforms to import."""
     WAIT_IMPORT_PACKAGES = "wait_import_packages"
     """Wait time for the packages to import."""
+    REQUIREMENTS = "requirements"
+    """Processing of the dependencies and requirements.
+
+    This is only recorded in the setup timeline.
+    """
+    IMPORT = "import"
+    """Import of the component.
+
+    This is only recorded in the setup timeline.
+    """
+
+
+_WAIT_PHASES = {
+    SetupPhases.WAIT_BASE_PLATFORM_SETUP,
+    SetupPhases.WAIT_IMPORT_PLATFORMS,
+    SetupPhases.WAIT_IMPORT_PACKAGES,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class SetupTimelineSpan:
+    """A phase of setting up a component during startup."""
+
+    integration: str
+    group: str | None
+    phase: str
+    start: float
+    end: float
 
 
 @singleton.singleton(DATA_SETUP_STARTED)
@@ -697,10 +736,14 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
     try:
         yield
     finally:
-        time_taken = time.monotonic() - started
+        finished = time.monotonic()
+        time_taken = finished - started
         integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
+        _setup_timeline(hass).append(
+            SetupTimelineSpan(integration, group, phase, started, finished)
+        )
         _LOGGER.debug(
             "Adding wait for %s for %s (%s) of %.2f",
             phase,
@@ -718,6 +761,37 @@ def _setup_times(
     return defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
 
 
+@singleton.singleton(DATA_SETUP_TIMELINE)
+def _setup_timeline(hass: core.HomeAssistant) -> list[SetupTimelineSpan]:
+    """Return the setup timeline list."""
+    return []
+
+
+@contextlib.contextmanager
+def async_record_setup_phase(
+    hass: core.HomeAssistant,
+    integration: str,
+    phase: str,
+    group: str | None = None,
+) -> Generator[None]:
+    """Record when a phase of startup starts and finishes in the setup timeline.
+
+    Unlike async_start_setup the time is not added to the setup time of the
+    integration.
+    """
+    if hass.is_stopping or hass.state is core.CoreState.running:
+        yield
+        return
+
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        _setup_timeline(hass).append(
+            SetupTimelineSpan(integration, group, phase, started, time.monotonic())
+        )
+
+
 @contextlib.contextmanager
 def async_start_setup(
     hass: core.HomeAssistant,
@@ -758,8 +832,12 @@ def async_start_setup(
     try:
         yield
     finally:
-        time_taken = time.monotonic() - started
+        finished = time.monotonic()
+        time_taken = finished - started
         del setup_started[current]
+        _setup_timeline(hass).append(
+            SetupTimelineSpan(integration, group, phase, started, finished)
+        )
         group_setup_times = _setup_times(hass)[integration][group]
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
@@ -804,6 +882,51 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
     return domain_timings
 
 
+@callback
+def async_get_setup_trace_events(hass: core.HomeAssistant) -> list[dict[str, Any]]:
+    """Return the setup timeline as Chrome trace events.
+
+    Every integration and group is shown as a thread. The time spent
+    waiting for imports and base platforms is in the "wait" category,
+    the rest of the time of a phase is spent in the event loop.
+    """
+    spans = _setup_timeline(hass)
+    if not spans:
+        return []
+    origin = min(span.start for span in spans)
+    thread_ids: dict[tuple[str, str | None], int] = {}
+    events: list[dict[str, Any]] = []
+    for span in spans:
+        key = (span.integration, span.group)
+        if (thread_id := thread_ids.get(key)) is None:
+            thread_id = thread_ids[key] = len(thread_ids) + 1
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": thread_id,
+                    "args": {
+                        "name": span.integration
+                        if span.group is None
+                        else f"{span.integration} ({span.group})"
+                    },
+                }
+            )
+        events.append(
+            {
+                "name": span.phase,
+                "cat": "wait" if span.phase in _WAIT_PHASES else "setup",
+                "ph": "X",
+                "ts": round((span.start - origin) * 1000000),
+                "dur": round((span.end - span.start) * 1000000),
+                "pid": 1,
+                "tid": thread_id,
+            }
+        )
+    return events
+
+
 @callback
 def async_get_domain_setup_times(
     hass: core.HomeAssistant, domain: str
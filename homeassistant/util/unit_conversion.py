@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import lru_cache
 
 from homeassistant.const import (
@@ -113,6 +113,48 @@ class BaseUnitConverter:
         from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
         return lambda val: None if val is None else (val / from_ratio) * to_ratio
 
+    @classmethod
+    @lru_cache
+    def converter_factory_many(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float | None]], list[float | None]]:
+        """Return a function to convert many values which allows None.
+
+        Linear conversions are done in a single list comprehension instead
+        of calling a converter for each value.
+        """
+        if from_unit == to_unit:
+            return list
+        if (linear := cls.get_linear_conversion(from_unit, to_unit)) is None:
+            convert = cls.converter_factory_allow_none(from_unit, to_unit)
+            return lambda values: [convert(value) for value in values]
+        offset_before, from_ratio, to_ratio, offset_after = linear
+        if offset_before == 0 and offset_after == 0:
+            return lambda values: [
+                None if val is None else (val / from_ratio) * to_ratio
+                for val in values
+            ]
+        return lambda values: [
+            None
+            if val is None
+            else ((val + offset_before) / from_ratio) * to_ratio + offset_after
+            for val in values
+        ]
+
+    @classmethod
+    @lru_cache
+    def get_linear_conversion(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> tuple[float, float, float, float] | None:
+        """Get the offsets and ratios of a linear conversion.
+
+        A value is converted as
+        ((value + offset_before) / from_ratio) * to_ratio + offset_after,
+        None is returned if the conversion is not linear.
+        """
+        from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
+        return 0, from_ratio, to_ratio, 0
+
     @classmethod
     @lru_cache
     def get_unit_ratio(cls, from_unit: str | None, to_unit: str | None) -> float:
@@ -418,6 +460,16 @@ class SpeedConverter(BaseUnitConverter):
         from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
         return lambda val: (val / from_ratio) * to_ratio
 
+    @classmethod
+    @lru_cache
+    def get_linear_conversion(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> tuple[float, float, float, float] | None:
+        """Get the offsets and ratios of a linear conversion."""
+        if UnitOfSpeed.BEAUFORT in (from_unit, to_unit):
+            return None
+        return super().get_linear_conversion(from_unit, to_unit)
+
     @classmethod
     def _ms_to_beaufort(cls, ms: float) -> float:
         """Convert a speed in m/s to Beaufort."""
@@ -444,6 +496,28 @@ class TemperatureConverter(BaseUnitConverter):
         UnitOfTemperature.FAHRENHEIT: 1.8,
         UnitOfTemperature.KELVIN: 1.0,
     }
+    # The offsets and ratios of the conversions, they match the
+    # order of the operations in the _celsius_to_fahrenheit etc. methods
+    _LINEAR_CONVERSION: dict[
+        tuple[str | None, str | None], tuple[float, float, float, float]
+    ] = {
+        (UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT): (0, 1, 1.8, 32.0),
+        (UnitOfTemperature.CELSIUS, UnitOfTemperature.KELVIN): (0, 1, 1, 273.15),
+        (UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS): (-32.0, 1.8, 1, 0),
+        (UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.KELVIN): (
+            -32.0,
+            1.8,
+            1,
+            273.15,
+        ),
+        (UnitOfTemperature.KELVIN, UnitOfTemperature.CELSIUS): (-273.15, 1, 1, 0),
+        (UnitOfTemperature.KELVIN, UnitOfTemperature.FAHRENHEIT): (
+            -273.15,
+            1,
+            1.8,
+            32.0,
+        ),
+    }
 
     @classmethod
     @lru_cache
@@ -516,6 +590,22 @@ class TemperatureConverter(BaseUnitConverter):
             UNIT_NOT_RECOGNIZED_TEMPLATE.format(from_unit, cls.UNIT_CLASS)
         )
 
+    @classmethod
+    @lru_cache
+    def get_linear_conversion(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> tuple[float, float, float, float] | None:
+        """Get the offsets and ratios of a linear conversion."""
+        if from_unit == to_unit:
+            return 0, 1, 1, 0
+        try:
+            return cls._LINEAR_CONVERSION[(from_unit, to_unit)]
+        except KeyError:
+            unit = from_unit if from_unit not in cls.VALID_UNITS else to_unit
+            raise HomeAssistantError(
+                UNIT_NOT_RECOGNIZED_TEMPLATE.format(unit, cls.UNIT_CLASS)
+            ) from None
+
     @classmethod
     def convert_interval(cls, interval: float, from_unit: str, to_unit: str) -> float:
         """Convert a temperature interval from one unit to another.
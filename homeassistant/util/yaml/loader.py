@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+import copy
+from dataclasses import dataclass, field
 import fnmatch
+import hashlib
 from io import StringIO, TextIOWrapper
 import logging
+import math
 import os
 from pathlib import Path
 from typing import Any, TextIO, overload
@@ -128,7 +132,12 @@ class _LoaderMixin:
 class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
     """The fastest available safe loader, either C or Python."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        cached_yaml: _CachedYaml | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         self.stream = stream
 
@@ -142,6 +151,7 @@ class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
 
         super().__init__(stream)
         self.secrets = secrets
+        self.cached_yaml = cached_yaml
 
 
 class SafeLoader(FastSafeLoader):
@@ -178,10 +188,16 @@ class SafeLoader(FastSafeLoader):
 class PythonSafeLoader(yaml.SafeLoader, _LoaderMixin):
     """Python safe loader."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        cached_yaml: _CachedYaml | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
         self.secrets = secrets
+        self.cached_yaml = cached_yaml
 
 
 class SafeLineLoader(PythonSafeLoader):
@@ -218,6 +234,283 @@ class SafeLineLoader(PythonSafeLoader):
 type LoaderType = FastSafeLoader | PythonSafeLoader
 
 
+@dataclass(slots=True, frozen=True)
+class _SecretReference:
+    """A secret that is resolved when the content is loaded from the cache."""
+
+    requester_path: str
+    secret: str
+
+
+@dataclass(slots=True, frozen=True)
+class _EnvVarReference:
+    """An environment variable that is resolved when loaded from the cache."""
+
+    value: str
+
+
+@dataclass(slots=True)
+class _CachedYaml:
+    """The parsed content of a YAML file and the files it was loaded from."""
+
+    cache: YamlFileCache
+    # Digest of the file and of all the files it includes
+    files: dict[str, bytes] = field(default_factory=dict)
+    # YAML files found in the directories included with !include_dir_*
+    directories: dict[str, list[str]] = field(default_factory=dict)
+    content: JSON_TYPE | None = None
+
+
+class YamlFileCache:
+    """Cache the parsed content of YAML files until they change.
+
+    Files are parsed without resolving secrets and environment variables,
+    they are resolved every time the content is loaded. A file is only
+    parsed again if it, one of the files it includes or one of the included
+    directories changed. Unchanged included files are not parsed again.
+    The cache can be stored with as_dict and restored after a restart.
+    """
+
+    def __init__(self, stored: dict[str, Any] | None = None) -> None:
+        """Initialize the cache.
+
+        stored is the content returned by as_dict when the cache was
+        stored, the files are validated against their digests when used.
+        """
+        self._cache: dict[str, _CachedYaml] = {}
+        # Stored files which are restored when they are first used
+        self._stored: dict[str, Any] = dict(stored) if stored else {}
+        # A file was parsed since the cache was last returned by as_dict
+        self.changed = False
+        self.hits = 0
+        self.misses = 0
+
+    def load(
+        self, fname: str | os.PathLike[str], secrets: Secrets | None = None
+    ) -> JSON_TYPE | None:
+        """Load a YAML file.
+
+        This method needs to run in an executor.
+        """
+        return _resolve_references(self.get(os.fspath(fname)).content, secrets)
+
+    def get(self, fname: str) -> _CachedYaml:
+        """Return the cached YAML file, parse it again if it changed."""
+        try:
+            data = _read_file(fname)
+        except UnicodeDecodeError as exc:
+            _LOGGER.error("Unable to read file %s: %s", fname, exc)
+            raise HomeAssistantError(exc) from exc
+        digest = _digest(data)
+        if (cached_yaml := self._cache.get(fname)) is None:
+            cached_yaml = self._restore(fname)
+        if (
+            cached_yaml is not None
+            and cached_yaml.files.get(fname) == digest
+            and _is_unchanged(cached_yaml, fname)
+        ):
+            self.hits += 1
+            return cached_yaml
+
+        self.misses += 1
+        self.changed = True
+        stream = StringIO(data)
+        stream.name = fname
+        cached_yaml = _CachedYaml(self, {fname: digest})
+        cached_yaml.content = _parse_yaml_fastest(stream, None, cached_yaml)
+        self._cache[fname] = cached_yaml
+        return cached_yaml
+
+    def _restore(self, fname: str) -> _CachedYaml | None:
+        """Restore a stored file, return None if it was not stored.
+
+        Files are loaded from several executor threads, so the stored
+        file is popped in one step in case another thread restores it.
+        """
+        if (stored := self._stored.pop(fname, None)) is None:
+            return None
+        try:
+            cached_yaml = _CachedYaml(
+                self,
+                {
+                    file: bytes.fromhex(digest)
+                    for file, digest in stored["files"].items()
+                },
+                stored["directories"],
+                _decode(stored["content"]),
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.debug("Unable to restore the cached content of %s: %s", fname, exc)
+            return None
+        self._cache[fname] = cached_yaml
+        return cached_yaml
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cached files in a JSON serializable format to store them.
+
+        Files with content which can not be stored are left out, they are
+        parsed again when the stored cache is used.
+        This method needs to run in an executor.
+        """
+        self.changed = False
+        stored: dict[str, Any] = {}
+        for fname, cached_yaml in list(self._cache.items()):
+            try:
+                content = _encode(cached_yaml.content)
+            except ValueError as exc:
+                _LOGGER.debug("Unable to store the content of %s: %s", fname, exc)
+                continue
+            files = cached_yaml.files
+            stored[fname] = {
+                "files": {file: digest.hex() for file, digest in files.items()},
+                "directories": cached_yaml.directories,
+                "content": content,
+            }
+        return stored
+
+
+def _encode(obj: Any) -> Any:
+    """Encode parsed content to JSON serializable objects.
+
+    Strings, numbers, booleans and None are kept as is, all other objects
+    are encoded to a dict with their type and value.
+    """
+    obj_type = type(obj)
+    if obj is None or obj_type is str or obj_type is bool:
+        return obj
+    if obj_type is int:
+        if not -(2**63) <= obj < 2**64:
+            raise ValueError(f"Integer {obj} out of range")
+        return obj
+    if obj_type is float:
+        if not math.isfinite(obj):
+            raise ValueError(f"Float {obj} not supported")
+        return obj
+    encoded: dict[str, Any]
+    if obj_type is NodeStrClass:
+        encoded = {"t": "ns", "v": str(obj)}
+    elif obj_type is NodeDictClass or obj_type is dict:
+        encoded = {
+            "t": "nd" if obj_type is NodeDictClass else "d",
+            "v": [[_encode(key), _encode(value)] for key, value in obj.items()],
+        }
+    elif obj_type is NodeListClass or obj_type is list:
+        encoded = {
+            "t": "nl" if obj_type is NodeListClass else "l",
+            "v": [_encode(value) for value in obj],
+        }
+    elif obj_type is _SecretReference:
+        return {"t": "secret", "p": obj.requester_path, "v": obj.secret}
+    elif obj_type is _EnvVarReference:
+        return {"t": "env_var", "v": obj.value}
+    elif obj_type is Input:
+        return {"t": "input", "v": obj.name}
+    else:
+        raise ValueError(f"Type {obj_type.__name__} not supported")
+    try:  # suppress is much slower
+        encoded["f"] = obj.__config_file__
+        encoded["l"] = obj.__line__
+    except AttributeError:
+        pass
+    return encoded
+
+
+_DECODE_CLASSES: dict[str, type[dict | list | str]] = {
+    "d": dict,
+    "l": list,
+    "nd": NodeDictClass,
+    "nl": NodeListClass,
+    "ns": NodeStrClass,
+}
+
+
+def _decode(obj: Any) -> Any:
+    """Decode content encoded by _encode."""
+    if type(obj) is not dict:
+        return obj
+    obj_type: str = obj["t"]
+    if obj_type == "secret":
+        return _SecretReference(obj["p"], obj["v"])
+    if obj_type == "env_var":
+        return _EnvVarReference(obj["v"])
+    if obj_type == "input":
+        return Input(obj["v"])
+    value = obj["v"]
+    if obj_type in ("d", "nd"):
+        decoded: Any = _DECODE_CLASSES[obj_type](
+            (_decode(key), _decode(item)) for key, item in value
+        )
+    elif obj_type in ("l", "nl"):
+        decoded = _DECODE_CLASSES[obj_type](_decode(item) for item in value)
+    else:
+        decoded = _DECODE_CLASSES[obj_type](value)
+    if "f" in obj:
+        decoded.__config_file__ = obj["f"]
+        decoded.__line__ = obj["l"]
+    return decoded
+
+
+def _read_file(fname: str) -> str:
+    """Read the content of a YAML file."""
+    with open(fname, encoding="utf-8") as yaml_file:
+        return yaml_file.read()
+
+
+def _digest(data: str) -> bytes:
+    """Return the digest of the content of a file."""
+    return hashlib.sha1(data.encode(), usedforsecurity=False).digest()
+
+
+def _is_unchanged(cached_yaml: _CachedYaml, skip_fname: str) -> bool:
+    """Check if the included files and directories did not change."""
+    try:
+        for fname, digest in cached_yaml.files.items():
+            if fname != skip_fname and _digest(_read_file(fname)) != digest:
+                return False
+    except (OSError, UnicodeDecodeError):
+        return False
+    return all(
+        _find_yaml_files(directory) == files
+        for directory, files in cached_yaml.directories.items()
+    )
+
+
+def _resolve_references(obj: Any, secrets: Secrets | None) -> Any:
+    """Copy cached content and resolve secrets and environment variables.
+
+    Dictionaries and lists are copied as the configuration may be modified
+    after it has been loaded.
+    """
+    obj_type = type(obj)
+    if obj_type is NodeDictClass or obj_type is dict:
+        new_obj: Any = obj_type(
+            {
+                (
+                    _resolve_references(key, secrets)
+                    if type(key) is _SecretReference or type(key) is _EnvVarReference
+                    else key
+                ): _resolve_references(value, secrets)
+                for key, value in obj.items()
+            }
+        )
+    elif obj_type is NodeListClass or obj_type is list:
+        new_obj = obj_type([_resolve_references(value, secrets) for value in obj])
+    elif obj_type is _SecretReference:
+        if secrets is None:
+            raise HomeAssistantError("Secrets not supported in this YAML file")
+        return secrets.get(obj.requester_path, obj.secret)
+    elif obj_type is _EnvVarReference:
+        return _get_env_var(obj.value)
+    else:
+        return obj
+    try:  # suppress is much slower
+        new_obj.__config_file__ = obj.__config_file__
+        new_obj.__line__ = obj.__line__
+    except AttributeError:
+        pass
+    return new_obj
+
+
 def load_yaml(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> JSON_TYPE | None:
@@ -231,14 +524,20 @@ def load_yaml(
 
 
 def load_yaml_dict(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    yaml_cache: YamlFileCache | None = None,
 ) -> dict:
     """Load a YAML file and ensure the top level is a dict.
 
     Raise if the top level is not a dict.
     Return an empty dict if the file is empty.
+    If a YAML file cache is passed, the files are only parsed if they changed.
     """
-    loaded_yaml = load_yaml(fname, secrets)
+    if yaml_cache is not None:
+        loaded_yaml = yaml_cache.load(fname, secrets)
+    else:
+        loaded_yaml = load_yaml(fname, secrets)
     if loaded_yaml is None:
         loaded_yaml = {}
     if not isinstance(loaded_yaml, dict):
@@ -248,27 +547,38 @@ def load_yaml_dict(
 
 def parse_yaml(
     content: str | TextIO | StringIO, secrets: Secrets | None = None
+) -> JSON_TYPE:
+    """Parse YAML with the fastest available loader."""
+    return _parse_yaml_fastest(content, secrets)
+
+
+def _parse_yaml_fastest(
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    cached_yaml: _CachedYaml | None = None,
 ) -> JSON_TYPE:
     """Parse YAML with the fastest available loader."""
     if not HAS_C_LOADER:
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content, secrets, cached_yaml)
     try:
-        return _parse_yaml(FastSafeLoader, content, secrets)
+        return _parse_yaml(FastSafeLoader, content, secrets, cached_yaml)
     except yaml.YAMLError:
         # Loading failed, so we now load with the Python loader which has more
         # readable exceptions
         if isinstance(content, (StringIO, TextIO, TextIOWrapper)):
             # Rewind the stream so we can try again
             content.seek(0, 0)
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content, secrets, cached_yaml)
 
 
 def _parse_yaml_python(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    cached_yaml: _CachedYaml | None = None,
 ) -> JSON_TYPE:
     """Parse YAML with the python loader (this is very slow)."""
     try:
-        return _parse_yaml(PythonSafeLoader, content, secrets)
+        return _parse_yaml(PythonSafeLoader, content, secrets, cached_yaml)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
@@ -278,9 +588,13 @@ def _parse_yaml(
     loader: type[FastSafeLoader | PythonSafeLoader],
     content: str | TextIO,
     secrets: Secrets | None = None,
+    cached_yaml: _CachedYaml | None = None,
 ) -> JSON_TYPE:
     """Load a YAML file."""
-    return yaml.load(content, Loader=lambda stream: loader(stream, secrets))  # type: ignore[arg-type]
+    return yaml.load(
+        content,
+        Loader=lambda stream: loader(stream, secrets, cached_yaml),  # type: ignore[arg-type]
+    )
 
 
 @overload
@@ -348,6 +662,26 @@ def _add_reference_to_node_class(
     return obj
 
 
+def _load_included_yaml(loader: LoaderType, fname: str) -> JSON_TYPE | None:
+    """Load an included YAML file, from the cache if the loader uses one."""
+    if (cached_yaml := loader.cached_yaml) is None:
+        return load_yaml(fname, loader.secrets)
+    included_yaml = cached_yaml.cache.get(fname)
+    cached_yaml.files.update(included_yaml.files)
+    cached_yaml.directories.update(included_yaml.directories)
+    # The includes add a reference to the loaded object, copy it
+    # to not modify the cached content of the included file
+    return copy.copy(included_yaml.content)
+
+
+def _find_included_files(loader: LoaderType, directory: str) -> list[str]:
+    """Find the YAML files of an included directory."""
+    files = _find_yaml_files(directory)
+    if (cached_yaml := loader.cached_yaml) is not None:
+        cached_yaml.directories[directory] = files
+    return files
+
+
 def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embed it using the !include tag.
 
@@ -357,7 +691,7 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.get_name), node.value)
     try:
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = _load_included_yaml(loader, fname)
         if loaded_yaml is None:
             loaded_yaml = NodeDictClass()
         return _add_reference(loaded_yaml, loader, node)
@@ -382,15 +716,22 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _find_yaml_files(directory: str) -> list[str]:
+    """Find the YAML files in a directory, except the secrets."""
+    return [
+        fname
+        for fname in _find_files(directory, "*.yaml")
+        if os.path.basename(fname) != SECRET_YAML
+    ]
+
+
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loader, loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = _load_included_yaml(loader, fname)
         if loaded_yaml is None:
             # Special case, an empty file included by !include_dir_named is treated
             # as an empty dictionary
@@ -405,10 +746,8 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+    for fname in _find_included_files(loader, loc):
+        loaded_yaml = _load_included_yaml(loader, fname)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference_to_node_class(mapping, loader, node)
@@ -421,9 +760,8 @@ def _include_dir_list_yaml(
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     return [
         loaded_yaml
-        for f in _find_files(loc, "*.yaml")
-        if os.path.basename(f) != SECRET_YAML
-        and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
+        for f in _find_included_files(loader, loc)
+        if (loaded_yaml := _load_included_yaml(loader, f)) is not None
     ]
 
 
@@ -433,10 +771,8 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
-        if os.path.basename(fname) == SECRET_YAML:
-            continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+    for fname in _find_included_files(loader, loc):
+        loaded_yaml = _load_included_yaml(loader, fname)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
@@ -501,19 +837,28 @@ def _handle_scalar_tag(
 
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
-    args = node.value.split()
+    if loader.cached_yaml is not None:
+        return _EnvVarReference(node.value)  # type: ignore[return-value]
+    return _get_env_var(node.value)
+
+
+def _get_env_var(value: str) -> str:
+    """Return the value of an environment variable or its default."""
+    args = value.split()
 
     # Check for a default value
     if len(args) > 1:
         return os.getenv(args[0], " ".join(args[1:]))
     if args[0] in os.environ:
         return os.environ[args[0]]
-    _LOGGER.error("Environment variable %s not defined", node.value)
-    raise HomeAssistantError(node.value)
+    _LOGGER.error("Environment variable %s not defined", value)
+    raise HomeAssistantError(value)
 
 
 def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
+    if loader.cached_yaml is not None:
+        return _SecretReference(loader.get_name, node.value)  # type: ignore[return-value]
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
@@ -172,6 +172,124 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sent in chunks with a cursor."""
+    start_time = dt_util.utcnow() - timedelta(hours=3)
+    start_ts = start_time.timestamp()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    # The second state is updated exactly at the end of the first chunk
+    for state, seconds in (("1", 1800), ("2", 3600), ("3", 9000)):
+        hass.states.async_set("sensor.test", state, timestamp=start_ts + seconds)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(hours=3)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "include_start_time_state": False,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "chunk_hours": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    chunks = []
+    while True:
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        chunks.append(response["event"])
+        if response["event"]["cursor"] is None:
+            break
+
+    assert len(chunks) == 3
+    assert chunks[0]["start_time"] == pytest.approx(start_ts)
+    assert chunks[-1]["end_time"] == pytest.approx(start_ts + 3 * 3600)
+    for chunk, next_chunk in zip(chunks, chunks[1:], strict=False):
+        assert dt_util.parse_datetime(chunk["cursor"]).timestamp() == pytest.approx(
+            next_chunk["start_time"]
+        )
+    assert [
+        (state["s"], state["lu"])
+        for chunk in chunks
+        for state in chunk["states"].get("sensor.test", [])
+    ] == [
+        ("1", pytest.approx(start_ts + 1800, abs=1e-3)),
+        ("2", pytest.approx(start_ts + 3600, abs=1e-3)),
+        ("3", pytest.approx(start_ts + 9000, abs=1e-3)),
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": (dt_util.utcnow() + timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "chunk_hours": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 2
+    response = await client.receive_json()
+    assert response["id"] == 2
+    assert response["event"]["states"] == {}
+    assert response["event"]["cursor"] is None
+
+
+async def test_history_during_period_chunked_fetch_error(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a chunk that fails to be fetched ends the chunks with an error."""
+    start_time = dt_util.utcnow() - timedelta(hours=3)
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.recorder.history.get_significant_states_columns",
+        side_effect=ValueError,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": start_time.isoformat(),
+                "end_time": (start_time + timedelta(hours=3)).isoformat(),
+                "entity_ids": ["sensor.test"],
+                "chunk_hours": 1,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        assert response["event"]["error"] == {
+            "code": "unknown_error",
+            "message": "Unknown error",
+        }
+        assert dt_util.parse_datetime(response["event"]["cursor"]) == start_time
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
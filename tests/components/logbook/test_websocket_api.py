@@ -296,6 +296,88 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events sent in chunks with a cursor."""
+    start_time = dt_util.utcnow() - timedelta(hours=3)
+    start_ts = start_time.timestamp()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    # The second change is exactly at the end of the first chunk
+    for state, seconds in (
+        (STATE_OFF, -60),
+        (STATE_ON, 1800),
+        (STATE_OFF, 3600),
+        (STATE_ON, 9000),
+    ):
+        hass.states.async_set("light.kitchen", state, timestamp=start_ts + seconds)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(hours=3)).isoformat(),
+            "entity_ids": ["light.kitchen"],
+            "chunk_hours": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    chunks = []
+    while True:
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        chunks.append(response["event"])
+        if response["event"]["cursor"] is None:
+            break
+
+    assert len(chunks) == 3
+    assert chunks[0]["start_time"] == pytest.approx(start_ts)
+    assert chunks[-1]["end_time"] == pytest.approx(start_ts + 3 * 3600)
+    for chunk, next_chunk in zip(chunks, chunks[1:], strict=False):
+        assert dt_util.parse_datetime(chunk["cursor"]).timestamp() == pytest.approx(
+            next_chunk["start_time"]
+        )
+    assert [
+        (event["state"], event["when"]) for chunk in chunks for event in chunk["events"]
+    ] == [
+        (STATE_ON, pytest.approx(start_ts + 1800, abs=1e-3)),
+        (STATE_OFF, pytest.approx(start_ts + 3600, abs=1e-3)),
+        (STATE_ON, pytest.approx(start_ts + 9000, abs=1e-3)),
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "logbook/get_events",
+            "start_time": (dt_util.utcnow() + timedelta(hours=1)).isoformat(),
+            "chunk_hours": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 2
+    response = await client.receive_json()
+    assert response["id"] == 2
+    assert response["event"]["events"] == []
+    assert response["event"]["cursor"] is None
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
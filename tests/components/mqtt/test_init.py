@@ -25,6 +25,8 @@ from homeassistant.components.mqtt.client import (
     _LOGGER as CLIENT_LOGGER,
     RECONNECT_INTERVAL_SECONDS,
     EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
 )
 from homeassistant.components.mqtt.models import (
     MessageCallbackType,
@@ -1417,6 +1419,95 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "match"),
+    [
+        ("test-topic/+/on", "test-topic/bier/on", True),
+        ("test-topic/+/on", "test-topic//on", True),
+        ("test-topic/+/on", "test-topic/bier", False),
+        ("test-topic/+/on", "test-topic/bier/on/off", False),
+        ("test-topic/#", "test-topic", True),
+        ("test-topic/#", "test-topic/bier/on", True),
+        ("test-topic/#", "test-topic-123", False),
+        ("test-topic/+/#", "test-topic/bier", True),
+        ("test-topic/+/#", "test-topic/bier/on", True),
+        ("test-topic/+/#", "test-topic", False),
+        ("+/+", "test-topic/bier", True),
+        ("+/+", "/bier", True),
+        ("+", "test-topic/bier", False),
+        ("#", "test-topic/bier", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_subscription_trie_matches(topic_filter: str, topic: str, match: bool) -> None:
+    """Test matching topics against the subscription trie."""
+    trie = SubscriptionTrie()
+    subscription = Subscription(topic_filter, False, Mock())
+    trie.add(subscription)
+    assert trie.matches(topic) == ([subscription] if match else [])
+    assert trie.has_topic(topic_filter)
+    assert list(trie) == [subscription]
+    assert len(trie) == 1
+
+    trie.remove(subscription)
+    assert trie.matches(topic) == []
+    assert not trie.has_topic(topic_filter)
+    assert list(trie) == []
+    assert len(trie) == 0
+    with pytest.raises(KeyError):
+        trie.remove(subscription)
+
+
+async def test_subscribe_updates_cached_matches(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test adding and removing subscriptions updates the cached matches."""
+    await mqtt_mock_entry()
+    calls_wildcard: list[str] = []
+    calls_subtree: list[str] = []
+    calls_simple: list[str] = []
+
+    unsub_wildcard = await mqtt.async_subscribe(
+        hass, "test-topic/+/on", callback(lambda msg: calls_wildcard.append(msg.topic))
+    )
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/wein/on", "test-payload")
+    await hass.async_block_till_done()
+    assert calls_wildcard == ["test-topic/bier/on", "test-topic/wein/on"]
+
+    unsub_subtree = await mqtt.async_subscribe(
+        hass, "test-topic/bier/#", callback(lambda msg: calls_subtree.append(msg.topic))
+    )
+    unsub_simple = await mqtt.async_subscribe(
+        hass, "test-topic/wein/on", callback(lambda msg: calls_simple.append(msg.topic))
+    )
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/wein/on", "test-payload")
+    await hass.async_block_till_done()
+    assert calls_wildcard == [
+        "test-topic/bier/on",
+        "test-topic/wein/on",
+        "test-topic/bier/on",
+        "test-topic/wein/on",
+    ]
+    assert calls_subtree == ["test-topic/bier/on"]
+    assert calls_simple == ["test-topic/wein/on"]
+
+    unsub_wildcard()
+    unsub_simple()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/wein/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls_wildcard) == 4
+    assert calls_subtree == ["test-topic/bier/on", "test-topic/bier/on"]
+    assert calls_simple == ["test-topic/wein/on"]
+    unsub_subtree()
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
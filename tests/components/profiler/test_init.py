@@ -2,6 +2,7 @@
 
 from datetime import timedelta
 from functools import lru_cache
+import json
 import logging
 import os
 from pathlib import Path
@@ -18,6 +19,7 @@ from homeassistant.components.profiler import (
     CONF_ENABLED,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_DUMP_SETUP_TIMELINE,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
@@ -70,6 +72,57 @@ async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
     await hass.async_block_till_done()
 
 
+async def test_dump_setup_timeline(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test we can dump the startup timeline as a Chrome trace file."""
+    test_dir = tmp_path / "profiles"
+    test_dir.mkdir()
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_DUMP_SETUP_TIMELINE)
+
+    last_filename = None
+
+    def _mock_path(filename: str) -> str:
+        nonlocal last_filename
+        last_filename = str(test_dir / filename)
+        return last_filename
+
+    trace_events = [
+        {
+            "name": "setup",
+            "cat": "setup",
+            "ph": "X",
+            "ts": 0,
+            "dur": 5000,
+            "pid": 1,
+            "tid": 1,
+        }
+    ]
+    with (
+        patch(
+            "homeassistant.components.profiler.async_get_setup_trace_events",
+            return_value=trace_events,
+        ),
+        patch.object(hass.config, "path", _mock_path),
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_SETUP_TIMELINE, {}, blocking=True
+        )
+
+    assert json.loads(Path(last_filename).read_text()) == {
+        "traceEvents": trace_events,
+        "displayTimeUnit": "ms",
+    }
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_memory_usage(hass: HomeAssistant, tmp_path: Path) -> None:
     """Test we can setup and the service is registered."""
     test_dir = tmp_path / "profiles"
@@ -0,0 +1,68 @@
+"""The tests for the recorder table managers."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+from homeassistant.components.recorder.table_managers import BaseLRUTableManager
+
+
+def _lookup(manager: BaseLRUTableManager, key: str) -> None:
+    """Look up a key like the recorder does and load it on a miss."""
+    if manager.get_from_cache(key) is None:
+        # Like get_many after a miss in the cache
+        if manager._id_map.get(key) is None:
+            manager._count_miss(key)
+            manager._id_map[key] = 1
+
+
+def test_adapt_lru_size() -> None:
+    """Test the LRU grows on refetches and shrinks when evictions are not used."""
+    manager: BaseLRUTableManager = BaseLRUTableManager(Mock(), 4)
+
+    # Cycling through more keys than fit refetches every evicted key
+    for _ in range(3):
+        for idx in range(6):
+            _lookup(manager, f"key_{idx}")
+    assert manager.lru_stats() == {
+        "size": 4,
+        "max_size": 4,
+        "hits": 0,
+        "misses": 18,
+        "evictions": 14,
+        "refetches": 12,
+    }
+    manager.adapt_lru_size()
+    assert manager.lru_stats()["max_size"] == 8
+
+    # Now all keys fit
+    for _ in range(3):
+        for idx in range(6):
+            _lookup(manager, f"key_{idx}")
+    manager.adapt_lru_size()
+    assert manager.lru_stats()["max_size"] == 8
+    # Each lookup is counted once even though a miss looks up the LRU twice
+    assert manager.lru_stats()["hits"] == 16
+    assert manager.lru_stats()["misses"] == 20
+
+    # Keys that are never looked up again are evicted without refetches
+    for idx in range(20):
+        _lookup(manager, f"new_key_{idx}")
+    manager.adapt_lru_size()
+    assert manager.lru_stats()["max_size"] == 4
+    manager.adapt_lru_size()
+    assert manager.lru_stats()["max_size"] == 4
+
+    # The minimum size wins over shrinking
+    for idx in range(20):
+        _lookup(manager, f"other_key_{idx}")
+    manager.adapt_lru_size(16)
+    assert manager.lru_stats()["max_size"] == 16
+
+    # The memory budget caps growing
+    with patch("homeassistant.components.recorder.table_managers.LRU_MEMORY_BUDGET", 0):
+        for _ in range(2):
+            for idx in range(32):
+                _lookup(manager, f"budget_key_{idx}")
+        manager.adapt_lru_size()
+    assert manager.lru_stats()["max_size"] == 4
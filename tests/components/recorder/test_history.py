@@ -30,8 +30,9 @@ from homeassistant.components.recorder.models.legacy import (
 from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .common import (
     assert_dict_of_states_equal_without_context_and_last_changed,
@@ -592,6 +593,38 @@ async def test_get_significant_states_minimal_response(
     )
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+async def test_get_significant_states_columns(
+    hass: HomeAssistant, minimal_response: bool, no_attributes: bool
+) -> None:
+    """Test the columns serialize to the same JSON as the compressed states."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        list(states),
+        None,
+        True,
+        True,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    columns = history.get_significant_states_columns(
+        hass, zero, four, list(states), True, True, minimal_response, no_attributes
+    )
+
+    assert list(columns) == list(hist)
+    assert json_loads(json_bytes(columns)) == json_loads(json_bytes(hist))
+    for entity_id, entity_columns in columns.items():
+        assert entity_columns.as_compressed_states() == hist[entity_id]
+        assert entity_columns.last_updated_ts == hist[entity_id][-1]["lu"]
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 async def test_get_significant_states_with_initial(
     time_zone, hass: HomeAssistant
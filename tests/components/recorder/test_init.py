@@ -400,11 +400,11 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        instance = get_instance(hass)
+        if instance.states_manager.has_pending_rows() or any(
+            isinstance(obj, States) for obj in instance.event_session
+        ):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -1471,12 +1471,101 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+async def test_saving_sets_old_state_bulk_insert(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test saving sets old state when states are written with bulk inserts."""
+    instance = recorder.get_instance(hass)
+    # MySQL and older MariaDB can't return the inserted ids in order
+    # and fall back to flushing ORM objects
+    assert instance._bulk_insert_states is (
+        instance.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+    )
+
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    hass.states.async_set("test.one", "s2", {"attr": 2})
+    hass.states.async_set("test.two", "s3", {"attr": 1})
+    hass.states.async_set("test.one", "s4", {"attr": 1})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s5", {"attr": 2})
+    hass.states.async_set("test.two", "s6", {"attr": 3})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 6
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.one"
+        assert states_by_state["s3"].entity_id == "test.two"
+        assert states_by_state["s4"].entity_id == "test.one"
+        assert states_by_state["s5"].entity_id == "test.one"
+        assert states_by_state["s6"].entity_id == "test.two"
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id is None
+        assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state["s6"].old_state_id == states_by_state["s3"].state_id
+
+        assert (
+            states_by_state["s1"].attributes_id == states_by_state["s3"].attributes_id
+        )
+        assert (
+            states_by_state["s1"].attributes_id == states_by_state["s4"].attributes_id
+        )
+        assert (
+            states_by_state["s2"].attributes_id == states_by_state["s5"].attributes_id
+        )
+        assert (
+            states_by_state["s1"].attributes_id != states_by_state["s2"].attributes_id
+        )
+        assert session.query(StateAttributes).count() == 3
+
+
+async def test_saving_sets_old_state_without_bulk_insert(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test saving sets old state when the database does not support bulk inserts."""
+    instance = recorder.get_instance(hass)
+    with patch.object(instance, "_bulk_insert_states", False):
+        hass.states.async_set("test.one", "s1", {})
+        hass.states.async_set("test.one", "s2", {})
+        await async_wait_recording_done(hass)
+        hass.states.async_set("test.one", "s3", {})
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id, States.state_id, States.old_state_id, States.state
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 3
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id == states_by_state["s2"].state_id
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
     """Test saving data that cannot be serialized does not crash."""
     hass.bus.async_fire("bad_event", {"fail": CannotSerializeMe()})
     hass.states.async_set("test.one", "s1", {"fail": CannotSerializeMe()})
+    hass.states.async_set("test.one", "s4", {})
     hass.states.async_set("test.two", "s2", {})
     hass.states.async_set("test.two", "s3", {})
     await async_wait_recording_done(hass)
@@ -1487,8 +1576,11 @@ async def test_saving_state_with_serializable_data(
                 StatesMeta.entity_id, States.state_id, States.old_state_id, States.state
             ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
         )
-        assert len(states) == 2
+        assert len(states) == 3
         states_by_state = {state.state: state for state in states}
+        # The state that was not saved is not the old state of the next one
+        assert states_by_state["s4"].entity_id == "test.one"
+        assert states_by_state["s4"].old_state_id is None
         assert states_by_state["s2"].entity_id == "test.two"
         assert states_by_state["s3"].entity_id == "test.two"
         assert states_by_state["s2"].old_state_id is None
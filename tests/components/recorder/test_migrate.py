@@ -633,3 +633,13 @@ def test_raise_if_exception_missing_empty_cause_str() -> None:
 
     with pytest.raises(ProgrammingError):
         migration.raise_if_exception_missing_str(programming_exc, ["not present"])
+
+
+def test_partitioning_migration_is_not_live() -> None:
+    """Test converting the tables to partitioned tables is not done live."""
+    assert migration.live_migration(
+        migration.SchemaValidationStatus(SCHEMA_VERSION, {"states.4-byte UTF-8"}, False)
+    )
+    assert not migration.live_migration(
+        migration.SchemaValidationStatus(SCHEMA_VERSION, {"states.partitioned"}, False)
+    )
@@ -3,18 +3,21 @@
 from datetime import datetime, timedelta
 import json
 import sqlite3
+import time
 from unittest.mock import patch
 
 from freezegun import freeze_time
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 from typing_extensions import Generator
 from voluptuous.error import MultipleInvalid
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.const import PartitionInterval, SupportedDialect
 from homeassistant.components.recorder.db_schema import (
+    EventData,
     Events,
     EventTypes,
     RecorderRuns,
@@ -25,6 +28,14 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
+from homeassistant.components.recorder.partitions import (
+    PARTITIONS_AHEAD,
+    _parse_upper_bound,
+    create_partitions,
+    get_partitions,
+    partition_name,
+    partition_start,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
@@ -1464,6 +1475,218 @@ async def test_purge_entities(
         assert states_meta_remain.count() == 4
 
 
+@pytest.mark.parametrize("slow_range_in_select", [True, False])
+async def test_purge_keeps_attributes_used_by_kept_states(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    slow_range_in_select: bool,
+) -> None:
+    """Test attributes of purged states are only removed when they are unused."""
+    instance = await async_setup_recorder_instance(hass)
+    utcnow = dt_util.utcnow()
+    with freeze_time(utcnow - timedelta(days=5)):
+        hass.states.async_set("sensor.shared", "1", {"shared": True})
+        hass.states.async_set("sensor.unused", "1", {"unused": True})
+        await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.shared", "2", {"shared": True})
+    hass.states.async_set("sensor.unused", "2", {"unused": False})
+    await async_wait_recording_done(hass)
+
+    with (
+        patch.object(
+            instance.database_engine.optimizer,
+            "slow_range_in_select",
+            slow_range_in_select,
+        ),
+        session_scope(hass=hass) as session,
+    ):
+        assert session.query(StateAttributes).count() == 3
+        finished = purge_old_data(instance, utcnow - timedelta(days=4), repack=False)
+        assert finished
+        assert session.query(States).count() == 2
+        assert {
+            state_attributes.shared_attrs
+            for state_attributes in session.query(StateAttributes)
+        } == {'{"shared":true}', '{"unused":false}'}
+
+
+def test_partition_bounds() -> None:
+    """Test partitions start at midnight UTC and weekly ones on Monday."""
+    # Thursday
+    timestamp = datetime(2024, 5, 16, 13, 45, tzinfo=dt_util.UTC).timestamp()
+    daily_start = partition_start(PartitionInterval.DAILY, timestamp)
+    weekly_start = partition_start(PartitionInterval.WEEKLY, timestamp)
+    assert dt_util.utc_from_timestamp(daily_start) == datetime(
+        2024, 5, 16, tzinfo=dt_util.UTC
+    )
+    assert dt_util.utc_from_timestamp(weekly_start) == datetime(
+        2024, 5, 13, tzinfo=dt_util.UTC
+    )
+    assert partition_start(PartitionInterval.WEEKLY, weekly_start) == weekly_start
+    assert partition_name("states", weekly_start) == "states_p20240513"
+
+    assert (
+        _parse_upper_bound("FOR VALUES FROM ('1715558400') TO ('1716163200')")
+        == 1716163200
+    )
+    assert _parse_upper_bound("FOR VALUES FROM (MINVALUE) TO ('1716163200')") == (
+        1716163200
+    )
+    assert _parse_upper_bound("DEFAULT") is None
+
+
+async def test_partition_interval_requires_postgresql(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the partition interval is ignored with other databases."""
+    if recorder_db_url.startswith("postgresql://"):
+        return
+
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_PARTITION_INTERVAL: "weekly"}
+    )
+    assert instance.partition_interval is None
+    assert "Partitioned tables are only supported with PostgreSQL" in caplog.text
+
+
+async def test_purge_drops_expired_partitions(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+) -> None:
+    """Test the purge drops the partitions that are fully expired."""
+    if not recorder_db_url.startswith("postgresql://"):
+        # Partitioned tables are only supported with PostgreSQL
+        return
+
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_PARTITION_INTERVAL: "daily"}
+    )
+    assert instance.partition_interval is PartitionInterval.DAILY
+
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+
+    # The existing rows end up in the legacy partition that
+    # ends at the end of the current day
+    with session_scope(hass=hass, read_only=True) as session:
+        for table in ("states", "events"):
+            partitions = {
+                partition.name for partition in get_partitions(session, table)
+            }
+            assert f"{table}_legacy" in partitions
+            assert f"{table}_default" in partitions
+            assert len(partitions) == PARTITIONS_AHEAD + 2
+
+    # Keep the session closed while purging since dropping
+    # a partition waits for all locks on the table
+    purge_before = dt_util.utcnow() + timedelta(days=1)
+    finished = purge_old_data(instance, purge_before, repack=False)
+    assert finished
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 0
+        assert session.query(StateAttributes).count() == 0
+        assert session.query(Events).count() == 0
+        assert session.query(EventData).count() == 0
+        for table in ("states", "events"):
+            partitions = {
+                partition.name for partition in get_partitions(session, table)
+            }
+            assert f"{table}_legacy" not in partitions
+            assert len(partitions) == PARTITIONS_AHEAD + 1
+
+    # Rows older than the first partition end up in the default partition
+    await _add_test_states(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 6
+
+
+async def test_purge_drops_expired_partitions_evicts_old_states(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+) -> None:
+    """Test states in dropped partitions are no longer used as old states."""
+    if not recorder_db_url.startswith("postgresql://"):
+        # Partitioned tables are only supported with PostgreSQL
+        return
+
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_PARTITION_INTERVAL: "daily"}
+    )
+    await _add_test_states(hass)
+    assert "test.recorder2" in instance.states_manager._last_committed_id
+
+    purge_before = dt_util.utcnow() + timedelta(days=1)
+    finished = purge_old_data(instance, purge_before, repack=False)
+    assert finished
+    assert "test.recorder2" not in instance.states_manager._last_committed_id
+
+    hass.states.async_set("test.recorder2", "after_drop")
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        state = session.query(States).filter(States.state == "after_drop").one()
+        assert state.old_state_id is None
+
+
+async def test_create_partitions_moves_rows_from_default_partition(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+) -> None:
+    """Test rows in the default partition are moved to the new partition."""
+    if not recorder_db_url.startswith("postgresql://"):
+        # Partitioned tables are only supported with PostgreSQL
+        return
+
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_PARTITION_INTERVAL: "daily"}
+    )
+    # After the last partition, like when the clock jumped ahead
+    timestamp = partition_start(
+        PartitionInterval.DAILY, time.time() + 86400 * (PARTITIONS_AHEAD + 2)
+    )
+    name = partition_name("states", timestamp)
+
+    def _add_and_create_partitions() -> None:
+        with session_scope(hass=hass) as session:
+            session.add(States(state="future", last_updated_ts=timestamp))
+        with session_scope(hass=hass) as session:
+            create_partitions(session, PartitionInterval.DAILY, timestamp)
+
+    await instance.async_add_executor_job(_add_and_create_partitions)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        partitions = {partition.name for partition in get_partitions(session, "states")}
+        assert name in partitions
+        count = text(f"SELECT COUNT(*) FROM {name}")  # noqa: S608
+        assert session.execute(count).scalar() == 1
+        assert session.query(States).filter(States.state == "future").count() == 1
+
+
+async def test_create_partitions_error(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the rows are purged in batches if the partitions cannot be created."""
+    instance = await async_setup_recorder_instance(hass)
+    instance.partition_interval = PartitionInterval.DAILY
+
+    with patch(
+        "homeassistant.components.recorder.core.partitions.create_partitions",
+        side_effect=OperationalError("statement", {}, Exception("overlap")),
+    ):
+        await instance.async_add_executor_job(instance._create_partitions)
+
+    assert instance.partition_interval is None
+    assert "Error creating partitions" in caplog.text
+
+
 async def _add_test_states(hass: HomeAssistant, wait_recording_done: bool = True):
     """Add multiple states to the db for testing."""
     utcnow = dt_util.utcnow()
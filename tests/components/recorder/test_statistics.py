@@ -1,6 +1,7 @@
 """The tests for sensor recorder platform."""
 
-from datetime import timedelta
+from datetime import time, timedelta
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -8,7 +9,10 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -30,6 +34,7 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
 )
+from homeassistant.components.recorder.tasks import CompileDailyStatisticsTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant
@@ -1824,6 +1829,141 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+def _statistics_during_period_from_hourly(
+    hass: HomeAssistant, *args: Any, **kwargs: Any
+) -> dict[str, list[dict[str, Any]]]:
+    """Call statistics_during_period without using the daily statistics."""
+    statistics_daily_manager = recorder.get_instance(hass).statistics_daily_manager
+    time_zone = statistics_daily_manager.time_zone
+    statistics_daily_manager.time_zone = None
+    try:
+        return statistics.statistics_during_period(hass, *args, **kwargs)
+    finally:
+        statistics_daily_manager.time_zone = time_zone
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-11-10 00:00:00+00:00")
+async def test_daily_statistics(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone,
+) -> None:
+    """Test statistics of days, weeks and months are reduced from daily statistics."""
+    instance = recorder.get_instance(hass)
+    statistics_daily_manager = instance.statistics_daily_manager
+    await hass.config.async_set_time_zone(timezone)
+    instance.queue_task(CompileDailyStatisticsTask())
+    await async_wait_recording_done(hass)
+    assert statistics_daily_manager.active
+
+    # Hourly statistics around the end of DST in Europe/Vienna, the mean
+    # only changes every day to compare the weighted means exactly
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-20 05:00:00"))
+    zero = start - timedelta(days=31)
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "max": hour % 24 + 10,
+            "mean": hour // 24 * 10,
+            "min": -(hour % 24),
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(24 * 20)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        daily_starts = session.execute(select(StatisticsDaily.start_ts)).scalars()
+        assert {
+            dt_util.as_local(dt_util.utc_from_timestamp(start_ts)).time()
+            for start_ts in daily_starts
+        } == {time.min}
+
+    types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
+    for period in ("day", "week", "month"):
+        stats = statistics.statistics_during_period(
+            hass, zero, None, None, period, None, types
+        )
+        assert stats
+        assert stats == _statistics_during_period_from_hourly(
+            hass, zero, None, None, period, None, types
+        )
+
+    # The daily statistics are kept up to date when the sum is adjusted
+    instance.async_adjust_statistics(
+        "test:total_energy_import", start + timedelta(days=5, hours=3), 100, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    for period in ("day", "week", "month"):
+        assert statistics.statistics_during_period(
+            hass, zero, None, None, period, None, types
+        ) == _statistics_during_period_from_hourly(
+            hass, zero, None, None, period, None, types
+        )
+
+    # The daily statistics are not used until they are rebuilt
+    # for the new time zone
+    await hass.config.async_set_time_zone("Asia/Kolkata")
+    assert not statistics_daily_manager.active
+    instance.queue_task(CompileDailyStatisticsTask())
+    await async_wait_recording_done(hass)
+    assert statistics_daily_manager.active
+
+    with session_scope(hass=hass, read_only=True) as session:
+        daily_starts = session.execute(select(StatisticsDaily.start_ts)).scalars()
+        assert {
+            dt_util.as_local(dt_util.utc_from_timestamp(start_ts)).time()
+            for start_ts in daily_starts
+        } == {time.min}
+
+    for period in ("day", "week", "month"):
+        assert statistics.statistics_during_period(
+            hass, zero, None, None, period, None, types
+        ) == _statistics_during_period_from_hourly(
+            hass, zero, None, None, period, None, types
+        )
+
+
+async def test_daily_statistics_rebuild_queued_once(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test a rebuild of the daily statistics is only queued once at a time."""
+    instance = recorder.get_instance(hass)
+    statistics_daily_manager = instance.statistics_daily_manager
+    await async_wait_recording_done(hass)
+    await hass.config.async_set_time_zone("Asia/Kolkata")
+    assert not statistics_daily_manager.active
+
+    with patch.object(instance, "queue_task") as queue_task:
+        for _ in range(3):
+            instance._async_five_minute_tasks(dt_util.utcnow())
+    daily_tasks = [
+        call.args[0]
+        for call in queue_task.mock_calls
+        if isinstance(call.args[0], CompileDailyStatisticsTask)
+    ]
+    assert len(daily_tasks) == 1
+    assert statistics_daily_manager.compile_pending
+
+    instance.queue_task(daily_tasks[0])
+    await async_wait_recording_done(hass)
+    assert statistics_daily_manager.active
+    assert not statistics_daily_manager.compile_pending
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
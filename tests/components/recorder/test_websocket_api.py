@@ -19,6 +19,7 @@ from homeassistant.components.recorder.statistics import (
     get_latest_short_term_statistics_with_session,
     get_metadata,
     get_short_term_statistics_run_cache,
+    get_statistics_during_period_cache,
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -1569,6 +1570,95 @@ async def test_statistics_during_period_in_the_past(
     assert response["result"] == {}
 
 
+async def test_statistics_during_period_cache(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test statistics_during_period results are cached until they change."""
+    await hass.config.async_set_time_zone("UTC")
+    now = dt_util.utcnow()
+    period1 = now.replace(minute=0, second=0, microsecond=0) - timedelta(days=2)
+    period2 = period1 + timedelta(hours=1)
+    period3 = period1 + timedelta(days=1)
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        metadata,
+        (
+            {"start": period1, "state": 0, "sum": 2},
+            {"start": period2, "state": 1, "sum": 3},
+        ),
+    )
+    await async_wait_recording_done(hass)
+    cache = get_statistics_during_period_cache(hass)
+
+    client = await hass_ws_client()
+
+    async def get_statistics(end_time: datetime.datetime) -> dict:
+        await client.send_json_auto_id(
+            {
+                "type": "recorder/statistics_during_period",
+                "start_time": period1.isoformat(),
+                "end_time": end_time.isoformat(),
+                "statistic_ids": ["test:total_energy_import"],
+                "period": "hour",
+                "types": ["change", "sum"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return response["result"]
+
+    def hour(start: datetime.datetime, change: float, sum_: float) -> dict:
+        return {
+            "start": int(start.timestamp() * 1000),
+            "end": int((start + timedelta(hours=1)).timestamp() * 1000),
+            "change": change,
+            "sum": sum_,
+        }
+
+    first_day = [hour(period1, 2, 2), hour(period2, 1, 3)]
+    assert await get_statistics(period3) == {"test:total_energy_import": first_day}
+    assert await get_statistics(period3) == {"test:total_energy_import": first_day}
+    assert await get_statistics(now) == {"test:total_energy_import": first_day}
+    assert cache.stats() == {
+        "size": 2,
+        "max_size": 256,
+        "hits": 1,
+        "misses": 2,
+        "invalidations": 0,
+    }
+
+    # Statistics imported after the first day only invalidate the results
+    # that include them
+    async_add_external_statistics(
+        hass, metadata, ({"start": period3, "state": 2, "sum": 5},)
+    )
+    await async_wait_recording_done(hass)
+    assert cache.stats()["invalidations"] == 1
+    assert await get_statistics(period3) == {"test:total_energy_import": first_day}
+    assert await get_statistics(now) == {
+        "test:total_energy_import": [*first_day, hour(period3, 2, 5)]
+    }
+    assert cache.stats()["hits"] == 2
+
+    # Adjusting the sum invalidates all results from the adjusted hour on
+    recorder_mock.async_adjust_statistics(
+        "test:total_energy_import", period2, 10, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    assert cache.stats()["size"] == 0
+    assert await get_statistics(period3) == {
+        "test:total_energy_import": [hour(period1, 2, 2), hour(period2, 11, 13)]
+    }
+
+
 async def test_statistics_during_period_bad_start_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2437,6 +2527,38 @@ async def test_recorder_info(
     }
 
 
+async def test_recorder_cache_stats(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the recorder cache stats."""
+    client = await hass_ws_client()
+
+    hass.states.async_set("sensor.test", "1", {"unit_of_measurement": "W"})
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/cache_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert set(response["result"]) == {
+        "event_data",
+        "event_types",
+        "state_attributes",
+        "states_meta",
+        "statistics_during_period",
+    }
+    states_meta = response["result"]["states_meta"]
+    assert states_meta["size"] >= 1
+    assert states_meta["max_size"] == 8192
+    assert set(states_meta) == {
+        "size",
+        "max_size",
+        "hits",
+        "misses",
+        "evictions",
+        "refetches",
+    }
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
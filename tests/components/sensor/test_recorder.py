@@ -215,6 +215,91 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_statistics_from_recent_states(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test compiling statistics from the states kept by the recorder."""
+    zero = dt_util.utcnow()
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    mean_attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    sum_attributes = {
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit_of_measurement": "kWh",
+    }
+    with freeze_time(zero) as freezer:
+        await async_record_states(hass, freezer, zero, "sensor.test1", mean_attributes)
+        await async_record_states(
+            hass, freezer, zero, "sensor.test2", sum_attributes, seq=[10, 15, 15]
+        )
+    await async_wait_recording_done(hass)
+    # The states of the first period are queried from the database
+    do_adhoc_statistics(hass, start=zero)
+    await async_wait_recording_done(hass)
+
+    period2 = zero + timedelta(minutes=5)
+    with freeze_time(period2) as freezer:
+        for offset, test1_state, test2_state in (
+            (60, "10", "20"),
+            (180, "20", "5"),
+            (240, "20", "8"),
+        ):
+            freezer.move_to(period2 + timedelta(seconds=offset))
+            hass.states.async_set(
+                "sensor.test1",
+                test1_state,
+                # The last state only changes an attribute and is not
+                # significant for the mean
+                attributes={**mean_attributes, "offset": offset},
+            )
+            hass.states.async_set("sensor.test2", test2_state, sum_attributes)
+    await async_wait_recording_done(hass)
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history:
+        do_adhoc_statistics(hass, start=period2)
+        await async_wait_recording_done(hass)
+    get_history.assert_not_called()
+
+    stats = statistics_during_period(hass, period2, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(period2).timestamp(),
+                "end": process_timestamp(period2 + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx((30 * 60 + 10 * 120 + 20 * 120) / 300),
+                "min": pytest.approx(10),
+                "max": pytest.approx(30),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ],
+        "sensor.test2": [
+            {
+                "start": process_timestamp(period2).timestamp(),
+                "end": process_timestamp(period2 + timedelta(minutes=5)).timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": pytest.approx(8),
+                "sum": pytest.approx(18),
+            }
+        ],
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
@@ -444,6 +444,106 @@ async def test_sampling_size_1(hass: HomeAssistant) -> None:
     assert state.attributes.get("buffer_usage_ratio") == round(1 / 1, 2)
 
 
+@pytest.mark.parametrize(
+    ("characteristic", "reference"),
+    [
+        ("mean", statistics.mean),
+        ("median", statistics.median),
+        ("standard_deviation", statistics.stdev),
+        ("variance", statistics.variance),
+        ("value_max", max),
+        ("value_min", min),
+        ("distance_absolute", lambda values: max(values) - min(values)),
+        ("sum", sum),
+        (
+            "sum_differences",
+            lambda values: sum(
+                abs(j - i) for i, j in zip(values, values[1:], strict=False)
+            ),
+        ),
+        (
+            "percentile",
+            lambda values: statistics.quantiles(values, n=100, method="exclusive")[49],
+        ),
+    ],
+)
+async def test_sampling_size_sliding_window(
+    hass: HomeAssistant, characteristic: str, reference: Any
+) -> None:
+    """Test characteristics stay correct while samples are evicted from the buffer."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": 4,
+                    "precision": 6,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    values = VALUES_NUMERIC * 3
+    for count, value in enumerate(values, 1):
+        hass.states.async_set(
+            "sensor.test_monitored",
+            str(value),
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+        await hass.async_block_till_done()
+        window = values[max(count - 4, 0) : count]
+        if len(window) < 2:
+            continue
+        state = hass.states.get("sensor.test")
+        assert state is not None
+        assert float(state.state) == pytest.approx(reference(window), abs=1e-5)
+
+
+async def test_sorted_characteristics_skip_nan(hass: HomeAssistant) -> None:
+    """Test NaN samples are left out of the median and percentiles."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": "median",
+                    "sampling_size": 3,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    for value, median in (
+        ("nan", STATE_UNKNOWN),
+        ("3", "3.0"),
+        ("1", "2.0"),
+        ("nan", "2.0"),
+        ("5", "3.0"),
+        ("2", "3.5"),
+        ("4", "4.0"),
+    ):
+        hass.states.async_set(
+            "sensor.test_monitored",
+            value,
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+        await hass.async_block_till_done()
+        state = hass.states.get("sensor.test")
+        assert state is not None
+        assert state.state == median
+
+
 async def test_age_limit_expiry(hass: HomeAssistant) -> None:
     """Test that values are removed with given max age."""
     now = dt_util.utcnow()
@@ -19,7 +19,7 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -1197,6 +1197,56 @@ async def test_subscribe_unsubscribe_entities(
     }
 
 
+async def test_subscribe_entities_shares_listener(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test subscribe entities of all connections share one listener."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    other_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    await other_client.send_json(
+        {"id": 8, "type": "subscribe_entities", "entity_ids": ["light.two"]}
+    )
+    for client, msg_id in ((websocket_client, 7), (other_client, 8)):
+        msg = await client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == const.TYPE_RESULT
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == "event"
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "on")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"]["c"]["light.one"]["+"]["s"] == "on"
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"]["c"]["light.two"]["+"]["s"] == "on"
+    msg = await other_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["event"]["c"]["light.two"]["+"]["s"] == "on"
+
+    for client, msg_id in ((websocket_client, 7), (other_client, 8)):
+        await client.send_json(
+            {"id": 9, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await client.receive_json()
+        assert msg["id"] == 9
+        assert msg["success"]
+
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == init_count
+
+
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2514,6 +2564,44 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_setup_timeline(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test the setup timeline is returned as Chrome trace events."""
+    trace_events = [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": 1,
+            "args": {"name": "august"},
+        },
+        {
+            "name": "setup",
+            "cat": "setup",
+            "ph": "X",
+            "ts": 0,
+            "dur": 12500000,
+            "pid": 1,
+            "tid": 1,
+        },
+    ]
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_setup_trace_events",
+        return_value=trace_events,
+    ):
+        await websocket_client.send_json_auto_id(
+            {"type": "integration/setup_timeline"}
+        )
+        msg = await websocket_client.receive_json()
+
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -3,7 +3,7 @@
 import asyncio
 from datetime import timedelta
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -505,3 +505,110 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_coalesce_pending_entity_changes(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test pending state changes of an entity are merged instead of piling up."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    hass.states.async_set("light.kitchen", "off", {"brightness": 0})
+    await websocket_client.send_json({"id": 1, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.kitchen"]["s"] == "off"
+
+    # The client falls behind while the changes are queued, only the
+    # latest state is sent as a whole
+    with (
+        patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 2),
+        patch("homeassistant.components.websocket_api.http.PENDING_MSG_COALESCE", 0),
+    ):
+        for brightness in range(1, 11):
+            hass.states.async_set("light.kitchen", "on", {"brightness": brightness})
+        for idx in range(10):
+            hass.states.async_set(f"light.other_{idx}", "on")
+        await hass.async_block_till_done()
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["event"] == {
+        "a": {
+            "light.kitchen": {
+                "s": "on",
+                "a": {"brightness": 10},
+                "c": ANY,
+                "lc": ANY,
+                "lu": ANY,
+            }
+        }
+    }
+    for _ in range(10):
+        msg = await websocket_client.receive_json()
+        assert "light.other_" in next(iter(msg["event"]["a"]))
+
+    assert instance.metrics.messages_coalesced == 9
+    assert instance._connection
+    assert instance._connection.outbound_metrics is instance.metrics
+    assert instance.metrics.peak_queue_depth == 11
+    assert "Client unable to keep up with pending messages" not in caplog.text
+
+    # Once written, the next change is sent as a diff again
+    hass.states.async_set("light.kitchen", "on", {"brightness": 11})
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.kitchen"]["+"]["a"] == {"brightness": 11}
+    assert instance.metrics.bytes_written > 0
+
+
+async def test_wait_drained(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test waiting for the queued messages to be written to the client."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    connection = cast(ActiveConnection, instance._connection)
+
+    # Nothing is queued
+    await connection.async_wait_drained()
+
+    for idx in range(5):
+        connection.send_message({"id": idx, "type": "result", "success": True})
+    assert instance._message_queue
+    await connection.async_wait_drained()
+    assert not instance._message_queue
+    assert not instance._drain_waiters
+
+    for idx in range(5):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == idx
@@ -3055,6 +3055,65 @@ async def test_string(hass: HomeAssistant) -> None:
     assert refresh_runs == ["no_template"]
 
 
+async def test_track_template_result_read_fields(hass: HomeAssistant) -> None:
+    """Test tracking template only re-renders when a field it read changes."""
+    hass.states.async_set(
+        "media_player.tv", "playing", {"media_title": "Intro", "media_position": 0}
+    )
+    hass.states.async_set("sensor.power", "100", {"current": 0.4})
+    template_fields = Template(
+        "{{ state_attr('media_player.tv', 'media_title') }}"
+        " {{ states('sensor.power') }}",
+        hass,
+    )
+
+    runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_fields, None)], refresh_listener
+    )
+    await hass.async_block_till_done()
+    assert info.listeners["entities"] == {"media_player.tv", "sensor.power"}
+
+    with patch.object(
+        Template, "async_render_to_info", wraps=template_fields.async_render_to_info
+    ) as mock_render:
+        for position in range(1, 10):
+            hass.states.async_set(
+                "media_player.tv",
+                "playing",
+                {"media_title": "Intro", "media_position": position},
+            )
+            hass.states.async_set("sensor.power", "100", {"current": position})
+        hass.states.async_set(
+            "media_player.tv", "paused", {"media_title": "Intro", "media_position": 9}
+        )
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 0
+        assert runs == []
+
+        hass.states.async_set(
+            "media_player.tv", "paused", {"media_title": "Outro", "media_position": 9}
+        )
+        hass.states.async_set("sensor.power", "120", {"current": 0.5})
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 2
+        assert runs == ["Outro 100", "Outro 120"]
+
+        # Removing the entity always re-renders
+        hass.states.async_remove("sensor.power")
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 3
+        assert runs == ["Outro 100", "Outro 120", "Outro unknown"]
+
+
 async def test_track_template_result_refresh_cancel(hass: HomeAssistant) -> None:
     """Test cancelling and refreshing result."""
     template_refresh = Template("{{states.switch.test.state == 'on' and now() }}", hass)
@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -1180,3 +1181,191 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal_appends_changes(tmpdir: py.path.local) -> None:
+    """Test a journaled store appends changes and loads them back."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": str(idx), "name": "x" * 50} for idx in range(20)]
+        await store.async_save({"items": items, "other": 1})
+
+        snapshot = await hass.async_add_executor_job(Path(store.path).read_bytes)
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        assert not await hass.async_add_executor_job(journal_path.exists)
+
+        items[3] = {"id": "3", "name": "renamed"}
+        await store.async_save({"items": items, "other": 1})
+        del items[10]
+        await store.async_save({"items": items, "other": 2})
+
+        # The snapshot is untouched and the journal only has the changes
+        assert (
+            await hass.async_add_executor_job(Path(store.path).read_bytes) == snapshot
+        )
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        lines = journal.splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[1]) == [
+            ["splice", "items", 3, 1, [{"id": "3", "name": "renamed"}]]
+        ]
+        assert json.loads(lines[2]) == [
+            ["splice", "items", 10, 1, []],
+            ["set", "other", 2],
+        ]
+
+        # Saving unchanged data does not write anything
+        await store.async_save({"items": items, "other": 2})
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        assert len(journal.splitlines()) == 3
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {"items": items, "other": 2}
+
+        await store2.async_remove()
+        assert not await hass.async_add_executor_job(journal_path.exists)
+        await hass.async_stop(force=True)
+
+
+async def test_journal_appends_after_load(tmpdir: py.path.local) -> None:
+    """Test a loaded journaled store appends to the existing journal."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": str(idx), "name": "x" * 50} for idx in range(20)]
+        await store.async_save({"items": items})
+        snapshot = await hass.async_add_executor_job(Path(store.path).read_bytes)
+        items[0] = {"id": "0", "name": "first"}
+        await store.async_save({"items": items})
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {"items": items}
+        items[1] = {"id": "1", "name": "second"}
+        await store2.async_save({"items": items})
+
+        assert (
+            await hass.async_add_executor_job(Path(store.path).read_bytes) == snapshot
+        )
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        lines = journal.splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[2]) == [
+            ["splice", "items", 1, 1, [{"id": "1", "name": "second"}]]
+        ]
+
+        store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store3.async_load() == {"items": items}
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is folded into the snapshot when stopping."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": str(idx), "name": "x" * 50} for idx in range(20)]
+        await store.async_save({"items": items})
+        items[0] = {"id": "0", "name": "first"}
+        await store.async_save({"items": items})
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        assert await hass.async_add_executor_job(journal_path.exists)
+
+        await hass.async_stop(force=True)
+
+    assert not await loop.run_in_executor(None, journal_path.exists)
+    snapshot = await loop.run_in_executor(None, Path(store.path).read_bytes)
+    assert json.loads(snapshot)["data"] == {"items": items}
+
+
+async def test_journal_ignores_incomplete_entry(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an entry torn by an interrupted write is ignored on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": str(idx), "name": "x" * 50} for idx in range(20)]
+        await store.async_save({"items": items})
+        items[0] = {"id": "0", "name": "first"}
+        await store.async_save({"items": items})
+        expected = {"items": list(items)}
+        items[1] = {"id": "1", "name": "second"}
+        await store.async_save({"items": items})
+
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        await hass.async_add_executor_job(journal_path.write_bytes, journal[:-10])
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == expected
+        assert "Ignoring incomplete journal entry" in caplog.text
+        await hass.async_stop(force=True)
+
+
+async def test_journal_ignores_stale_generation(tmpdir: py.path.local) -> None:
+    """Test a journal left behind by an interrupted compaction is ignored."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": str(idx), "name": "x" * 50} for idx in range(20)]
+        await store.async_save({"items": items})
+        snapshot = await hass.async_add_executor_job(Path(store.path).read_bytes)
+        await store.async_save({"items": items[1:]})
+
+        # Simulate the snapshot being rewritten without removing the journal
+        data = json.loads(snapshot)
+        data["journal_generation"] = "new"
+        await hass.async_add_executor_job(
+            Path(store.path).write_text, json.dumps(data)
+        )
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {"items": items}
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the snapshot is rewritten when the journal outgrows it."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": str(idx), "name": "x" * 50} for idx in range(10)]
+        await store.async_save({"items": items})
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+
+        for idx in range(30):
+            items[idx % 10] = {"id": str(idx % 10), "name": f"renamed {idx}"}
+            await store.async_save({"items": items})
+
+        snapshot_size = await hass.async_add_executor_job(os.path.getsize, store.path)
+        if await hass.async_add_executor_job(journal_path.exists):
+            assert (
+                await hass.async_add_executor_job(os.path.getsize, journal_path)
+                <= snapshot_size
+            )
+        snapshot = await hass.async_add_executor_job(Path(store.path).read_bytes)
+        data = json.loads(snapshot)
+        assert data["data"]["items"][0]["name"] != "x" * 50
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {"items": items}
+
+        # A version change always writes a new snapshot
+        items[0] = {"id": "0", "name": "migrated"}
+        await store.async_save({"items": items})
+        store3 = storage.Store(hass, MOCK_VERSION_2, MOCK_KEY, journal=True)
+        with patch.object(store3, "_async_migrate_func", return_value={"items": items}):
+            assert await store3.async_load() == {"items": items}
+        assert not await hass.async_add_executor_job(journal_path.exists)
+        snapshot = await hass.async_add_executor_job(Path(store.path).read_bytes)
+        data = json.loads(snapshot)
+        assert data["version"] == MOCK_VERSION_2
+        assert data["data"] == {"items": items}
+        await hass.async_stop(force=True)
@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 import voluptuous as vol
@@ -5169,6 +5170,33 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_code_cache(hass: HomeAssistant) -> None:
+    """Test compiled code is reused after the templates are gone."""
+    template_string = "{{ states('sensor.compiled_code_cache') | area_id }}"
+    template.COMPILED_TEMPLATE_CODE_LRU.clear()
+
+    with patch.object(
+        jinja2.Environment,
+        "compile",
+        autospec=True,
+        side_effect=jinja2.Environment.compile,
+    ) as mock_compile:
+        tpl = template.Template(template_string, hass)
+        assert tpl.async_render() is None
+        assert mock_compile.call_count == 1
+        del tpl
+
+        tpl = template.Template(template_string, hass)
+        assert tpl.async_render() is None
+        assert mock_compile.call_count == 1
+
+        # The area_id filter is not available without hass
+        tpl = template.Template(template_string)
+        with pytest.raises(TemplateError):
+            tpl.ensure_valid()
+        assert mock_compile.call_count == 2
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -5604,6 +5632,36 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_entity_fields(hass: HomeAssistant) -> None:
+    """Test the fields read from the states are recorded."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("sensor.power", "100")
+    hass.states.async_set("sensor.energy", "1")
+    info = render_to_info(
+        hass,
+        "{{ state_attr('light.kitchen', 'brightness') }}"
+        "{{ states.light.kitchen.name }}"
+        "{{ states('sensor.power') }}"
+        "{{ states.sensor.energy == states.sensor.power }}",
+    )
+    assert info.entity_fields == {
+        "light.kitchen": {"attributes.brightness", "attributes.friendly_name"},
+    }
+    assert info.entities == {"light.kitchen", "sensor.power", "sensor.energy"}
+
+    old_state = hass.states.get("light.kitchen")
+    hass.states.async_set("light.kitchen", "off", {"brightness": 100})
+    new_state = hass.states.get("light.kitchen")
+    assert not info.read_fields_changed("light.kitchen", old_state, new_state)
+    hass.states.async_set("light.kitchen", "off", {"brightness": 50})
+    assert info.read_fields_changed(
+        "light.kitchen", new_state, hass.states.get("light.kitchen")
+    )
+
+    info = render_to_info(hass, "{{ states.sensor | map(attribute='state') | list }}")
+    assert info.read_fields_changed("sensor.power", new_state, new_state)
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
@@ -4,8 +4,10 @@ import asyncio
 from collections import OrderedDict
 import contextlib
 import copy
+from datetime import timedelta
 import logging
 import os
+from pathlib import Path
 from typing import Any
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
@@ -46,6 +48,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration, async_get_integration
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import (
     METRIC_SYSTEM,
     US_CUSTOMARY_SYSTEM,
@@ -58,6 +61,7 @@ from .common import (
     MockModule,
     MockPlatform,
     MockUser,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_integration,
     mock_platform,
@@ -1094,6 +1098,62 @@ async def test_async_hass_config_yaml_merge(
     assert len(conf["light"]) == 1
 
 
+async def test_async_hass_config_yaml_file_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: Path
+) -> None:
+    """Test the configuration files are only parsed again when they change."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / config_util.YAML_CONFIG_FILE).write_text(
+        "light: !include light.yaml\nswitch: !include switch.yaml\n"
+    )
+    (tmp_path / "light.yaml").write_text("- platform: demo\n")
+    (tmp_path / "switch.yaml").write_text("- platform: demo\n")
+
+    conf = await config_util.async_hass_config_yaml(hass)
+    assert conf == {"light": [{"platform": "demo"}], "switch": [{"platform": "demo"}]}
+    yaml_cache = await config_util.async_get_yaml_file_cache(hass)
+    assert (yaml_cache.hits, yaml_cache.misses) == (0, 3)
+
+    conf["light"].clear()
+    conf = await config_util.async_hass_config_yaml(hass)
+    assert conf["light"] == [{"platform": "demo"}]
+    assert (yaml_cache.hits, yaml_cache.misses) == (1, 3)
+
+    (tmp_path / "light.yaml").write_text("- platform: template\n")
+    conf = await config_util.async_hass_config_yaml(hass)
+    assert conf["light"] == [{"platform": "template"}]
+    assert (yaml_cache.hits, yaml_cache.misses) == (2, 5)
+
+    # The cache is stored and used after a restart
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=config_util.YAML_FILE_CACHE_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[config_util.YAML_FILE_CACHE_STORAGE_KEY]["data"]
+    assert stored["version"] == __version__
+    assert len(stored["files"]) == 3
+    hass.data.pop(config_util.DATA_YAML_FILE_CACHE)
+    hass.data.pop(config_util.DATA_YAML_FILE_CACHE_STORE)
+
+    (tmp_path / "switch.yaml").write_text("- platform: template\n")
+    conf = await config_util.async_hass_config_yaml(hass)
+    assert conf == {
+        "light": [{"platform": "template"}],
+        "switch": [{"platform": "template"}],
+    }
+    yaml_cache = await config_util.async_get_yaml_file_cache(hass)
+    assert (yaml_cache.hits, yaml_cache.misses) == (1, 2)
+
+    # The files are parsed again after an update
+    hass.data.pop(config_util.DATA_YAML_FILE_CACHE)
+    hass.data.pop(config_util.DATA_YAML_FILE_CACHE_STORE)
+    hass_storage[config_util.YAML_FILE_CACHE_STORAGE_KEY]["data"]["version"] = "0.1"
+    await config_util.async_hass_config_yaml(hass)
+    yaml_cache = await config_util.async_get_yaml_file_cache(hass)
+    assert (yaml_cache.hits, yaml_cache.misses) == (0, 3)
+
+
 @pytest.fixture
 def merge_log_err() -> Generator[MagicMock]:
     """Patch _merge_log_error from packages."""
@@ -63,6 +63,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -1160,6 +1161,65 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_listener_added_while_dispatching(
+    hass: HomeAssistant,
+) -> None:
+    """Test listeners added or removed while an event fires run from the next event."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append("listener")
+        unsub()
+        hass.bus.async_listen(MATCH_ALL, match_all_listener)
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock listener."""
+        calls.append("match_all")
+
+    unsub = hass.bus.async_listen("test", listener)
+
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert calls == ["listener", "match_all"]
+
+
+async def test_eventbus_dispatch_not_cached_without_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """Test firing event types without listeners does not grow the dispatch cache."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    for idx in range(10):
+        hass.bus.async_fire(f"test_no_listeners_{idx}")
+    assert not any(
+        str(event_type).startswith("test_no_listeners_")
+        for event_type in hass.bus._dispatch
+    )
+
+    unsub = hass.bus.async_listen("test_no_listeners_0", listener)
+    hass.bus.async_fire("test_no_listeners_0")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert "test_no_listeners_0" in hass.bus._dispatch
+
+    unsub()
+    assert "test_no_listeners_0" not in hass.bus._dispatch
+    hass.bus.async_fire("test_no_listeners_0")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert "test_no_listeners_0" not in hass.bus._dispatch
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1435,6 +1495,62 @@ def test_state_repr() -> None:
     )
 
 
+def test_compact_state() -> None:
+    """Test compact states match the state they were created from."""
+    last_changed = datetime(1984, 12, 8, 12, 0, 0, 123456, tzinfo=dt_util.UTC)
+    last_updated = datetime(1984, 12, 8, 12, 5, 0, tzinfo=dt_util.UTC)
+    state = ha.State(
+        "light.kitchen",
+        "on",
+        {"brightness": 144, "effect_list": ["rainbow"]},
+        last_changed=last_changed,
+        last_updated=last_updated,
+        last_reported=last_updated,
+        context=ha.Context(id="123", user_id="456"),
+    )
+
+    for compact_state in (
+        ha.CompactState.from_state(state),
+        ha.CompactState.from_dict(json_loads(state.as_dict_json)),
+    ):
+        assert isinstance(compact_state, ha.State)
+        assert "last_changed" not in compact_state.__dict__
+        assert compact_state.last_changed == last_changed
+        assert compact_state.last_updated == last_updated
+        assert compact_state.last_reported == last_updated
+        assert compact_state.domain == "light"
+        assert compact_state.object_id == "kitchen"
+        assert compact_state.as_dict() == state.as_dict()
+        assert compact_state.as_dict_json == state.as_dict_json
+        assert compact_state.as_compressed_state == state.as_compressed_state
+        assert str(compact_state) == str(state)
+
+    assert ha.CompactState.from_dict({"entity_id": "light.kitchen"}) is None
+    with pytest.raises(InvalidEntityFormatError):
+        ha.CompactState.from_dict({"entity_id": "invalid", "state": "on"})
+
+
+def test_compact_state_shares_attributes() -> None:
+    """Test compact states share identical hashable attributes."""
+    attributes_cache = {}
+
+    def compact_state(attributes: dict[str, Any]) -> ha.CompactState:
+        return ha.CompactState.from_dict(
+            {"entity_id": "light.kitchen", "state": "on", "attributes": attributes},
+            attributes_cache,
+        )
+
+    shared = compact_state({"brightness": 1})
+    assert compact_state({"brightness": 1}).attributes is shared.attributes
+    assert compact_state({"brightness": True}).attributes == {"brightness": True}
+    assert compact_state({"brightness": 1.0}).attributes is not shared.attributes
+    unhashable = compact_state({"effect_list": ["rainbow"]})
+    assert unhashable.attributes == {"effect_list": ["rainbow"]}
+    assert compact_state({"effect_list": ["rainbow"]}).attributes is not (
+        unhashable.attributes
+    )
+
+
 async def test_statemachine_is_state(hass: HomeAssistant) -> None:
     """Test is_state method."""
     hass.states.async_set("light.bowl", "on", {})
@@ -1535,6 +1651,74 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting many states at once."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "on")
+    changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported_events: list[ha.Event] = []
+
+    @ha.callback
+    def report_filter(event_data):
+        """Mock filter."""
+        return True
+
+    @ha.callback
+    def report_listener(event: ha.Event) -> None:
+        """Mock listener."""
+        if event.event_type == EVENT_STATE_REPORTED:
+            reported_events.append(event)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, report_listener, event_filter=report_filter
+    )
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "off", {"brightness": 100}),
+            ("light.kitchen", "on", None),
+            ("switch.new", 5, None),
+            ("switch.new", "6", {"power": 1}),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert [
+        (event.data["entity_id"], event.data["new_state"].state)
+        for event in changed_events
+    ] == [("light.bowl", "off"), ("switch.new", "5"), ("switch.new", "6")]
+    assert changed_events[2].data["old_state"].state == "5"
+    assert len(reported_events) == 1
+    assert reported_events[0].data["entity_id"] == "light.kitchen"
+
+    bowl = hass.states.get("light.bowl")
+    assert bowl.attributes == {"brightness": 100}
+    new_state = hass.states.get("switch.new")
+    assert new_state.attributes == {"power": 1}
+    assert new_state.last_updated == bowl.last_updated
+    assert new_state.context is bowl.context
+    events = [*changed_events, *reported_events]
+    assert len({event.time_fired_timestamp for event in events}) == 1
+    assert all(event.context is bowl.context for event in events)
+
+    context = ha.Context()
+    hass.states.async_set_many([("light.bowl", "on", None)], context=context)
+    assert hass.states.get("light.bowl").context is context
+
+    changed_events.clear()
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [("light.bowl", "off", None), ("invalid_entity_format", "on", None)]
+        )
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [("light.bowl", "off", None), ("light.kitchen", "x" * 256, None)]
+        )
+    await hass.async_block_till_done()
+    assert hass.states.get("light.bowl").state == "on"
+    assert len(changed_events) == 0
+
+
 async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> None:
     """Test async_set avoids recreating ReadOnly dicts when possible."""
     attrs = {"some_attr": "attr_value"}
@@ -14,6 +14,7 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
@@ -1987,3 +1988,79 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def _async_resolve_webhook_with_manifest_cache(
+    hass: HomeAssistant,
+) -> loader.Integration:
+    """Resolve webhook and its dependencies as on startup."""
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+    await loader.async_load_manifest_cache(hass)
+    integration = await loader.async_get_integration(hass, "webhook")
+    assert await integration.resolve_dependencies()
+    return integration
+
+
+async def test_manifest_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test manifests and dependencies are loaded from the manifest cache."""
+    integration = await _async_resolve_webhook_with_manifest_cache(hass)
+    manifest = integration.manifest
+    loader.async_save_manifest_cache(hass)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    cached = data["integrations"]["homeassistant.components.webhook"]
+    assert cached["manifest"] == manifest
+    assert cached["all_dependencies"] == ["http"]
+    assert data["integrations"]["homeassistant.components.http"][
+        "all_dependencies"
+    ] == []
+
+    with (
+        patch.object(loader, "json_loads") as mock_json_loads,
+        patch.object(loader, "_async_component_dependencies") as mock_dependencies,
+    ):
+        integration = await _async_resolve_webhook_with_manifest_cache(hass)
+
+    assert not mock_json_loads.called
+    assert not mock_dependencies.called
+    assert integration.manifest == manifest
+    assert integration.all_dependencies == {"http"}
+    assert hass.data[loader.DATA_MANIFEST_CACHE].hits >= 2
+
+
+async def test_manifest_cache_changed_manifest(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test a changed manifest is read again and dependencies are resolved again."""
+    await _async_resolve_webhook_with_manifest_cache(hass)
+    loader.async_save_manifest_cache(hass)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    stat_integration = loader._stat_integration
+
+    def changed_http(file_path: pathlib.Path) -> list[int] | None:
+        if file_path.name == "http":
+            return [0, 0, 0]
+        return stat_integration(file_path)
+
+    with (
+        patch.object(loader, "_stat_integration", changed_http),
+        patch.object(
+            loader,
+            "_async_component_dependencies",
+            wraps=loader._async_component_dependencies,
+        ) as mock_dependencies,
+    ):
+        integration = await _async_resolve_webhook_with_manifest_cache(hass)
+
+    manifest_cache = hass.data[loader.DATA_MANIFEST_CACHE]
+    assert not manifest_cache.dependencies_valid
+    assert manifest_cache.misses >= 1
+    assert mock_dependencies.called
+    assert integration.all_dependencies == {"http"}
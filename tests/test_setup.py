@@ -1209,3 +1209,89 @@ async def test_async_prepare_setup_platform(
         await setup.async_prepare_setup_platform(hass, {}, "button", "test") is None
     )
     assert button_platform is not None
+
+
+async def test_async_get_setup_trace_events(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the setup timeline is returned as Chrome trace events."""
+    hass.set_state(CoreState.not_running)
+    hass.data.pop(setup.DATA_SETUP_TIMELINE, None)
+
+    with setup.async_record_setup_phase(
+        hass, integration="august", phase=setup.SetupPhases.IMPORT
+    ):
+        freezer.tick(5)
+    with setup.async_start_setup(
+        hass, integration="august", phase=setup.SetupPhases.SETUP
+    ):
+        freezer.tick(10)
+    with setup.async_start_setup(
+        hass,
+        integration="august",
+        group="entry_id",
+        phase=setup.SetupPhases.CONFIG_ENTRY_SETUP,
+    ):
+        with setup.async_pause_setup(hass, setup.SetupPhases.WAIT_IMPORT_PLATFORMS):
+            freezer.tick(100)
+        freezer.tick(20)
+
+    # Phases are not recorded once started
+    hass.set_state(CoreState.running)
+    with setup.async_record_setup_phase(
+        hass, integration="august", phase=setup.SetupPhases.IMPORT
+    ):
+        freezer.tick(5)
+
+    assert setup.async_get_setup_trace_events(hass) == [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": 1,
+            "args": {"name": "august"},
+        },
+        {
+            "name": "import",
+            "cat": "setup",
+            "ph": "X",
+            "ts": 0,
+            "dur": 5000000,
+            "pid": 1,
+            "tid": 1,
+        },
+        {
+            "name": "setup",
+            "cat": "setup",
+            "ph": "X",
+            "ts": 5000000,
+            "dur": 10000000,
+            "pid": 1,
+            "tid": 1,
+        },
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": 2,
+            "args": {"name": "august (entry_id)"},
+        },
+        {
+            "name": "wait_import_platforms",
+            "cat": "wait",
+            "ph": "X",
+            "ts": 15000000,
+            "dur": 100000000,
+            "pid": 1,
+            "tid": 2,
+        },
+        {
+            "name": "config_entry_setup",
+            "cat": "setup",
+            "ph": "X",
+            "ts": 15000000,
+            "dur": 120000000,
+            "pid": 1,
+            "tid": 2,
+        },
+    ]
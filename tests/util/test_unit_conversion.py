@@ -763,3 +763,80 @@ def test_temperature_convert_with_interval(
     """Test conversion to other units."""
     expected = pytest.approx(expected)
     assert TemperatureConverter.convert_interval(value, from_unit, to_unit) == expected
+
+
+@pytest.mark.parametrize(
+    ("converter", "from_unit", "to_unit"),
+    [
+        # Ensure all pairs of units are tested
+        (converter, from_unit, to_unit)
+        for converter, valid_units in _ALL_CONVERTERS.items()
+        for from_unit in valid_units
+        for to_unit in valid_units
+    ],
+)
+def test_unit_conversion_factory_many(
+    converter: type[BaseUnitConverter], from_unit: str, to_unit: str
+) -> None:
+    """Test converting many values matches converting one value at a time."""
+    values = [0, 1.5, None, 10, 123.456]
+    convert = converter.converter_factory_allow_none(from_unit, to_unit)
+    assert converter.converter_factory_many(from_unit, to_unit)(values) == [
+        convert(value) for value in values
+    ]
+
+
+@pytest.mark.parametrize(
+    ("converter", "from_unit", "to_unit", "expected"),
+    [
+        (
+            EnergyConverter,
+            UnitOfEnergy.KILO_WATT_HOUR,
+            UnitOfEnergy.MEGA_WATT_HOUR,
+            (0, 1, 0.001, 0),
+        ),
+        (
+            TemperatureConverter,
+            UnitOfTemperature.CELSIUS,
+            UnitOfTemperature.FAHRENHEIT,
+            (0, 1, 1.8, 32.0),
+        ),
+        (
+            TemperatureConverter,
+            UnitOfTemperature.FAHRENHEIT,
+            UnitOfTemperature.KELVIN,
+            (-32.0, 1.8, 1, 273.15),
+        ),
+        (
+            TemperatureConverter,
+            UnitOfTemperature.CELSIUS,
+            UnitOfTemperature.CELSIUS,
+            (0, 1, 1, 0),
+        ),
+        (SpeedConverter, UnitOfSpeed.METERS_PER_SECOND, UnitOfSpeed.BEAUFORT, None),
+        (SpeedConverter, UnitOfSpeed.BEAUFORT, UnitOfSpeed.KNOTS, None),
+    ],
+)
+def test_get_linear_conversion(
+    converter: type[BaseUnitConverter],
+    from_unit: str,
+    to_unit: str,
+    expected: tuple[float, float, float, float] | None,
+) -> None:
+    """Test the offsets and ratios of linear conversions."""
+    assert converter.get_linear_conversion(from_unit, to_unit) == expected
+
+
+@pytest.mark.parametrize(
+    "converter", [EnergyConverter, SpeedConverter, TemperatureConverter]
+)
+def test_unit_conversion_factory_many_invalid_unit(
+    converter: type[BaseUnitConverter],
+) -> None:
+    """Test exception is thrown for invalid units."""
+    valid_unit = next(iter(converter.VALID_UNITS))
+    with pytest.raises(HomeAssistantError, match="is not a recognized .* unit"):
+        converter.converter_factory_many(INVALID_SYMBOL, valid_unit)
+
+    with pytest.raises(HomeAssistantError, match="is not a recognized .* unit"):
+        converter.converter_factory_many(valid_unit, INVALID_SYMBOL)
@@ -2,6 +2,7 @@
 
 import importlib
 import io
+import json
 import os
 import pathlib
 from typing import Any
@@ -384,6 +385,100 @@ def test_load_yaml_encoding_error(mock_open: Mock) -> None:
         yaml_loader.load_yaml("test")
 
 
+@pytest.mark.usefixtures("try_both_loaders")
+def test_yaml_file_cache(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the YAML file cache only parses the files that changed."""
+    (tmp_path / "secrets.yaml").write_text("password: pwhunter2\n")
+    config_path = tmp_path / "configuration.yaml"
+    config_path.write_text(
+        "password: !secret password\n"
+        "env: !env_var YAML_CACHE_TEST default\n"
+        "sensor: !include sensor.yaml\n"
+        "automation: !include_dir_merge_list automations\n"
+    )
+    (tmp_path / "sensor.yaml").write_text("- platform: template\n")
+    automations_path = tmp_path / "automations"
+    automations_path.mkdir()
+    (automations_path / "one.yaml").write_text("- alias: one\n")
+
+    yaml_cache = yaml_loader.YamlFileCache()
+    expected = yaml_loader.load_yaml_dict(config_path, yaml_loader.Secrets(tmp_path))
+    loaded = yaml_loader.load_yaml_dict(
+        config_path, yaml_loader.Secrets(tmp_path), yaml_cache
+    )
+    assert loaded == expected
+    assert loaded["sensor"].__config_file__ == expected["sensor"].__config_file__
+    assert loaded["sensor"].__line__ == expected["sensor"].__line__
+    assert (yaml_cache.hits, yaml_cache.misses) == (0, 3)
+
+    # The content is copied as it may be modified after loading
+    loaded_again = yaml_loader.load_yaml_dict(
+        config_path, yaml_loader.Secrets(tmp_path), yaml_cache
+    )
+    assert loaded_again == expected
+    assert loaded_again["sensor"] is not loaded["sensor"]
+    assert (yaml_cache.hits, yaml_cache.misses) == (1, 3)
+
+    # Only the changed file and the files including it are parsed again
+    (automations_path / "one.yaml").write_text("- alias: changed\n")
+    loaded = yaml_loader.load_yaml_dict(
+        config_path, yaml_loader.Secrets(tmp_path), yaml_cache
+    )
+    assert loaded["automation"] == [{"alias": "changed"}]
+    assert (yaml_cache.hits, yaml_cache.misses) == (2, 5)
+
+    # New files in included directories are found
+    (automations_path / "two.yaml").write_text("- alias: two\n")
+    loaded = yaml_loader.load_yaml_dict(
+        config_path, yaml_loader.Secrets(tmp_path), yaml_cache
+    )
+    assert loaded["automation"] == [{"alias": "changed"}, {"alias": "two"}]
+    assert (yaml_cache.hits, yaml_cache.misses) == (4, 7)
+
+    # Secrets and environment variables are resolved on every load
+    (tmp_path / "secrets.yaml").write_text("password: new_password\n")
+    monkeypatch.setenv("YAML_CACHE_TEST", "from_env")
+    loaded = yaml_loader.load_yaml_dict(
+        config_path, yaml_loader.Secrets(tmp_path), yaml_cache
+    )
+    assert loaded["password"] == "new_password"
+    assert loaded["env"] == "from_env"
+    assert (yaml_cache.hits, yaml_cache.misses) == (5, 7)
+
+    with pytest.raises(HomeAssistantError, match="Secrets not supported"):
+        yaml_loader.load_yaml_dict(config_path, None, yaml_cache)
+
+    # The stored cache is restored without parsing the files again
+    (automations_path / "two.yaml").write_text("- alias: two\n  when: !input when\n")
+    loaded = yaml_loader.load_yaml_dict(
+        config_path, yaml_loader.Secrets(tmp_path), yaml_cache
+    )
+    assert yaml_cache.changed
+    stored = json.loads(json.dumps(yaml_cache.as_dict()))
+    assert not yaml_cache.changed
+    restored_cache = yaml_loader.YamlFileCache(stored)
+    restored = yaml_loader.load_yaml_dict(
+        config_path, yaml_loader.Secrets(tmp_path), restored_cache
+    )
+    assert restored == loaded
+    assert restored["automation"][1]["when"] == yaml_loader.Input("when")
+    assert restored["sensor"].__config_file__ == loaded["sensor"].__config_file__
+    assert restored["sensor"].__line__ == loaded["sensor"].__line__
+    assert (restored_cache.hits, restored_cache.misses) == (1, 0)
+    # A file restored by another thread is not restored again
+    assert restored_cache._restore(str(config_path)) is None
+
+    # Files which can not be stored are parsed again
+    (tmp_path / "sensor.yaml").write_text("- platform: template\n  at: 2024-01-01\n")
+    yaml_loader.load_yaml_dict(config_path, yaml_loader.Secrets(tmp_path), yaml_cache)
+    stored = yaml_cache.as_dict()
+    assert str(config_path) not in stored
+    assert str(tmp_path / "sensor.yaml") not in stored
+    assert str(automations_path / "one.yaml") in stored
+
+
 @pytest.mark.usefixtures("try_both_dumpers")
 def test_dump() -> None:
     """The that the dump method returns empty None values."""